@@ -0,0 +1,146 @@
+import json
+
+import click
+import frappe
+from frappe.commands import get_site, pass_context
+
+
+def parse_engine_flags(flags):
+	"""Parse repeated `--flag key=value` options into suggest_cartons keyword arguments"""
+	engine_flags = {}
+	for flag in flags:
+		key, _, value = flag.partition("=")
+		try:
+			engine_flags[key.strip()] = json.loads(value) if value else True
+		except ValueError:
+			engine_flags[key.strip()] = value
+	return engine_flags
+
+
+@click.command("replay-packing")
+@click.option("--strategy", "strategies", multiple=True, help="Packing strategy, repeat to compare several")
+@click.option("--pick-list", "pick_lists", multiple=True, help="Only replay these Pick Lists")
+@click.option("--limit", type=int, help="Replay the N most recent Pick Lists")
+@click.option("--no-3d", is_flag=True, default=False, help="Capacity-only packing (enable_3d=False)")
+@click.option("--flag", "flags", multiple=True,
+	help="Extra engine flag passed to suggest_cartons, as key=value (e.g. verify_layouts=true)")
+@click.option("--workers", type=int, default=1, help="Number of worker processes")
+@click.option("--output", help="Write per-pick-list results as JSON lines to this file")
+@click.option("--fixture", help="Replay an offline fixture instead of reading the site")
+@click.option("--dump-fixture", help="Write the loaded corpus to this fixture file and exit")
+@click.option("--no-anonymize", is_flag=True, default=False, help="Keep real names in --dump-fixture")
+@pass_context
+def replay_packing(context, strategies, pick_lists, limit, no_3d, flags, workers, output,
+	fixture, dump_fixture, no_anonymize):
+	"""Replay stored Pick Lists through the packing engine for profiling"""
+	from import_export.packing_system import replay
+
+	if fixture:
+		corpus = replay.load_fixture(fixture)
+	else:
+		site = get_site(context)
+		frappe.init(site=site)
+		frappe.connect()
+		try:
+			corpus = replay.load_corpus(list(pick_lists), limit)
+		finally:
+			frappe.destroy()
+
+	if dump_fixture:
+		replay.dump_fixture(corpus, dump_fixture, anonymize=not no_anonymize)
+		click.echo(f"Wrote {len(corpus['profiles'])} profiles to {dump_fixture}")
+		return
+
+	engine_flags = parse_engine_flags(flags)
+	engine_flags["enable_3d"] = not no_3d
+
+	rows = replay.replay_corpus(corpus, list(strategies) or ["minimize_cartons"], engine_flags, workers)
+
+	if output:
+		with open(output, "w") as f:
+			for row in rows:
+				f.write(json.dumps(row, default=str) + "\n")
+
+	for strategy, totals in replay.summarize(rows).items():
+		click.echo(
+			f"{strategy}: {totals['pick_lists']} pick lists, {totals['errors']} errors, "
+			f"{totals['elapsed_ms']:.1f} ms, {totals['total_cartons']} cartons "
+			f"({totals['carton_delta']:+g} vs stored), cost {totals['cost_delta']:+.2f} vs stored, "
+			f"{totals['changed']} changed"
+			+ (f", {totals['layout_violations']} invalid layouts" if totals["layout_violations"] else "")
+		)
+
+
+@click.command("recommend-cartons")
+@click.option("--strategy", default="minimize_cost", help="Packing strategy used to cost each catalog")
+@click.option("--limit", type=int, help="Mine the N most recent Pick Lists")
+@click.option("--fixture", help="Use an offline fixture (see replay-packing --dump-fixture) instead of the site")
+@click.option("--carton-weight", type=float, default=0.0, help="Extra cost charged per carton in the objective")
+@click.option("--max-candidates", type=int, default=40, help="Number of generated carton sizes to consider")
+@click.option("--max-iterations", type=int, default=10, help="Add/remove steps of the local search")
+@click.option("--workers", type=int, default=1, help="Number of worker processes")
+@click.option("--output", help="Write the full recommendation as JSON to this file")
+@pass_context
+def recommend_cartons(context, strategy, limit, fixture, carton_weight, max_candidates, max_iterations,
+	workers, output):
+	"""Recommend carton catalog additions and removals from historical Pick Lists"""
+	from import_export.packing_system import replay
+	from import_export.packing_system.catalog_design import CatalogDesigner
+
+	if fixture:
+		corpus = replay.load_fixture(fixture)
+	else:
+		site = get_site(context)
+		frappe.init(site=site)
+		frappe.connect()
+		try:
+			corpus = replay.load_corpus(limit=limit)
+		finally:
+			frappe.destroy()
+
+	recommendation = CatalogDesigner(
+		corpus,
+		strategy=strategy,
+		carton_weight=carton_weight,
+		workers=workers,
+		max_candidates=max_candidates,
+		max_iterations=max_iterations
+	).recommend()
+
+	if output:
+		with open(output, "w") as f:
+			json.dump(recommendation, f, indent=1, default=str)
+
+	savings = recommendation["projected_savings"]
+	click.echo(f"Analysed {recommendation['profiles']} pick lists ({recommendation['demands']} distinct demands)")
+	for carton in recommendation["additions"]:
+		click.echo(
+			f"  add    {carton['length']} x {carton['width']} x {carton['height']} "
+			f"(est. cost {carton['cost_per_unit']})"
+		)
+	for carton_id in recommendation["removals"]:
+		click.echo(f"  remove {carton_id}")
+	click.echo(
+		f"Projected savings: cost {savings['total_cost']:.2f}, cartons {savings['total_cartons']:+g}"
+	)
+
+
+@click.command("rebuild-shipment-status")
+@click.option("--invoice", "invoices", multiple=True, help="Only rebuild the rows of these Commercial Invoices")
+@pass_context
+def rebuild_shipment_status(context, invoices):
+	"""Rebuild the Export Shipment Status table from the export documents"""
+	from import_export.import_export.shipment_status import rebuild_shipment_status
+
+	for site in context.sites:
+		frappe.init(site=site)
+		frappe.connect()
+		try:
+			count = rebuild_shipment_status(list(invoices) or None)
+			frappe.db.commit()
+		finally:
+			frappe.destroy()
+		click.echo(f"{site}: rebuilt {count} Export Shipment Status rows")
+
+
+commands = [replay_packing, recommend_cartons, rebuild_shipment_status]
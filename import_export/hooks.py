@@ -11,7 +11,9 @@ app_license = "mit"
 
 # include js, css files in header of desk.html
 # app_include_css = "/assets/import_export/css/import_export.css"
-app_include_js = "packing_visualizer.bundle.js"
+# packing_visualizer.bundle.js is not included here: the packing-visualize page and the
+# Packing List form load it with frappe.require when a 3D view is opened
+# app_include_js = "/assets/import_export/js/import_export.js"
 
 # include js, css files in header of web template
 # web_include_css = "/assets/import_export/css/import_export.css"
@@ -33,7 +35,9 @@ doctype_js = {
 	"Sales Order" : "import_export/custom_script/sales_order/sales_order.js",
 	"Purchase Invoice" : "import_export/custom_script/purchase_invoice/purchase_invoice.js",
 }
-# doctype_list_js = {"doctype" : "public/js/doctype_list.js"}
+doctype_list_js = {
+	"Sales Order" : "import_export/custom_script/sales_order/sales_order_list.js",
+}
 # doctype_tree_js = {"doctype" : "public/js/doctype_tree.js"}
 # doctype_calendar_js = {"doctype" : "public/js/doctype_calendar.js"}
 
@@ -122,13 +126,47 @@ doctype_js = {
 
 doc_events = {
     "Item": {
-        "validate": "import_export.packing_system.utils.calc_vol"
+        "validate": "import_export.packing_system.utils.calc_vol",
+        "on_update": "import_export.import_export.item_attributes.invalidate_item_attributes",
+        "on_trash": "import_export.import_export.item_attributes.invalidate_item_attributes",
+        "after_rename": "import_export.import_export.item_attributes.invalidate_item_attributes",
     },
     "Sales Order": {
         "validate": "import_export.import_export.custom_script.sales_order.sales_order.sales_order_validate",
+        "on_submit": "import_export.import_export.custom_script.sales_order.sales_order.sales_order_on_submit",
     },
     "Pick List": {
         "validate": "import_export.import_export.custom_script.pick_list.pick_list.pick_list_validate"
+    },
+    "Commercial Invoice Export": {
+        "on_update": "import_export.import_export.shipment_status.update_invoice_status",
+        "on_submit": "import_export.import_export.shipment_status.update_invoice_status",
+        "on_cancel": "import_export.import_export.shipment_status.update_invoice_status",
+        "on_trash": "import_export.import_export.shipment_status.update_invoice_status",
+    },
+    "Packing List Export": {
+        "on_update": "import_export.import_export.shipment_status.update_shipment_status",
+        "on_submit": "import_export.import_export.shipment_status.update_shipment_status",
+        "on_cancel": "import_export.import_export.shipment_status.update_shipment_status",
+        "on_trash": "import_export.import_export.shipment_status.update_shipment_status",
+    },
+    "Certificate of Origin": {
+        "on_update": "import_export.import_export.shipment_status.update_shipment_status",
+        "on_submit": "import_export.import_export.shipment_status.update_shipment_status",
+        "on_cancel": "import_export.import_export.shipment_status.update_shipment_status",
+        "on_trash": "import_export.import_export.shipment_status.update_shipment_status",
+    },
+    "Shipping Bill": {
+        "on_update": "import_export.import_export.shipment_status.update_shipment_status",
+        "on_submit": "import_export.import_export.shipment_status.update_shipment_status",
+        "on_cancel": "import_export.import_export.shipment_status.update_shipment_status",
+        "on_trash": "import_export.import_export.shipment_status.update_shipment_status",
+    },
+    "Bill of Lading": {
+        "on_update": "import_export.import_export.shipment_status.update_shipment_status",
+        "on_submit": "import_export.import_export.shipment_status.update_shipment_status",
+        "on_cancel": "import_export.import_export.shipment_status.update_shipment_status",
+        "on_trash": "import_export.import_export.shipment_status.update_shipment_status",
     }
 }
 
@@ -141,6 +179,12 @@ notification_config = "import_export.import_export.notifications.get_notificatio
 
 # Scheduled Tasks (for future enhancement - certificate expiry alerts, etc.)
 # ---------------
+scheduler_events = {
+	"daily": [
+		"import_export.packing_system.packing_run.prune_packing_runs"
+	]
+}
+
 # scheduler_events = {
 #     "daily": [
 #         "import_export.notifications.send_certificate_expiry_alerts",
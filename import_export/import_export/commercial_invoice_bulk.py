@@ -0,0 +1,213 @@
+"""
+Bulk Commercial Invoice creation from export Sales Orders
+
+`create_commercial_invoices` (Sales Order list action) queues a background
+job that creates one Commercial Invoice Export per Sales Order. Orders that
+are not submitted export orders, or already have a Commercial Invoice, are
+skipped after one query each for the Sales Order headers and the existing
+invoices. Company, Address, Contact and Bank Account documents and the Item
+attributes of all orders are loaded once for the batch. Every invoice is
+committed on its own, so one failing order does not undo the others, and
+the per-order results are kept in the cache for the list view.
+"""
+
+import json
+
+import frappe
+from frappe import _
+from frappe.utils import now_datetime
+
+from import_export.import_export.doctype.commercial_invoice_export.commercial_invoice_export import (
+    make_commercial_invoice,
+)
+from import_export.import_export.item_attributes import get_item_attributes
+
+BULK_PREFIX = "import_export:bulk_commercial_invoice:"
+BULK_TTL = 24 * 60 * 60
+MAX_SALES_ORDERS = 1000
+# Progress is written to the cache every this many orders
+PROGRESS_INTERVAL = 10
+
+
+@frappe.whitelist()
+def create_commercial_invoices(sales_orders):
+    """Queue Commercial Invoice creation for a list of Sales Orders; returns the job status"""
+    frappe.has_permission("Commercial Invoice Export", "create", throw=True)
+
+    if isinstance(sales_orders, str):
+        sales_orders = json.loads(sales_orders)
+    sales_orders = list(dict.fromkeys(name for name in sales_orders or [] if name))
+    if not sales_orders:
+        frappe.throw(_("Select at least one Sales Order"))
+    if len(sales_orders) > MAX_SALES_ORDERS:
+        frappe.throw(_("Select at most {0} Sales Orders at a time").format(MAX_SALES_ORDERS))
+
+    bulk_id = frappe.generate_hash(length=10)
+    frappe.cache().set_value(_key(bulk_id), {
+        "status": "Queued",
+        "started": str(now_datetime()),
+        "total": len(sales_orders),
+        "processed": 0,
+        "results": [],
+        "user": frappe.session.user
+    }, expires_in_sec=BULK_TTL)
+
+    frappe.enqueue(
+        "import_export.import_export.commercial_invoice_bulk.process_bulk_commercial_invoices",
+        queue="long",
+        timeout=3600,
+        job_id=f"bulk_commercial_invoice:{bulk_id}",
+        enqueue_after_commit=True,
+        bulk_id=bulk_id,
+        sales_orders=sales_orders
+    )
+
+    return get_bulk_invoice_status(bulk_id)
+
+
+def process_bulk_commercial_invoices(bulk_id, sales_orders):
+    status = frappe.cache().get_value(_key(bulk_id)) or {}
+    status.update({"status": "Running", "processed": 0, "results": []})
+
+    def on_progress(results):
+        status.update({"processed": len(results), "results": results})
+        if len(results) % PROGRESS_INTERVAL == 0:
+            frappe.cache().set_value(_key(bulk_id), status, expires_in_sec=BULK_TTL)
+
+    results = build_commercial_invoices(sales_orders, on_progress=on_progress)
+
+    status.update({
+        "status": "Completed",
+        "completed": str(now_datetime()),
+        "processed": len(results),
+        "results": results
+    })
+    frappe.cache().set_value(_key(bulk_id), status, expires_in_sec=BULK_TTL)
+    frappe.publish_realtime("bulk_commercial_invoice_completed", get_bulk_invoice_status(bulk_id), user=status.get("user"))
+
+
+def build_commercial_invoices(sales_orders, on_progress=None):
+    """
+    Create Commercial Invoices for the given Sales Orders, committing each one
+    Returns [{sales_order, status (Created / Skipped / Failed), commercial_invoice, message}] in input order
+    """
+    headers = {
+        so.name: so for so in frappe.get_all(
+            "Sales Order",
+            filters={"name": ["in", sales_orders]},
+            fields=["name", "docstatus", "gst_category", "company", "company_address",
+                    "customer_address", "contact_person"]
+        )
+    }
+    existing = dict(frappe.get_all(
+        "Commercial Invoice Export",
+        filters={"sales_order": ["in", sales_orders], "docstatus": ["!=", 2]},
+        fields=["sales_order", "name"],
+        as_list=True
+    ))
+
+    skipped, pending = {}, []
+    for name in sales_orders:
+        so = headers.get(name)
+        if not so:
+            skipped[name] = {"message": _("Sales Order not found")}
+        elif so.docstatus != 1:
+            skipped[name] = {"message": _("Sales Order must be submitted first")}
+        elif so.gst_category != "Overseas":
+            skipped[name] = {"message": _("This is not an export order.")}
+        elif name in existing:
+            skipped[name] = {"commercial_invoice": existing[name], "message": _("Commercial Invoice already exists")}
+        else:
+            pending.append(so)
+
+    masters = get_sales_order_masters(pending)
+    if pending:
+        # Fills the request memo that make_commercial_invoice reads from
+        get_item_attributes(frappe.get_all(
+            "Sales Order Item",
+            filters={"parent": ["in", [so.name for so in pending]], "parenttype": "Sales Order"},
+            pluck="item_code",
+            distinct=True
+        ))
+
+    results = []
+    for name in sales_orders:
+        if name in skipped:
+            results.append({"sales_order": name, "status": "Skipped", "commercial_invoice": None, **skipped[name]})
+        else:
+            results.append(create_commercial_invoice(name, masters))
+
+        if on_progress:
+            on_progress(results)
+
+    return results
+
+
+def create_commercial_invoice(sales_order, masters):
+    try:
+        ci = make_commercial_invoice(frappe.get_doc("Sales Order", sales_order), masters)
+        ci.insert(ignore_mandatory=True)
+        frappe.db.commit()
+    except Exception as e:
+        frappe.db.rollback()
+        frappe.log_error(
+            title=f"Bulk Commercial Invoice failed: {sales_order}",
+            reference_doctype="Sales Order",
+            reference_name=sales_order
+        )
+        return {"sales_order": sales_order, "status": "Failed", "commercial_invoice": None, "message": str(e)}
+
+    return {"sales_order": sales_order, "status": "Created", "commercial_invoice": ci.name, "message": None}
+
+
+def get_sales_order_masters(sales_orders):
+    """{(doctype, name): document} of the Company, Address, Contact and Bank Account records used by the orders"""
+    masters = {}
+
+    def load(doctype, names):
+        for name in set(filter(None, names)):
+            if (doctype, name) in masters:
+                continue
+            try:
+                masters[(doctype, name)] = frappe.get_doc(doctype, name)
+            except frappe.DoesNotExistError:
+                frappe.clear_last_message()
+                continue  # Reported by the order that uses it
+
+    load("Company", [so.company for so in sales_orders])
+    load("Address", [so.company_address for so in sales_orders] + [so.customer_address for so in sales_orders])
+    load("Contact", [so.contact_person for so in sales_orders])
+    load("Bank Account", [
+        company.get("default_bank_account")
+        for (doctype, name), company in masters.items() if doctype == "Company"
+    ])
+
+    return masters
+
+
+@frappe.whitelist()
+def get_bulk_invoice_status(bulk_id):
+    """Progress and per-order results of a bulk creation job"""
+    status = frappe.cache().get_value(_key(bulk_id))
+    if not status:
+        return None
+    if status.get("user") != frappe.session.user and "System Manager" not in frappe.get_roles():
+        frappe.throw(_("Not permitted"), frappe.PermissionError)
+
+    results = status.get("results") or []
+    return {
+        "bulk_id": bulk_id,
+        "status": status.get("status"),
+        "started": status.get("started"),
+        "completed": status.get("completed"),
+        "total": status.get("total"),
+        "processed": status.get("processed"),
+        "created": sum(1 for r in results if r["status"] == "Created"),
+        "skipped": sum(1 for r in results if r["status"] == "Skipped"),
+        "failed": sum(1 for r in results if r["status"] == "Failed"),
+        "results": results
+    }
+
+
+def _key(bulk_id):
+    return BULK_PREFIX + bulk_id
@@ -100,14 +100,37 @@ function create_export_packing_list(frm, commercial_invoice) {
     );
 }
 
+// Packing Settings strategy -> engine strategy (same map as packing_system/precompute.py)
+var PACKING_STRATEGIES = {
+    'Minimize Cartons': 'minimize_cartons',
+    'Minimize Waste': 'minimize_waste',
+    'Maximize Efficiency': 'maximize_efficiency',
+    'Minimize Cost': 'minimize_cost'
+};
+
 function calculate_packing(frm) {
+    frappe.db.get_single_value('Packing Settings', 'packing_strategy').then(default_strategy => {
+        // Same default as the Sales Order precomputation, so precomputed results are picked up
+        prompt_packing_strategy(frm, PACKING_STRATEGIES[default_strategy] || 'minimize_cartons');
+    });
+}
+
+function prompt_packing_strategy(frm, default_strategy) {
     frappe.prompt([
         {
             label: 'Packing Strategy',
             fieldname: 'strategy',
             fieldtype: 'Select',
-            options: 'minimize_cartons\nminimize_waste\nmaximize_efficiency',
-            default: 'minimize_cartons'
+            options: 'minimize_cartons\nminimize_waste\nmaximize_efficiency\nminimize_cost',
+            default: default_strategy
+        },
+        {
+            label: 'Packing Mode',
+            fieldname: 'packing_mode',
+            fieldtype: 'Select',
+            options: 'single\nnested',
+            default: 'single',
+            description: __('Nested packs items into Inner cartons, then inners into Master cartons')
         }
     ], function(values) {
         frappe.call({
@@ -115,8 +138,15 @@ function calculate_packing(frm) {
             args: {
                 pick_list_name: frm.doc.name,
                 strategy: values.strategy,
-                enable_3d: true
+                enable_3d: true,
+                modified: frm.doc.modified,
+                packing_mode: values.packing_mode,
+                // The form reloads itself, so the whole Pick List is not sent back
+                slim: 1
             },
+            freeze: true,
+            freeze_message: __('Calculating Packing...'),
+            btn: frm.custom_buttons[__("Suggest Cartons")],
             callback: function(r) {
                 if (r.message && r.message.success) {
                     frm.reload_doc();
@@ -124,8 +154,36 @@ function calculate_packing(frm) {
                         message: r.message.message,
                         indicator: 'green'
                     });
+                    if (r.message.custom_cartons && r.message.custom_cartons.length) {
+                        offer_custom_cartons(r.message.custom_cartons);
+                    }
                 }
             }
         });
     }, 'Select Packing Strategy', 'Calculate');
 }
+
+function offer_custom_cartons(suggestions) {
+    const esc = frappe.utils.escape_html;
+    let rows = suggestions.map(s => `<li>${esc(s.item_code)} × ${s.quantity}: ${esc(s.carton.carton_name)}
+        (${s.units_per_carton} per carton, ${s.cartons_needed} cartons)</li>`).join('');
+
+    frappe.confirm(
+        __('Some items fit no carton in the catalog. Create these custom cartons?') + `<ul>${rows}</ul>`,
+        function() {
+            frappe.call({
+                method: 'import_export.packing_system.pick_list_packing.create_custom_cartons',
+                args: { cartons: suggestions.map(s => s.carton) },
+                callback: function(r) {
+                    if (r.message) {
+                        let message = __('{0} cartons created, calculate packing again to use them', [r.message.created.length]);
+                        if (r.message.existing.length) {
+                            message += ' ' + __('Already in the catalog: {0}', [esc(r.message.existing.join(', '))]);
+                        }
+                        frappe.show_alert({ message: message, indicator: 'green' });
+                    }
+                }
+            });
+        }
+    );
+}
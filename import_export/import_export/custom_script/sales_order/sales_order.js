@@ -1,5 +1,7 @@
 frappe.ui.form.on('Sales Order', {
     refresh: function(frm) {
+        update_packing_estimate(frm);
+
         // Only show for export customers
         if (frm.doc.docstatus === 1 && frm.doc.gst_category === "Overseas") {
             
@@ -65,6 +67,50 @@ frappe.ui.form.on('Sales Order', {
     }
 });
 
+frappe.ui.form.on('Sales Order Item', {
+    item_code: function(frm) {
+        update_packing_estimate(frm);
+    },
+    qty: function(frm) {
+        update_packing_estimate(frm);
+    },
+    items_remove: function(frm) {
+        update_packing_estimate(frm);
+    }
+});
+
+// Live carton/CBM estimate for draft export orders, at most one call per pause in typing
+var update_packing_estimate = frappe.utils.debounce(function(frm) {
+    if (frm.doc.docstatus !== 0 || frm.doc.gst_category !== "Overseas") return;
+
+    let items = (frm.doc.items || [])
+        .filter(d => d.item_code && d.qty > 0)
+        .map(d => ({ item_code: d.item_code, qty: d.qty }));
+
+    if (!items.length) {
+        frm.dashboard.clear_headline();
+        return;
+    }
+
+    frappe.call({
+        method: 'import_export.packing_system.estimate.estimate_packing',
+        args: { items: items },
+        callback: function(r) {
+            if (!r.message) return;
+            let e = r.message;
+            let cartons = e.cartons_min === e.cartons_max
+                ? e.cartons_max
+                : `${e.cartons_min} - ${e.cartons_max}`;
+
+            frm.dashboard.set_headline(__('Packing estimate: {0} cartons, {1} CBM, packing cost {2}', [
+                cartons,
+                flt(e.cbm, 3),
+                format_currency(e.estimated_cost, frm.doc.currency)
+            ]));
+        }
+    });
+}, 400);
+
 function create_commercial_invoice(frm) {
     frappe.confirm(
         __('Create Commercial Invoice Export from this Sales Order?'),
@@ -1,6 +1,8 @@
 import frappe
 from frappe import _
 
+from import_export.import_export.item_attributes import get_item_attributes
+
 
 def sales_order_validate(doc, method):
     """Validate export sales orders"""
@@ -8,6 +10,13 @@ def sales_order_validate(doc, method):
         validate_export_order(doc)
 
 
+def sales_order_on_submit(doc, method):
+    """Precompute packing for export orders (optional, see Packing Settings)"""
+    if doc.gst_category == "Overseas":
+        from import_export.packing_system.precompute import enqueue_sales_order_packing
+        enqueue_sales_order_packing(doc)
+
+
 def validate_export_order(doc):
     """Validate export-specific fields"""
     # Check incoterm
@@ -18,10 +27,13 @@ def validate_export_order(doc):
     # if not doc.get("payment_method"):
     #     frappe.throw(_("Payment Method is mandatory for export orders"))
     
+    # Item master fields for all lines in one query
+    item_attributes = get_item_attributes([item.item_code for item in doc.items])
+
     # Validate HS codes for all items
     missing_hs_codes = []
     for item in doc.items:
-        hs_code = frappe.db.get_value("Item", item.item_code, "gst_hsn_code")
+        hs_code = item_attributes.get(item.item_code, {}).get("gst_hsn_code")
         if not hs_code:
             missing_hs_codes.append(item.item_code)
     
@@ -34,7 +46,7 @@ def validate_export_order(doc):
     # Validate country of origin for items (warning only)
     missing_origin = []
     for item in doc.items:
-        country_of_origin = frappe.db.get_value("Item", item.item_code, "country_of_origin")
+        country_of_origin = item_attributes.get(item.item_code, {}).get("country_of_origin")
         if not country_of_origin:
             missing_origin.append(item.item_code)
     
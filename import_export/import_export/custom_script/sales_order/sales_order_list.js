@@ -0,0 +1,82 @@
+// Extends ERPNext's Sales Order list settings with bulk export invoice creation
+frappe.listview_settings['Sales Order'] = frappe.listview_settings['Sales Order'] || {};
+
+(function(settings) {
+    const onload = settings.onload;
+
+    settings.onload = function(listview) {
+        if (onload) onload.apply(this, arguments);
+
+        if (!frappe.model.can_create('Commercial Invoice Export')) return;
+
+        listview.page.add_action_item(__('Create Export Invoices'), function() {
+            let sales_orders = listview.get_checked_items(true);
+            if (!sales_orders.length) {
+                frappe.msgprint(__('Select Sales Orders first'));
+                return;
+            }
+
+            frappe.confirm(
+                __('Create Commercial Invoice Export for {0} Sales Orders? Orders that are not submitted export orders or already have an invoice are skipped.', [sales_orders.length]),
+                function() {
+                    frappe.call({
+                        method: 'import_export.import_export.commercial_invoice_bulk.create_commercial_invoices',
+                        args: { sales_orders: sales_orders },
+                        freeze: true,
+                        callback: function(r) {
+                            if (r.message) track_bulk_invoices(r.message.bulk_id, listview);
+                        }
+                    });
+                }
+            );
+        });
+    };
+})(frappe.listview_settings['Sales Order']);
+
+function track_bulk_invoices(bulk_id, listview) {
+    frappe.call({
+        method: 'import_export.import_export.commercial_invoice_bulk.get_bulk_invoice_status',
+        args: { bulk_id: bulk_id },
+        callback: function(r) {
+            let status = r.message;
+            if (!status) return;
+
+            frappe.show_progress(__('Creating Export Invoices'), status.processed || 0, status.total || 1,
+                __('{0} of {1} Sales Orders', [status.processed || 0, status.total]));
+
+            if (status.status === 'Completed') {
+                frappe.hide_progress();
+                show_bulk_invoice_results(status);
+                listview.refresh();
+            } else {
+                setTimeout(() => track_bulk_invoices(bulk_id, listview), 2000);
+            }
+        }
+    });
+}
+
+function show_bulk_invoice_results(status) {
+    const indicators = { Created: 'green', Skipped: 'orange', Failed: 'red' };
+    let rows = status.results.map(row => `
+        <tr>
+            <td>${frappe.utils.get_form_link('Sales Order', row.sales_order, true)}</td>
+            <td><span class="indicator-pill ${indicators[row.status]}">${__(row.status)}</span></td>
+            <td>${row.commercial_invoice
+                ? frappe.utils.get_form_link('Commercial Invoice Export', row.commercial_invoice, true)
+                : ''}</td>
+            <td>${frappe.utils.escape_html(row.message || '')}</td>
+        </tr>`).join('');
+
+    frappe.msgprint({
+        title: __('Export Invoices: {0} created, {1} skipped, {2} failed', [status.created, status.skipped, status.failed]),
+        message: `<table class="table table-bordered table-condensed">
+            <thead><tr>
+                <th>${__('Sales Order')}</th><th>${__('Status')}</th>
+                <th>${__('Commercial Invoice')}</th><th>${__('Message')}</th>
+            </tr></thead>
+            <tbody>${rows}</tbody>
+        </table>`,
+        wide: true,
+        indicator: status.failed ? 'orange' : 'green'
+    });
+}
@@ -3,6 +3,8 @@ from frappe import _
 from frappe.model.document import Document
 from frappe.utils import flt
 
+from import_export.import_export.item_attributes import get_item_attributes
+
 
 class BillofEntry(Document):
     def validate(self):
@@ -92,10 +94,11 @@ def get_items_from_purchase_invoice(purchase_invoice):
         return []
     
     pi = frappe.get_doc("Purchase Invoice", purchase_invoice)
+    item_attributes = get_item_attributes([item.item_code for item in pi.items])
     
     items = []
     for item in pi.items:
-        item_doc = frappe.get_doc("Item", item.item_code)
+        item_doc = item_attributes.get(item.item_code) or frappe._dict()
         
         items.append({
             "item_code": item.item_code,
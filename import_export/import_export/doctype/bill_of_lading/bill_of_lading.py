@@ -1,8 +1,12 @@
+import json
+
 import frappe
 from frappe import _
 from frappe.model.document import Document
 from frappe.utils import flt
 
+from import_export.packing_system.container_allocation import allocate_containers, get_container_sizes
+
 
 class BillofLading(Document):
     def validate(self):
@@ -65,8 +69,11 @@ class BillofLading(Document):
 
 
 @frappe.whitelist()
-def get_containers_from_packing_list(commercial_invoice):
-    """Get container details from Packing List"""
+def get_containers_from_packing_list(commercial_invoice, containers=None):
+    """
+    Get container details from Packing List
+    containers: the B/L's container rows; their sizes are kept, other containers get planned sizes
+    """
     if not commercial_invoice:
         return []
 
@@ -85,26 +92,38 @@ def get_containers_from_packing_list(commercial_invoice):
     # Get container info from Commercial Invoice
     ci = frappe.get_doc("Commercial Invoice Export", commercial_invoice)
 
-    containers = []
+    if isinstance(containers, str):
+        containers = json.loads(containers)
+    known_sizes = {
+        row.get("container_no"): row.get("container_size")
+        for row in containers or []
+        if row.get("container_no")
+    }
+
+    result = []
     if ci.container_nos:
         # Parse container numbers (comma-separated)
         container_numbers = [c.strip() for c in ci.container_nos.split(",")]
+        sizes = get_container_sizes(
+            packing_list,
+            len(container_numbers),
+            [known_sizes.get(container_no) for container_no in container_numbers],
+        )
+        allocation = allocate_containers(packing_list, sizes)
 
-        for container_no in container_numbers:
-            containers.append(
+        for container_no, allocated in zip(container_numbers, allocation["containers"]):
+            result.append(
                 {
                     "container_no": container_no,
                     "seal_no": "",  # To be filled manually
-                    "container_size": packing_list.container_size or "40ft",
+                    "container_size": allocated["container_size"],
                     "container_type": "Dry",
-                    "no_of_packages": int(packing_list.total_cartons)
-                    if packing_list.total_cartons
-                    else 0,
-                    "gross_weight": flt(packing_list.total_gross_weight),
+                    "no_of_packages": allocated["no_of_packages"],
+                    "gross_weight": allocated["gross_weight"],
                 }
             )
 
-    return containers
+    return result
 
 
 @frappe.whitelist()
@@ -130,15 +149,19 @@ def create_from_packing_list(packing_list_name):
 
     pl = frappe.get_doc("Packing List Export", packing_list_name)
 
-    # Validate Packing List is submitted
-    if pl.docstatus != 1:
-        frappe.throw(_("Packing List must be submitted first"))
-
     # Get Commercial Invoice
     if not pl.commercial_invoice:
         frappe.throw(_("Packing List must be linked to a Commercial Invoice"))
 
     ci = frappe.get_doc("Commercial Invoice Export", pl.commercial_invoice)
+    return create_bill_of_lading(pl, ci)
+
+
+def create_bill_of_lading(pl, ci):
+    """Bill of Lading for a loaded Packing List and its loaded Commercial Invoice"""
+    # Validate Packing List is submitted
+    if pl.docstatus != 1:
+        frappe.throw(_("Packing List must be submitted first"))
 
     # Check if B/L already exists for this CI
     existing = frappe.db.exists(
@@ -212,27 +235,23 @@ def create_from_packing_list(packing_list_name):
         if ci.seal_nos:
             seal_numbers = [s.strip() for s in ci.seal_nos.split(",")]
 
-        packages_per_container = (
-            int(pl.total_cartons / len(container_numbers))
-            if len(container_numbers) > 0
-            else pl.total_cartons
-        )
-        weight_per_container = (
-            pl.total_gross_weight / len(container_numbers)
-            if len(container_numbers) > 0
-            else pl.total_gross_weight
+        # Cartons allocated by volume and payload to the containers planned for them
+        allocation = allocate_containers(
+            pl, get_container_sizes(pl, len(container_numbers))
         )
 
-        for idx, container_no in enumerate(container_numbers):
+        for idx, (container_no, allocated) in enumerate(
+            zip(container_numbers, allocation["containers"])
+        ):
             bl.append(
                 "containers",
                 {
                     "container_no": container_no,
                     "seal_no": seal_numbers[idx] if idx < len(seal_numbers) else "",
-                    "container_size": pl.container_size or "40ft",
+                    "container_size": allocated["container_size"],
                     "container_type": "Dry",  # Default
-                    "no_of_packages": packages_per_container,
-                    "gross_weight": weight_per_container,
+                    "no_of_packages": allocated["no_of_packages"],
+                    "gross_weight": allocated["gross_weight"],
                 },
             )
 
@@ -1,8 +1,66 @@
 // Copyright (c) 2025, gws and contributors
 // For license information, please see license.txt
 
-// frappe.ui.form.on("Carton", {
-// 	refresh(frm) {
+frappe.ui.form.on("Carton", {
+    refresh(frm) {
+        if (frm.is_new()) return;
 
-// 	},
-// });
+        frm.add_custom_button(__('Repack Open Pick Lists'), function() {
+            frappe.confirm(
+                __('Repack all draft Pick Lists packed with an older carton catalog?'),
+                function() {
+                    frappe.call({
+                        method: 'import_export.packing_system.repack.start_catalog_repack',
+                        freeze: true,
+                        callback: function(r) {
+                            if (r.message) track_repack(r.message.repack_id);
+                        }
+                    });
+                }
+            );
+        });
+    },
+});
+
+function track_repack(repack_id) {
+    frappe.call({
+        method: 'import_export.packing_system.repack.get_repack_status',
+        args: { repack_id: repack_id },
+        callback: function(r) {
+            let status = r.message;
+            if (!status) return;
+
+            let processed = status.done + status.failed + status.skipped;
+            frappe.show_progress(__('Repacking Pick Lists'), processed, status.total || 1,
+                __('{0} of {1} Pick Lists', [processed, status.total]));
+
+            if (status.status === 'Running') {
+                setTimeout(() => track_repack(repack_id), 2000);
+                return;
+            }
+
+            frappe.hide_progress();
+            if (status.status === 'Completed') {
+                frappe.msgprint({
+                    title: __('Repack Completed'),
+                    indicator: status.failed ? 'orange' : 'green',
+                    message: __('Repacked: {0}, Failed: {1}, Skipped: {2}<br>Carton change: {3}, Cost change: {4}', [
+                        status.done, status.failed, status.skipped,
+                        status.carton_delta, format_currency(status.cost_delta)
+                    ])
+                });
+            } else if (status.status === 'Superseded') {
+                frappe.show_alert({
+                    message: __('Repack superseded by a newer repack after {0} of {1} Pick Lists', [processed, status.total]),
+                    indicator: 'blue'
+                });
+            } else {
+                frappe.msgprint({
+                    title: __('Repack Stalled'),
+                    indicator: 'red',
+                    message: __('No progress for a while after {0} of {1} Pick Lists. Check the background jobs and start the repack again.', [processed, status.total])
+                });
+            }
+        }
+    });
+}
@@ -1,6 +1,23 @@
 from frappe.utils import flt
 from frappe.model.document import Document
+from import_export.packing_system.estimate import clear_catalog_cache
+from import_export.packing_system.repack import enqueue_catalog_repack
+
+# Fields that change packing results; edits to others leave packed Pick Lists valid
+PACKING_FIELDS = (
+    "length", "width", "height", "weight_limit", "cost_per_unit", "carton_type",
+    "material", "fragile_safe", "max_stack_height", "uom", "disabled", "packing_level"
+)
 
 class Carton(Document):
     def validate(self):
         self.volume = self.length * self.width * self.height
+
+    def on_update(self):
+        clear_catalog_cache()
+        if any(self.has_value_changed(fieldname) for fieldname in PACKING_FIELDS):
+            enqueue_catalog_repack()
+
+    def on_trash(self):
+        clear_catalog_cache()
+        enqueue_catalog_repack()
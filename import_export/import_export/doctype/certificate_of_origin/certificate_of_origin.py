@@ -262,7 +262,11 @@ def create_from_commercial_invoice(commercial_invoice):
     """Auto-create COO from CI"""
 
     ci = frappe.get_doc("Commercial Invoice Export", commercial_invoice)
+    return create_certificate_of_origin(ci)
 
+
+def create_certificate_of_origin(ci):
+    """Certificate of Origin for a loaded Commercial Invoice"""
     coo = frappe.new_doc("Certificate of Origin")
     coo.commercial_invoice = ci.name
     coo.company = ci.company
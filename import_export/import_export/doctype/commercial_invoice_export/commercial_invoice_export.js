@@ -4,11 +4,9 @@
 frappe.ui.form.on('Commercial Invoice Export', {
     refresh: function(frm) {
         if (frm.doc.docstatus === 1) {
-            // Show export readiness status
+            // Show export readiness status and add create / view buttons for child documents,
+            // both from one Export Shipment Status lookup
             show_export_readiness(frm);
-
-            // Add create buttons for child documents
-            add_create_buttons(frm);
         }
     },
 
@@ -78,6 +76,8 @@ function show_export_readiness(frm) {
                 let data = r.message;
                 let completion = data.completion_percentage;
 
+                add_create_buttons(frm, data.status);
+
                 // Add indicator to dashboard
                 let indicator_color = completion === 100 ? 'green' :
                 completion >= 75 ? 'blue' :
@@ -190,83 +190,61 @@ function build_status_html(status, missing_documents) {
 
 // ==================== CREATE BUTTONS ====================
 
-function add_create_buttons(frm) {
+function add_create_buttons(frm, status) {
     let docs_to_create = [
         {
             doctype: 'Packing List Export',
             label: 'Packing List',
-            filter_field: 'commercial_invoice',
+            status_key: 'packing_list',
             create_fn: create_packing_list
         },
         {
             doctype: 'Certificate of Origin',
             label: 'Certificate of Origin',
-            filter_field: 'commercial_invoice',
+            status_key: 'certificate_of_origin',
             create_fn: create_certificate_of_origin
         },
         {
             doctype: 'Shipping Bill',
             label: 'Shipping Bill',
-            filter_field: 'commercial_invoice',
+            status_key: 'shipping_bill',
             create_fn: create_shipping_bill
         },
         {
             doctype: 'Bill of Lading',
             label: 'Bill of Lading',
-            filter_field: 'commercial_invoice',
+            status_key: 'bill_of_lading',
             create_fn: create_bill_of_lading
         }
     ];
 
     docs_to_create.forEach(function(doc_info) {
-        check_and_add_button(frm, doc_info);
+        add_document_button(frm, doc_info, status);
     });
 }
 
 
-function check_and_add_button(frm, doc_info) {
-    let filters = {};
-    filters[doc_info.filter_field] = frm.doc.name;
-
-    frappe.call({
-        method: 'frappe.client.get_count',
-        args: {
-            doctype: doc_info.doctype,
-            filters: filters
-        },
-        callback: function(r) {
-            if (r.message === 0) {
-                frm.add_custom_button(
-                    __(doc_info.label),
-                                      function() {
-                                          doc_info.create_fn(frm);
-                                      },
-                                      __('Create')
-                );
-            } else {
-                // Document exists, add view button
-                frappe.call({
-                    method: 'frappe.client.get_value',
-                    args: {
-                        doctype: doc_info.doctype,
-                        filters: filters,
-                        fieldname: 'name'
-                    },
-                    callback: function(r) {
-                        if (r.message) {
-                            frm.add_custom_button(
-                                __('View {0}', [doc_info.label]),
-                                                  function() {
-                                                      frappe.set_route('Form', doc_info.doctype, r.message.name);
-                                                  },
-                                                  __('View')
-                            );
-                        }
-                    }
-                });
-            }
-        }
-    });
+function add_document_button(frm, doc_info, status) {
+    let doc_status = status[doc_info.status_key];
+
+    if (!doc_status.exists) {
+        frm.add_custom_button(
+            __(doc_info.label),
+                              function() {
+                                  doc_info.create_fn(frm, status);
+                              },
+                              __('Create')
+        );
+    } else {
+        // Document exists, add view button
+        frm.add_custom_button(
+            __('View {0}', [doc_info.label]),
+                              function() {
+                                  frappe.set_route('Form', doc_info.doctype, doc_status.name);
+                              },
+                              __('View')
+        );
+    }
 }
 
 
@@ -353,52 +331,39 @@ function create_shipping_bill(frm) {
 }
 
 
-function create_bill_of_lading(frm) {
-    // Check if Packing List exists first
-    frappe.call({
-        method: 'frappe.client.get_value',
-        args: {
-            doctype: 'Packing List Export',
-            filters: {
-                commercial_invoice: frm.doc.name,
-                docstatus: 1
-            },
-            fieldname: 'name'
-        },
-        callback: function(r) {
-            if (!r.message || !r.message.name) {
-                frappe.msgprint({
-                    title: __('Packing List Required'),
-                                message: __('Bill of Lading requires Packing List to be created and submitted first. Please create Packing List.'),
-                                indicator: 'orange'
-                });
-                return;
-            }
+function create_bill_of_lading(frm, status) {
+    // Check if Packing List is submitted first
+    if (!status.packing_list.submitted) {
+        frappe.msgprint({
+            title: __('Packing List Required'),
+                        message: __('Bill of Lading requires Packing List to be created and submitted first. Please create Packing List.'),
+                        indicator: 'orange'
+        });
+        return;
+    }
 
-            // Packing List exists, proceed with B/L creation
-            frappe.confirm(
-                __('Create Bill of Lading from Packing List?'),
-                           function() {
-                               frappe.call({
-                                   method: 'import_export.import_export.doctype.commercial_invoice_export.commercial_invoice_export.create_next_document',
-                                   args: {
-                                       commercial_invoice: frm.doc.name,
-                                       doctype: 'Bill of Lading'
-                                   },
-                                   freeze: true,
-                                   freeze_message: __('Creating Bill of Lading...'),
-                                           callback: function(r) {
-                                               if (r.message) {
-                                                   frappe.show_alert({
-                                                       message: __('Bill of Lading {0} created', [r.message]),
-                                                                     indicator: 'green'
-                                                   }, 3);
-                                                   frappe.set_route('Form', 'Bill of Lading', r.message);
-                                               }
-                                           }
-                               });
-                           }
-            );
-        }
-    });
+    // Packing List exists, proceed with B/L creation
+    frappe.confirm(
+        __('Create Bill of Lading from Packing List?'),
+                   function() {
+                       frappe.call({
+                           method: 'import_export.import_export.doctype.commercial_invoice_export.commercial_invoice_export.create_next_document',
+                           args: {
+                               commercial_invoice: frm.doc.name,
+                               doctype: 'Bill of Lading'
+                           },
+                           freeze: true,
+                           freeze_message: __('Creating Bill of Lading...'),
+                                   callback: function(r) {
+                                       if (r.message) {
+                                           frappe.show_alert({
+                                               message: __('Bill of Lading {0} created', [r.message]),
+                                                             indicator: 'green'
+                                           }, 3);
+                                           frappe.set_route('Form', 'Bill of Lading', r.message);
+                                       }
+                                   }
+                       });
+                   }
+    );
 }
@@ -6,6 +6,8 @@ from frappe import _
 from frappe.utils import flt, money_in_words
 from frappe.model.document import Document
 
+from import_export.import_export.item_attributes import get_item_attributes
+
 class CommercialInvoiceExport(Document):
     def validate(self):
         self.set_exporter_details()
@@ -157,6 +159,21 @@ def create_from_sales_order(sales_order):
             "Commercial Invoice {0} already exists for this Sales Order"
         ).format(existing))
 
+    ci = make_commercial_invoice(so)
+
+    # Insert and return
+    ci.insert(ignore_mandatory=True)
+    # frappe.db.commit()
+
+    return ci.name
+
+
+def make_commercial_invoice(so, masters=None):
+    """
+    New (unsaved) Commercial Invoice for a submitted export Sales Order
+    `masters` maps (doctype, name) to Company, Address, Contact and Bank Account
+    documents already loaded for a batch of orders; others are loaded here
+    """
     # Create new Commercial Invoice
     ci = frappe.new_doc("Commercial Invoice Export")
 
@@ -169,12 +186,12 @@ def create_from_sales_order(sales_order):
     ci.conversion_rate = so.conversion_rate
 
     # ========== EXPORTER DETAILS ==========
-    company_doc = frappe.get_doc("Company", so.company)
+    company_doc = get_master(masters, "Company", so.company)
     ci.exporter_name = company_doc.company_name
 
     # Get company address
     if hasattr(so, 'company_address') and so.company_address:
-        company_address = frappe.get_doc("Address", so.company_address)
+        company_address = get_master(masters, "Address", so.company_address)
         ci.exporter_address_name = so.company_address
         ci.exporter_address = company_address.get_display()
         ci.exporter_gstin = company_address.gstin if hasattr(company_address, 'gstin') else None
@@ -189,7 +206,7 @@ def create_from_sales_order(sales_order):
 
     # Get customer address
     if so.customer_address:
-        customer_address = frappe.get_doc("Address", so.customer_address)
+        customer_address = get_master(masters, "Address", so.customer_address)
         ci.consignee_address_name = so.customer_address
         ci.consignee_address = customer_address.get_display()
         ci.consignee_country = customer_address.country
@@ -200,7 +217,7 @@ def create_from_sales_order(sales_order):
 
     # Get customer contact details
     if so.contact_person:
-        contact = frappe.get_doc("Contact", so.contact_person)
+        contact = get_master(masters, "Contact", so.contact_person)
         ci.consignee_email = contact.email_id
         ci.consignee_phone = contact.phone or contact.mobile_no
 
@@ -221,20 +238,22 @@ def create_from_sales_order(sales_order):
         ci.payment_terms = so.payment_method
 
     # ========== ITEMS ==========
+    # Item master details for all lines in one query
+    item_attributes = get_item_attributes([so_item.item_code for so_item in so.items])
+
     for so_item in so.items:
-        # Get item master details
-        item_master = frappe.get_doc("Item", so_item.item_code)
+        item_master = item_attributes.get(so_item.item_code) or frappe._dict()
 
         # Calculate weights
-        weight_per_unit = flt(item_master.weight_per_unit) if hasattr(item_master, 'weight_per_unit') else 0
+        weight_per_unit = flt(item_master.weight_per_unit) if 'weight_per_unit' in item_master else 0
         net_weight = weight_per_unit * flt(so_item.qty)
         gross_weight = net_weight * 1.1  # Assume 10% tare weight
 
         # Get volume
         volume_per_unit = 0
-        if hasattr(item_master, 'volume_per_unit') and item_master.volume_per_unit:
+        if item_master.get('volume_per_unit'):
             volume_per_unit = flt(item_master.volume_per_unit)
-        elif hasattr(item_master, 'length') and hasattr(item_master, 'width') and hasattr(item_master, 'height'):
+        elif 'length' in item_master and 'width' in item_master and 'height' in item_master:
             # Calculate from dimensions (in cm)
             volume_per_unit = flt(item_master.length) * flt(item_master.width) * flt(item_master.height)
 
@@ -242,8 +261,8 @@ def create_from_sales_order(sales_order):
             "item_code": so_item.item_code,
             "item_name": so_item.item_name,
             "description": so_item.description or so_item.item_name,
-            "hs_code": item_master.gst_hsn_code if hasattr(item_master, 'gst_hsn_code') else None,
-            "country_of_origin": item_master.country_of_origin if hasattr(item_master, 'country_of_origin') else ci.country_of_origin,
+            "hs_code": item_master.get('gst_hsn_code'),
+            "country_of_origin": item_master.country_of_origin if 'country_of_origin' in item_master else ci.country_of_origin,
             "qty": so_item.qty,
             "uom": so_item.uom,
             "rate": so_item.rate,
@@ -257,17 +276,19 @@ def create_from_sales_order(sales_order):
     # ========== BANK DETAILS ==========
     # Try to get from company defaults if exists
     if company_doc.get('default_bank_account'):
-        bank_account = frappe.get_doc("Bank Account", company_doc.default_bank_account)
+        bank_account = get_master(masters, "Bank Account", company_doc.default_bank_account)
         ci.beneficiary_bank = bank_account.bank
         ci.swift_code = bank_account.swift_number if hasattr(bank_account, 'swift_number') else None
         ci.account_number = bank_account.bank_account_no
         ci.iban = bank_account.iban if hasattr(bank_account, 'iban') else None
 
-    # Insert and return
-    ci.insert(ignore_mandatory=True)
-    # frappe.db.commit()
+    return ci
 
-    return ci.name
+
+def get_master(masters, doctype, name):
+    if masters and (doctype, name) in masters:
+        return masters[(doctype, name)]
+    return frappe.get_doc(doctype, name)
 
 
 # ==================== GET ITEMS FROM SALES ORDER (for manual use) ====================
@@ -283,26 +304,27 @@ def get_items_from_sales_order(sales_order):
 
     so = frappe.get_doc("Sales Order", sales_order)
     items = []
+    item_attributes = get_item_attributes([item.item_code for item in so.items])
 
     for item in so.items:
         # Get item master
-        item_doc = frappe.get_doc("Item", item.item_code)
+        item_doc = item_attributes.get(item.item_code) or frappe._dict()
 
         # Calculate weights and volumes
-        weight_per_unit = flt(item_doc.weight_per_unit) if hasattr(item_doc, 'weight_per_unit') else 0
+        weight_per_unit = flt(item_doc.get('weight_per_unit'))
         net_weight = weight_per_unit * flt(item.qty)
         gross_weight = net_weight * 1.1
 
         volume_per_unit = 0
-        if hasattr(item_doc, 'volume_per_unit') and item_doc.volume_per_unit:
+        if item_doc.get('volume_per_unit'):
             volume_per_unit = flt(item_doc.volume_per_unit)
 
         items.append({
             "item_code": item.item_code,
             "item_name": item.item_name,
             "description": item.description or item.item_name,
-            "hs_code": item_doc.gst_hsn_code if hasattr(item_doc, 'gst_hsn_code') else "",
-            "country_of_origin": item_doc.country_of_origin if hasattr(item_doc, 'country_of_origin') else "",
+            "hs_code": item_doc.gst_hsn_code if 'gst_hsn_code' in item_doc else "",
+            "country_of_origin": item_doc.country_of_origin if 'country_of_origin' in item_doc else "",
             "qty": item.qty,
             "uom": item.uom,
             "rate": item.rate,
@@ -322,35 +344,61 @@ def get_items_from_sales_order(sales_order):
 def get_export_readiness(name):
     """
     Check export document readiness
-    Returns: status of all related documents
+    Returns: status of all related documents, from the Export Shipment Status row
     """
-    doc = frappe.get_doc("Commercial Invoice Export", name)
+    frappe.has_permission("Commercial Invoice Export", "read", name, throw=True)
+    return get_export_readiness_map([name]).get(name)
 
-    status = {
-        "commercial_invoice": {
-            "exists": True,
-            "submitted": doc.docstatus == 1,
-            "name": doc.name
-        },
-        "packing_list": check_doc_exists("Packing List Export", "commercial_invoice", name),
-        "certificate_of_origin": check_doc_exists("Certificate of Origin", "commercial_invoice", name),
-        "shipping_bill": check_doc_exists("Shipping Bill", "commercial_invoice", name),
-        "bill_of_lading": check_doc_exists("Bill of Lading", "commercial_invoice", name)
-    }
 
-    # Calculate completion
-    docs_ready = sum(1 for v in status.values() if v.get("submitted", False))
-    total_docs = len(status)
-    completion_percentage = (docs_ready / total_docs) * 100
+@frappe.whitelist()
+def get_export_readiness_bulk(names):
+    """Export readiness of many Commercial Invoices in one query: {name: readiness}"""
+    if isinstance(names, str):
+        names = frappe.parse_json(names)
+
+    permitted = set(frappe.get_list(
+        "Commercial Invoice Export", filters={"name": ["in", names]}, pluck="name", limit_page_length=0
+    )) if names else set()
+    return get_export_readiness_map([name for name in names if name in permitted])
+
+
+def get_export_readiness_map(names):
+    from import_export.import_export.shipment_status import get_shipment_status
+
+    readiness = {}
+    for name, row in get_shipment_status(names).items():
+        status = {
+            "commercial_invoice": {
+                "exists": True,
+                "submitted": row.commercial_invoice_docstatus == 1,
+                "name": name
+            },
+            "packing_list": get_document_status(row, "packing_list"),
+            "certificate_of_origin": get_document_status(row, "certificate_of_origin"),
+            "shipping_bill": get_document_status(row, "shipping_bill"),
+            "bill_of_lading": get_document_status(row, "bill_of_lading")
+        }
+
+        # Find missing documents
+        missing_documents = [k.replace("_", " ").title() for k, v in status.items() if not v.get("submitted", False)]
+
+        readiness[name] = {
+            "status": status,
+            "completion_percentage": flt(row.completion),
+            "missing_documents": missing_documents,
+            "is_ready": bool(row.is_ready)
+        }
+
+    return readiness
 
-    # Find missing documents
-    missing_documents = [k.replace("_", " ").title() for k, v in status.items() if not v.get("submitted", False)]
 
+def get_document_status(row, fieldname):
+    """Readiness entry of one chain document from an Export Shipment Status row"""
+    name = row.get(fieldname)
     return {
-        "status": status,
-        "completion_percentage": completion_percentage,
-        "missing_documents": missing_documents,
-        "is_ready": completion_percentage == 100
+        "exists": bool(name),
+        "submitted": bool(name) and row.get(fieldname + "_docstatus") == 1,
+        "name": name
     }
 
 
@@ -393,21 +441,21 @@ def create_next_document(commercial_invoice, doctype):
     if ci.docstatus != 1:
         frappe.throw(_("Commercial Invoice must be submitted first"))
 
-    # Route to the correct creation function
+    # Route to the correct creation function, handing over the loaded invoice
     if doctype == "Packing List Export":
         # Direct creation from CI (it will find Pick List internally)
-        from import_export.import_export.doctype.packing_list_export.packing_list_export import create_from_commercial_invoice
-        return create_from_commercial_invoice(commercial_invoice)
+        from import_export.import_export.doctype.packing_list_export.packing_list_export import create_packing_list
+        return create_packing_list(ci)
 
     elif doctype == "Certificate of Origin":
         # Direct creation from CI
-        from import_export.import_export.doctype.certificate_of_origin.certificate_of_origin import create_from_commercial_invoice
-        return create_from_commercial_invoice(commercial_invoice)
+        from import_export.import_export.doctype.certificate_of_origin.certificate_of_origin import create_certificate_of_origin
+        return create_certificate_of_origin(ci)
 
     elif doctype == "Shipping Bill":
         # Direct creation from CI
-        from import_export.import_export.doctype.shipping_bill.shipping_bill import create_from_commercial_invoice
-        return create_from_commercial_invoice(commercial_invoice)
+        from import_export.import_export.doctype.shipping_bill.shipping_bill import create_shipping_bill
+        return create_shipping_bill(ci)
 
     elif doctype == "Bill of Lading":
         # B/L needs Packing List - find or create it first
@@ -424,8 +472,8 @@ def create_next_document(commercial_invoice, doctype):
             ))
 
         # Create B/L from Packing List
-        from import_export.import_export.doctype.bill_of_lading.bill_of_lading import create_from_packing_list
-        return create_from_packing_list(packing_list)
+        from import_export.import_export.doctype.bill_of_lading.bill_of_lading import create_bill_of_lading
+        return create_bill_of_lading(frappe.get_doc("Packing List Export", packing_list), ci)
 
     else:
         frappe.throw(_("Unknown document type: {0}").format(doctype))
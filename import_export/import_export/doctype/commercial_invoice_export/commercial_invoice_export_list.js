@@ -0,0 +1,89 @@
+frappe.listview_settings['Commercial Invoice Export'] = {
+    onload: function(listview) {
+        listview.page.add_action_item(__('Generate Export Documents'), function() {
+            let invoices = listview.get_checked_items(true);
+            if (!invoices.length) {
+                frappe.msgprint(__('Select Commercial Invoices first'));
+                return;
+            }
+
+            frappe.confirm(
+                __('Create the missing Packing List, Certificate of Origin, Shipping Bill and Bill of Lading for {0} Commercial Invoices? Bills of Lading are created for invoices with a submitted Packing List.', [invoices.length]),
+                function() {
+                    frappe.call({
+                        method: 'import_export.import_export.export_chain.generate_export_documents',
+                        args: { commercial_invoices: invoices },
+                        freeze: true,
+                        callback: function(r) {
+                            if (r.message) track_export_chain(r.message.run_id, listview);
+                        }
+                    });
+                }
+            );
+        });
+    }
+};
+
+function track_export_chain(run_id, listview) {
+    frappe.call({
+        method: 'import_export.import_export.export_chain.get_chain_status',
+        args: { run_id: run_id },
+        callback: function(r) {
+            let status = r.message;
+            if (!status) return;
+
+            frappe.show_progress(__('Generating Export Documents'), status.processed, status.total || 1,
+                __('{0} of {1} Commercial Invoices', [status.processed, status.total]));
+
+            if (status.status === 'Running') {
+                setTimeout(() => track_export_chain(run_id, listview), 2000);
+            } else {
+                frappe.hide_progress();
+                show_export_chain_results(status);
+                listview.refresh();
+            }
+        }
+    });
+}
+
+function show_export_chain_results(status) {
+    const doctypes = ['Packing List Export', 'Certificate of Origin', 'Shipping Bill', 'Bill of Lading'];
+    const indicators = { Completed: 'green', Partial: 'blue', Skipped: 'orange', Failed: 'red' };
+
+    let rows = status.results.map(result => {
+        let cells = doctypes.map(doctype => {
+            let doc = (result.documents || {})[doctype];
+            if (!doc) return '<td></td>';
+            if (!doc.name) return `<td class="text-muted">${__(doc.action)}</td>`;
+            return `<td>${frappe.utils.get_form_link(doctype, doc.name, true)}
+                ${doc.action === 'Created' ? `<span class="text-muted">(${__('new')})</span>` : ''}</td>`;
+        }).join('');
+
+        return `<tr>
+            <td>${frappe.utils.get_form_link('Commercial Invoice Export', result.commercial_invoice, true)}</td>
+            <td><span class="indicator-pill ${indicators[result.status]}">${__(result.status)}</span></td>
+            ${cells}
+            <td>${frappe.utils.escape_html(result.message || '')}</td>
+        </tr>`;
+    }).join('');
+
+    let counts = status.counts || {};
+    let stalled = status.status === 'Stalled'
+        ? `<p class="text-danger">${__('Stopped after {0} of {1} Commercial Invoices: a background job did not finish. Select the remaining invoices and run it again.', [status.processed, status.total])}</p>`
+        : '';
+    frappe.msgprint({
+        title: __('Export Documents: {0} completed, {1} partial, {2} failed', [
+            counts.Completed || 0, counts.Partial || 0, counts.Failed || 0
+        ]),
+        message: `${stalled}<table class="table table-bordered table-condensed">
+            <thead><tr>
+                <th>${__('Commercial Invoice')}</th><th>${__('Status')}</th>
+                ${doctypes.map(doctype => `<th>${__(doctype)}</th>`).join('')}
+                <th>${__('Message')}</th>
+            </tr></thead>
+            <tbody>${rows}</tbody>
+        </table>`,
+        wide: true,
+        indicator: status.status === 'Stalled' ? 'red' : counts.Failed ? 'orange' : 'green'
+    });
+}
@@ -0,0 +1,8 @@
+// Copyright (c) 2026, gws and contributors
+// For license information, please see license.txt
+
+// frappe.ui.form.on("Export Shipment Status", {
+// 	refresh(frm) {
+
+// 	},
+// });
@@ -0,0 +1,16 @@
+frappe.listview_settings['Export Shipment Status'] = {
+    get_indicator: function(doc) {
+        if (doc.is_ready) return [__('Ready'), 'green', 'is_ready,=,1'];
+        return [__('{0}% Ready', [flt(doc.completion, 0)]), doc.completion >= 60 ? 'orange' : 'red', 'is_ready,=,0'];
+    },
+
+    onload: function(listview) {
+        if (!frappe.user.has_role('System Manager')) return;
+
+        listview.page.add_menu_item(__('Rebuild Status Table'), function() {
+            frappe.call({
+                method: 'import_export.import_export.shipment_status.rebuild_export_shipment_status'
+            });
+        });
+    }
+};
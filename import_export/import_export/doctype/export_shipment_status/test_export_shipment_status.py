@@ -0,0 +1,155 @@
+# Copyright (c) 2026, gws and Contributors
+# See license.txt
+
+from unittest.mock import patch
+
+import frappe
+from frappe.tests.utils import FrappeTestCase
+from frappe.utils import now
+
+from import_export.import_export.shipment_status import (
+	DOCUMENT_FIELDS,
+	STATUS_DOCTYPE,
+	rebuild_shipment_status,
+	update_invoice_status,
+	update_shipment_status,
+)
+
+COMMERCIAL_INVOICE = "_Test Shipment Status CI"
+
+
+class TestExportShipmentStatus(FrappeTestCase):
+	def setUp(self):
+		# Documents are written without their controllers; the tests fire the doc_events themselves
+		for doctype in DOCUMENT_FIELDS:
+			frappe.db.delete(doctype, {"commercial_invoice": COMMERCIAL_INVOICE})
+		frappe.db.delete("Commercial Invoice Export", {"name": COMMERCIAL_INVOICE})
+		frappe.db.delete(STATUS_DOCTYPE, {"name": COMMERCIAL_INVOICE})
+
+		self.invoice = self.insert({"doctype": "Commercial Invoice Export", "name": COMMERCIAL_INVOICE})
+
+	def insert(self, values):
+		timestamp = now()
+		doc = frappe.get_doc({
+			"docstatus": 0,
+			"creation": timestamp,
+			"modified": timestamp,
+			"owner": frappe.session.user,
+			"modified_by": frappe.session.user,
+			**values
+		})
+		doc.db_insert()
+		return doc
+
+	def make_document(self, doctype):
+		doc = self.insert({
+			"doctype": doctype,
+			"name": frappe.generate_hash(length=10),
+			"commercial_invoice": COMMERCIAL_INVOICE
+		})
+		update_shipment_status(doc, "on_update")
+		return doc
+
+	def set_docstatus(self, doc, docstatus, method):
+		frappe.db.set_value(doc.doctype, doc.name, "docstatus", docstatus, update_modified=False)
+		doc.docstatus = docstatus
+		if doc.doctype == "Commercial Invoice Export":
+			update_invoice_status(doc, method)
+		else:
+			update_shipment_status(doc, method)
+
+	def trash(self, doc):
+		update_shipment_status(doc, "on_trash")
+		frappe.db.delete(doc.doctype, {"name": doc.name})
+
+	def get_row(self):
+		return frappe.db.get_value(STATUS_DOCTYPE, COMMERCIAL_INVOICE, "*", as_dict=True)
+
+	def test_row_follows_submit_cancel_and_trash(self):
+		self.set_docstatus(self.invoice, 1, "on_submit")
+		row = self.get_row()
+		self.assertEqual(row.commercial_invoice_docstatus, 1)
+		self.assertEqual(row.completion, 20)
+
+		packing_list = self.make_document("Packing List Export")
+		row = self.get_row()
+		self.assertEqual(row.packing_list, packing_list.name)
+		self.assertEqual(row.packing_list_docstatus, 0)
+		self.assertEqual(row.completion, 20)
+
+		self.set_docstatus(packing_list, 1, "on_submit")
+		row = self.get_row()
+		self.assertEqual(row.packing_list_docstatus, 1)
+		self.assertEqual(row.completion, 40)
+
+		self.set_docstatus(packing_list, 2, "on_cancel")
+		row = self.get_row()
+		self.assertIsNone(row.packing_list)
+		self.assertEqual(row.packing_list_docstatus, 0)
+		self.assertEqual(row.completion, 20)
+
+		# A submitted document wins over a draft; trashing it falls back to the draft
+		draft = self.make_document("Packing List Export")
+		submitted = self.make_document("Packing List Export")
+		self.set_docstatus(submitted, 1, "on_submit")
+		self.assertEqual(self.get_row().packing_list, submitted.name)
+
+		self.set_docstatus(submitted, 2, "on_cancel")
+		self.trash(submitted)
+		row = self.get_row()
+		self.assertEqual(row.packing_list, draft.name)
+		self.assertEqual(row.packing_list_docstatus, 0)
+
+		self.trash(draft)
+		self.assertIsNone(self.get_row().packing_list)
+
+	def test_ready_when_every_document_is_submitted(self):
+		self.set_docstatus(self.invoice, 1, "on_submit")
+		documents = [self.make_document(doctype) for doctype in DOCUMENT_FIELDS]
+		for doc in documents[:-1]:
+			self.set_docstatus(doc, 1, "on_submit")
+
+		row = self.get_row()
+		self.assertEqual(row.completion, 80)
+		self.assertFalse(row.is_ready)
+
+		self.set_docstatus(documents[-1], 1, "on_submit")
+		row = self.get_row()
+		self.assertEqual(row.completion, 100)
+		self.assertTrue(row.is_ready)
+
+		self.set_docstatus(self.invoice, 2, "on_cancel")
+		row = self.get_row()
+		self.assertEqual(row.commercial_invoice_docstatus, 2)
+		self.assertFalse(row.is_ready)
+
+	def test_rebuild_matches_event_rows(self):
+		self.set_docstatus(self.invoice, 1, "on_submit")
+		packing_list = self.make_document("Packing List Export")
+		self.set_docstatus(packing_list, 1, "on_submit")
+		certificate = self.make_document("Certificate of Origin")
+		self.set_docstatus(certificate, 2, "on_cancel")
+		shipping_bill = self.make_document("Shipping Bill")
+		self.make_document("Bill of Lading")
+		self.set_docstatus(shipping_bill, 1, "on_submit")
+
+		fields = [
+			"commercial_invoice", "commercial_invoice_docstatus", "completion", "is_ready",
+			*DOCUMENT_FIELDS.values(), *(fieldname + "_docstatus" for fieldname in DOCUMENT_FIELDS.values())
+		]
+		from_events = {field: self.get_row()[field] for field in fields}
+
+		# The rebuild commits per chunk; keep the test inside its transaction
+		with patch.object(frappe.db, "commit"):
+			self.assertEqual(rebuild_shipment_status([COMMERCIAL_INVOICE]), 1)
+
+		rebuilt = {field: self.get_row()[field] for field in fields}
+		self.assertEqual(rebuilt, from_events)
+		self.assertEqual(rebuilt["completion"], 60)
+
+	def test_invoice_trash_removes_row(self):
+		update_invoice_status(self.invoice, "on_update")
+		self.assertTrue(frappe.db.exists(STATUS_DOCTYPE, COMMERCIAL_INVOICE))
+
+		update_invoice_status(self.invoice, "on_trash")
+		self.assertFalse(frappe.db.exists(STATUS_DOCTYPE, COMMERCIAL_INVOICE))
@@ -4,6 +4,10 @@ frappe.ui.form.on('Packing List Export', {
             frm.add_custom_button(__('View 3D Packing'), function() {
                 show_3d_visualization(frm);
             }, __('Tools'));
+
+            frm.add_custom_button(__('Plan Containers'), function() {
+                show_container_plan(frm);
+            }, __('Tools'));
         }
 
         if (frm.doc.docstatus === 1) {
@@ -28,45 +32,77 @@ frappe.ui.form.on('Packing List Export', {
     }
 });
 
-function show_3d_visualization(frm) {
-    let d = new frappe.ui.Dialog({
-        title: __('3D Packing Visualization'),
-                                 size: 'extra-large',
-                                 fields: [
-                                     {
-                                         fieldtype: 'HTML',
-                                         fieldname: 'visualization_html'
-                                     }
-                                 ]
+function show_container_plan(frm) {
+    frappe.call({
+        method: 'import_export.packing_system.container_allocation.plan_containers',
+        args: {
+            packing_list_name: frm.doc.name
+        },
+        callback: function(r) {
+            if (!r.message) return;
+            let rows = r.message.containers.map((c, idx) => `<tr>
+                <td>${idx + 1}</td><td>${c.container_size}</td><td>${c.no_of_packages}</td>
+                <td>${c.gross_weight}</td><td>${c.volume_cbm}</td>
+                <td>${c.volume_utilization}%</td><td>${c.weight_utilization}%</td>
+            </tr>`).join('');
+            frappe.msgprint({
+                title: __('Container Plan'),
+                message: `<table class="table table-bordered">
+                    <tr><th>#</th><th>${__('Size')}</th><th>${__('Packages')}</th><th>${__('Gross Weight')}</th>
+                    <th>${__('CBM')}</th><th>${__('Volume Used')}</th><th>${__('Payload Used')}</th></tr>
+                    ${rows}
+                </table>`,
+                wide: true
+            });
+        }
     });
+}
 
+function show_3d_visualization(frm) {
     // Get 3D data for first carton
     frappe.call({
-        method: 'import_export.packing_list_export.get_3d_visualization_data',
+        method: 'import_export.import_export.doctype.packing_list_export.packing_list_export.get_3d_visualization_data',
+        type: 'GET',
         args: {
             packing_list_name: frm.doc.name,
             carton_idx: 0
         },
+        freeze: true,
         callback: function(r) {
-            if (r.message) {
-                // Render 3D visualization
-                // (Reuse your existing 3D viewer component)
-                let html = `
-                <div id="packing-3d-viewer" style="width: 100%; height: 600px;">
-                <p>Loading 3D visualization...</p>
-                <p>Carton: ${r.message.carton.carton_name}</p>
-                <p>Total Patterns: ${r.message.total_patterns}</p>
-                </div>
-                `;
-                d.fields_dict.visualization_html.$wrapper.html(html);
-
-                // Initialize your 3D viewer here with r.message data
-                // window.render3DPacking(r.message);
+            if (!r.message || !r.message.patterns.length) {
+                frappe.msgprint(__('No 3D layout stored for this carton'));
+                return;
             }
+
+            // The visualizer bundle is only downloaded when a 3D view is opened
+            frappe.require('packing_visualizer.bundle.js', function() {
+                new import_export.visualizer.PackingVisualizer3D().init(get_visualizer_data(r.message));
+            });
         }
     });
+}
+
+function get_visualizer_data(data) {
+    let carton = data.carton || {};
+    let items = [];
+
+    Object.entries(data.patterns[0].positions_3d || {}).forEach(([item_code, positions]) => {
+        let info = data.item_info[item_code] || {};
+        (positions || []).forEach(p => {
+            items.push({
+                position: [p.x, p.y, p.z],
+                dimensions: [p.length, p.width, p.height],
+                color: info.color || '#3498db'
+            });
+        });
+    });
 
-    d.show();
+    return {
+        [carton.name || __('Carton')]: {
+            carton_dimensions: { length: carton.length, width: carton.width, height: carton.height },
+            items: items
+        }
+    };
 }
 
 function create_bill_of_lading_from_packing(frm) {
@@ -4,6 +4,10 @@ from frappe.model.document import Document
 from frappe.utils import flt
 import json
 
+from import_export.import_export.item_attributes import get_item_attributes
+from import_export.packing_system.packing_run import get_assignment_positions, get_inner_positions
+from import_export.packing_system.utils import conditional_response, get_catalog_version, replace_child_rows
+
 
 class PackingListExport(Document):
     def validate(self):
@@ -48,6 +52,9 @@ class PackingListExport(Document):
             items_per_pattern = flt(carton.items_per_carton)
             num_cartons = flt(carton.carton_count)
             total_items_this_pattern = items_per_pattern * num_cartons
+            if carton.get("shared_carton"):
+                # Consolidated carton shared with other orders: count only this order's units
+                total_items_this_pattern = flt(carton.total_items)
             
             self.total_quantity += total_items_this_pattern
             
@@ -94,7 +101,14 @@ def create_from_pick_list(pick_list_name, commercial_invoice):
     
     pick_list = frappe.get_doc("Pick List", pick_list_name)
     ci = frappe.get_doc("Commercial Invoice Export", commercial_invoice)
-    
+
+    return create_packing_list_from_pick_list(pick_list, ci)
+
+
+def create_packing_list_from_pick_list(pick_list, ci):
+    """Packing List for a loaded Commercial Invoice from a loaded Pick List's packing calculation"""
+    commercial_invoice = ci.name
+
     # Check if Pick List has packing calculations
     if not pick_list.get("carton_assignments"):
         frappe.throw(_("""Pick List does not have packing calculations. 
@@ -123,43 +137,111 @@ def create_from_pick_list(pick_list_name, commercial_invoice):
     packing_list.shipping_marks = ci.shipping_marks
     
     # Import carton assignments from Pick List
+    positions = get_assignment_positions(pick_list)
+    inner_positions = get_inner_positions(pick_list)
+    cartons = []
     for assignment in pick_list.carton_assignments:
-        carton_row = packing_list.append("cartons", {})
-        
-        carton_row.carton_id = assignment.carton_id
-        carton_row.carton_count = assignment.carton_count or 1
-        carton_row.items_per_carton = assignment.get("items_per_carton", 0)
-        carton_row.pattern_signature = assignment.get("pattern_signature", "")
-        carton_row.packing_efficiency = assignment.packing_efficiency or 0
-        carton_row.utilization = assignment.utilization or 0
-        
-        # Carton dimensions
-        carton_row.length = assignment.length
-        carton_row.width = assignment.width
-        carton_row.height = assignment.height
-        carton_row.weight_limit = assignment.weight_limit
-        carton_row.cost_per_unit = assignment.cost_per_unit
-        
-        # Costs and items
-        carton_row.total_cost = assignment.get("total_cost", 0)
-        carton_row.total_items = assignment.get("total_items", 0)
-        carton_row.item_summary = assignment.item_summary or ""
-        
-        # Copy 3D positions for visualization
-        if hasattr(assignment, 'positions_3d') and assignment.positions_3d:
-            carton_row.positions_3d = assignment.positions_3d
-    
+        cartons.append({
+            "carton_id": assignment.carton_id,
+            "carton_count": assignment.carton_count or 1,
+            "items_per_carton": assignment.get("items_per_carton", 0),
+            "pattern_signature": assignment.get("pattern_signature", ""),
+            "packing_efficiency": assignment.packing_efficiency or 0,
+            "utilization": assignment.utilization or 0,
+
+            # Carton dimensions
+            "length": assignment.length,
+            "width": assignment.width,
+            "height": assignment.height,
+            "weight_limit": assignment.weight_limit,
+            "cost_per_unit": assignment.cost_per_unit,
+
+            # Costs and items
+            "total_cost": assignment.get("total_cost", 0),
+            "total_items": assignment.get("total_items", 0),
+            "item_summary": assignment.item_summary or "",
+
+            # Copy 3D positions for visualization (kept on the Pick List's Packing Run)
+            "positions_3d": json.dumps(positions[assignment.idx]) if positions.get(assignment.idx) else "",
+
+            # Inner pack (nested packing)
+            "inner_carton_id": assignment.get("inner_carton_id"),
+            "inners_per_carton": assignment.get("inners_per_carton", 0),
+            "items_per_inner": assignment.get("items_per_inner", 0),
+            "inner_pattern_signature": assignment.get("inner_pattern_signature", ""),
+            "inner_positions_3d": (
+                json.dumps(inner_positions[assignment.idx]) if inner_positions.get(assignment.idx) else ""
+            )
+        })
+
     # Set container info if available
     if pick_list.get("fcl_lcl"):
         packing_list.fcl_lcl = pick_list.fcl_lcl
     if pick_list.get("container_size"):
         packing_list.container_size = pick_list.container_size
-    
-    packing_list.insert()
-    
+
+    insert_with_cartons(packing_list, cartons)
+
+    return packing_list.name
+
+
+@frappe.whitelist()
+def create_from_consolidation(plan_id, commercial_invoice):
+    """
+    Create Packing List Export from a consolidation plan (see packing_system.consolidation)
+    Takes the cartons allocated to the Commercial Invoice's Sales Order
+    """
+    from import_export.packing_system.consolidation import get_consolidation_plan
+
+    frappe.has_permission("Packing List Export", "create", throw=True)
+    frappe.has_permission("Commercial Invoice Export", "read", doc=commercial_invoice, throw=True)
+
+    ci = frappe.get_doc("Commercial Invoice Export", commercial_invoice)
+    plan = get_consolidation_plan(plan_id)
+
+    allocation = next((o for o in plan["orders"] if o["sales_order"] == ci.sales_order), None)
+    if not allocation:
+        frappe.throw(_("Sales Order {0} is not part of consolidation plan {1}").format(ci.sales_order, plan_id))
+
+    packing_list = frappe.new_doc("Packing List Export")
+    packing_list.company = ci.company
+    packing_list.commercial_invoice = ci.name
+    packing_list.sales_order = ci.sales_order
+    packing_list.packing_date = frappe.utils.today()
+    packing_list.fcl_lcl = "LCL (Less than Container Load)"
+
+    # Copy shipper/consignee details
+    packing_list.shipper_name = ci.exporter_name
+    packing_list.shipper_address = ci.exporter_address
+    packing_list.consignee_name = ci.customer_name
+    packing_list.consignee_address = ci.consignee_address
+
+    # Copy shipping info
+    packing_list.port_of_loading = ci.port_of_loading
+    packing_list.port_of_discharge = ci.port_of_discharge
+    packing_list.vessel_flight_no = ci.vessel_flight_no
+    packing_list.shipping_marks = ci.shipping_marks
+
+    insert_with_cartons(packing_list, allocation["cartons"])
+
     return packing_list.name
 
 
+def insert_with_cartons(packing_list, cartons):
+    """
+    Insert a new Packing List Export, writing its carton rows in one multi-row INSERT
+    (hundreds of patterns would otherwise be one INSERT each), then store the totals
+    """
+    packing_list.insert()
+
+    replace_child_rows(packing_list, "cartons", cartons)
+    packing_list.calculate_totals()
+    packing_list.set_carton_numbers()
+    packing_list.db_update()
+
+    return packing_list
+
+
 @frappe.whitelist()
 def get_3d_visualization_data(packing_list_name, carton_idx=0):
     """
@@ -168,7 +250,16 @@ def get_3d_visualization_data(packing_list_name, carton_idx=0):
     """
     if not frappe.has_permission("Packing List Export", "read", packing_list_name):
         frappe.throw(_("Not permitted to view this Packing List"))
-    
+
+    return conditional_response(
+        lambda: build_3d_visualization_data(packing_list_name, carton_idx),
+        "Packing List Export 3D", packing_list_name, carton_idx,
+        frappe.db.get_value("Packing List Export", packing_list_name, "modified"),
+        get_catalog_version()
+    )
+
+
+def build_3d_visualization_data(packing_list_name, carton_idx=0):
     packing_list = frappe.get_doc("Packing List Export", packing_list_name)
     carton_idx = int(carton_idx)
     
@@ -202,31 +293,58 @@ def get_3d_visualization_data(packing_list_name, carton_idx=0):
         except Exception as e:
             frappe.log_error(f"Failed to parse 3D positions: {str(e)}")
     
-    # Get item information
+    # Nested packing: the master holds inner cartons, shown as boxes with their own item layout
+    inner_pattern = None
     item_info = {}
-    if patterns and patterns[0]["positions_3d"]:
-        for item_code in patterns[0]["positions_3d"].keys():
-            try:
-                item_doc = frappe.get_doc("Item", item_code)
-                item_info[item_code] = {
-                    "name": item_doc.item_name,
-                    "length": getattr(item_doc, 'length', 10),
-                    "width": getattr(item_doc, 'width', 10),
-                    "height": getattr(item_doc, 'height', 10),
-                    "color": get_item_color(item_code)
-                }
-            except:
-                continue
-    
+    if selected_carton.get("inner_carton_id"):
+        inner_carton = frappe.db.get_value(
+            "Carton", selected_carton.inner_carton_id, ["name", "length", "width", "height"], as_dict=True
+        ) or {}
+        for inner_id in (patterns[0]["positions_3d"].keys() if patterns else []):
+            item_info[inner_id] = {
+                "name": selected_carton.inner_carton_id,
+                "length": inner_carton.get("length"),
+                "width": inner_carton.get("width"),
+                "height": inner_carton.get("height"),
+                "color": "#c8a165"
+            }
+
+        inner_positions = json.loads(selected_carton.inner_positions_3d) if selected_carton.inner_positions_3d else {}
+        inner_pattern = {
+            "carton": inner_carton,
+            "positions_3d": inner_positions,
+            "inners_per_carton": selected_carton.inners_per_carton,
+            "items_per_inner": selected_carton.items_per_inner,
+            "pattern_signature": selected_carton.inner_pattern_signature,
+            "item_info": get_item_info(inner_positions.keys())
+        }
+    elif patterns and patterns[0]["positions_3d"]:
+        item_info = get_item_info(patterns[0]["positions_3d"].keys())
+
     return {
         "carton": carton_info,
         "patterns": patterns,
         "item_info": item_info,
+        "inner_pattern": inner_pattern,
         "total_patterns": len(patterns),
         "show_multiple": False  # Only showing one pattern per carton type in export
     }
 
 
+def get_item_info(item_codes):
+    """Dimensions and colours of the items in a 3D layout"""
+    return {
+        item_code: {
+            "name": item_doc.item_name,
+            "length": item_doc.get('length', 10),
+            "width": item_doc.get('width', 10),
+            "height": item_doc.get('height', 10),
+            "color": get_item_color(item_code)
+        }
+        for item_code, item_doc in get_item_attributes(list(item_codes)).items()
+    }
+
+
 def get_item_color(item_code):
     """Generate consistent color for item"""
     colors = [
@@ -298,6 +416,12 @@ def create_from_commercial_invoice(commercial_invoice):
     """
 
     ci = frappe.get_doc("Commercial Invoice Export", commercial_invoice)
+    return create_packing_list(ci)
+
+
+def create_packing_list(ci):
+    """Packing List for a loaded, submitted Commercial Invoice (see create_from_commercial_invoice)"""
+    commercial_invoice = ci.name
 
     # Check if CI is submitted
     if ci.docstatus != 1:
@@ -330,8 +454,8 @@ def create_from_commercial_invoice(commercial_invoice):
 
     # Check if Pick List has packing calculations
     if pick_list and pick_list.get("carton_assignments") and len(pick_list.carton_assignments) > 0:
-        # Use the existing create_from_pick_list function
-        return create_from_pick_list(pick_list.name, commercial_invoice)
+        # Use the existing create_from_pick_list flow
+        return create_packing_list_from_pick_list(pick_list, ci)
 
     # No Pick List or no packing data - create basic Packing List
     frappe.msgprint(
@@ -0,0 +1,64 @@
+# Copyright (c) 2026, gws and Contributors
+# See license.txt
+
+from unittest.mock import patch
+
+import frappe
+from frappe.tests.utils import FrappeTestCase
+from frappe.utils import add_days, now_datetime
+
+from import_export.packing_system.packing_run import prune_packing_runs
+
+PICK_LIST = "_Test Packing Run Pick List"
+
+
+class TestPackingRun(FrappeTestCase):
+	def setUp(self):
+		frappe.db.set_single_value("Packing Settings", "packing_run_retention_days", 30)
+
+		self.old_linked = self.make_run(days_ago=60)
+		self.old_unlinked = self.make_run(days_ago=60)
+		self.recent = self.make_run(days_ago=1)
+
+		frappe.db.delete("Pick List", {"name": PICK_LIST})
+		frappe.get_doc({
+			"doctype": "Pick List",
+			"name": PICK_LIST,
+			"packing_run": self.old_linked,
+		}).db_insert()
+
+	def make_run(self, days_ago):
+		timestamp = add_days(now_datetime(), -days_ago)
+		run = frappe.get_doc({
+			"doctype": "Packing Run",
+			"name": frappe.generate_hash(length=10),
+			"reference_doctype": "Pick List",
+			"reference_name": PICK_LIST,
+			"strategy": "minimize_cartons",
+			"result": "{}",
+			"creation": timestamp,
+			"modified": timestamp,
+			"owner": frappe.session.user,
+			"modified_by": frappe.session.user,
+		})
+		run.db_insert()
+		return run.name
+
+	def prune(self):
+		# Pruning commits per batch; keep the test inside its transaction
+		with patch.object(frappe.db, "commit"):
+			prune_packing_runs()
+
+	def test_prune_keeps_runs_linked_from_pick_lists(self):
+		self.prune()
+
+		self.assertTrue(frappe.db.exists("Packing Run", self.old_linked))
+		self.assertFalse(frappe.db.exists("Packing Run", self.old_unlinked))
+		self.assertTrue(frappe.db.exists("Packing Run", self.recent))
+
+	def test_prune_disabled_without_retention(self):
+		frappe.db.set_single_value("Packing Settings", "packing_run_retention_days", 0)
+		self.prune()
+
+		for run in (self.old_linked, self.old_unlinked, self.recent):
+			self.assertTrue(frappe.db.exists("Packing Run", run))
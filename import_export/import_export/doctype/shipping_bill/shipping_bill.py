@@ -210,6 +210,12 @@ def create_from_commercial_invoice(commercial_invoice):
     """Create Shipping Bill from Commercial Invoice"""
 
     ci = frappe.get_doc("Commercial Invoice Export", commercial_invoice)
+    return create_shipping_bill(ci)
+
+
+def create_shipping_bill(ci):
+    """Shipping Bill for a loaded, submitted Commercial Invoice"""
+    commercial_invoice = ci.name
 
     # Check if CI is submitted
     if ci.docstatus != 1:
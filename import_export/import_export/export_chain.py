@@ -0,0 +1,216 @@
+"""
+Export document chain for a batch of Commercial Invoices
+
+`generate_export_documents` (Commercial Invoice list action) creates every
+missing document of the chain for many submitted invoices in background
+jobs: Packing List, Certificate of Origin and Shipping Bill from the
+invoice, then the Bill of Lading once the invoice has a submitted Packing
+List. The invoices are split into chunks, one job per chunk; each job reads
+the existing documents of its chunk with one query per doctype and loads
+every invoice once for its whole chain. Each invoice's chain is committed or
+rolled back on its own. Per-invoice results are appended to a Redis list,
+so parallel jobs report into the same status; a run whose jobs stop making
+progress is reported as stalled.
+"""
+
+import json
+import time
+
+import frappe
+from frappe import _
+from frappe.utils import flt, now_datetime
+
+from import_export.import_export.doctype.bill_of_lading.bill_of_lading import create_bill_of_lading
+from import_export.import_export.doctype.certificate_of_origin.certificate_of_origin import (
+    create_certificate_of_origin,
+)
+from import_export.import_export.doctype.packing_list_export.packing_list_export import create_packing_list
+from import_export.import_export.doctype.shipping_bill.shipping_bill import create_shipping_bill
+
+# Chain in dependency order; the Bill of Lading is made from the submitted Packing List
+CHAIN_DOCTYPES = ["Packing List Export", "Certificate of Origin", "Shipping Bill", "Bill of Lading"]
+CHAIN_PREFIX = "import_export:export_chain:"
+CHAIN_TTL = 24 * 60 * 60
+CHUNK_SIZE = 25
+MAX_INVOICES = 2000
+# A running chain without a processed invoice for this long is reported as Stalled
+STALL_TIMEOUT = 60 * 60
+
+
+@frappe.whitelist()
+def generate_export_documents(commercial_invoices, doctypes=None):
+    """Queue chain generation for a list of Commercial Invoices; returns the run status"""
+    frappe.has_permission("Commercial Invoice Export", "read", throw=True)
+
+    if isinstance(commercial_invoices, str):
+        commercial_invoices = json.loads(commercial_invoices)
+    commercial_invoices = list(dict.fromkeys(name for name in commercial_invoices or [] if name))
+    if not commercial_invoices:
+        frappe.throw(_("Select at least one Commercial Invoice"))
+    if len(commercial_invoices) > MAX_INVOICES:
+        frappe.throw(_("Select at most {0} Commercial Invoices at a time").format(MAX_INVOICES))
+    for name in commercial_invoices:
+        frappe.has_permission("Commercial Invoice Export", "read", doc=name, throw=True)
+
+    if isinstance(doctypes, str):
+        doctypes = json.loads(doctypes)
+    doctypes = [doctype for doctype in CHAIN_DOCTYPES if not doctypes or doctype in doctypes]
+    for doctype in doctypes:
+        frappe.has_permission(doctype, "create", throw=True)
+
+    run_id = frappe.generate_hash(length=10)
+    frappe.cache().set_value(_key(run_id), {
+        "status": "Running",
+        "started": str(now_datetime()),
+        "total": len(commercial_invoices),
+        "doctypes": doctypes,
+        "user": frappe.session.user
+    }, expires_in_sec=CHAIN_TTL)
+    frappe.cache().set_value(_key(run_id, "updated"), time.time(), expires_in_sec=CHAIN_TTL)
+
+    for i in range(0, len(commercial_invoices), CHUNK_SIZE):
+        frappe.enqueue(
+            "import_export.import_export.export_chain.process_chain_chunk",
+            queue="long",
+            timeout=3600,
+            job_id=f"export_chain:{run_id}:{i // CHUNK_SIZE}",
+            enqueue_after_commit=True,
+            run_id=run_id,
+            commercial_invoices=commercial_invoices[i:i + CHUNK_SIZE],
+            doctypes=doctypes
+        )
+
+    return get_chain_status(run_id)
+
+
+def process_chain_chunk(run_id, commercial_invoices, doctypes=None):
+    cache = frappe.cache()
+    results_key = _key(run_id, "results")
+    existing = get_existing_documents(commercial_invoices)
+
+    for name in commercial_invoices:
+        result = build_export_chain(name, existing.get(name, {}), doctypes)
+        cache.rpush(results_key, json.dumps(result))
+        cache.expire(cache.make_key(results_key), CHAIN_TTL)
+        cache.set_value(_key(run_id, "updated"), time.time(), expires_in_sec=CHAIN_TTL)
+
+    meta = cache.get_value(_key(run_id)) or {}
+    if meta.get("status") == "Running" and cache.llen(results_key) >= int(meta.get("total") or 0):
+        meta.update({"status": "Completed", "completed": str(now_datetime())})
+        cache.set_value(_key(run_id), meta, expires_in_sec=CHAIN_TTL)
+        frappe.publish_realtime("export_chain_completed", get_chain_status(run_id), user=meta.get("user"))
+
+
+def get_existing_documents(commercial_invoices):
+    """{commercial invoice: {doctype: {name, docstatus}}} of the non-cancelled chain documents"""
+    existing = {}
+    for doctype in CHAIN_DOCTYPES:
+        for row in frappe.get_all(
+            doctype,
+            filters={"commercial_invoice": ["in", commercial_invoices], "docstatus": ["!=", 2]},
+            fields=["name", "commercial_invoice", "docstatus"],
+            order_by="docstatus desc, creation desc"
+        ):
+            # A submitted document wins over a draft one
+            existing.setdefault(row.commercial_invoice, {}).setdefault(doctype, row)
+
+    return existing
+
+
+def build_export_chain(commercial_invoice, existing, doctypes=None):
+    """
+    Create the missing chain documents of one invoice in a single transaction
+    Returns {commercial_invoice, status (Completed / Partial / Skipped / Failed), documents, message}
+    documents: {doctype: {name, action (Created / Exists / Pending)}}
+    """
+    doctypes = doctypes or CHAIN_DOCTYPES
+    result = {"commercial_invoice": commercial_invoice, "status": None, "documents": {}, "message": None}
+
+    try:
+        ci = frappe.get_doc("Commercial Invoice Export", commercial_invoice)
+        if ci.docstatus != 1:
+            result.update({"status": "Skipped", "message": _("Commercial Invoice must be submitted first")})
+            return result
+
+        for doctype in doctypes:
+            if existing.get(doctype):
+                result["documents"][doctype] = {"name": existing[doctype].name, "action": "Exists"}
+            elif doctype == "Bill of Lading":
+                packing_list = existing.get("Packing List Export")
+                if not packing_list or packing_list.docstatus != 1:
+                    result["documents"][doctype] = {"name": None, "action": "Pending"}
+                    result["message"] = _("Bill of Lading waits for the Packing List to be submitted")
+                    continue
+                pl = frappe.get_doc("Packing List Export", packing_list.name)
+                result["documents"][doctype] = {"name": create_bill_of_lading(pl, ci), "action": "Created"}
+            else:
+                result["documents"][doctype] = {"name": create_document(doctype, ci), "action": "Created"}
+
+        frappe.db.commit()
+    except Exception as e:
+        frappe.db.rollback()
+        frappe.log_error(
+            title=f"Export document chain failed: {commercial_invoice}",
+            reference_doctype="Commercial Invoice Export",
+            reference_name=commercial_invoice
+        )
+        result.update({"status": "Failed", "documents": {}, "message": str(e)})
+        return result
+    finally:
+        # Creators show form alerts, which are of no use in a background job
+        frappe.local.message_log = []
+
+    pending = any(d["action"] == "Pending" for d in result["documents"].values())
+    result["status"] = "Partial" if pending else "Completed"
+    return result
+
+
+def create_document(doctype, ci):
+    if doctype == "Packing List Export":
+        return create_packing_list(ci)
+    if doctype == "Certificate of Origin":
+        return create_certificate_of_origin(ci)
+    if doctype == "Shipping Bill":
+        return create_shipping_bill(ci)
+
+    frappe.throw(_("Unknown document type: {0}").format(doctype))
+
+
+@frappe.whitelist()
+def get_chain_status(run_id):
+    """Progress and per-invoice results of a chain generation run"""
+    cache = frappe.cache()
+    meta = cache.get_value(_key(run_id))
+    if not meta:
+        return None
+    if meta.get("user") != frappe.session.user and "System Manager" not in frappe.get_roles():
+        frappe.throw(_("Not permitted"), frappe.PermissionError)
+
+    results = [json.loads(_decode(r)) for r in cache.lrange(_key(run_id, "results"), 0, -1) or []]
+    counts = {}
+    for result in results:
+        counts[result["status"]] = counts.get(result["status"], 0) + 1
+
+    status = meta.get("status")
+    if status == "Running" and time.time() - flt(cache.get_value(_key(run_id, "updated"))) > STALL_TIMEOUT:
+        # A chunk job died (worker killed, timeout), so the run can never complete
+        status = "Stalled"
+
+    return {
+        "run_id": run_id,
+        "status": status,
+        "started": meta.get("started"),
+        "completed": meta.get("completed"),
+        "total": meta.get("total"),
+        "processed": len(results),
+        "counts": counts,
+        "results": results
+    }
+
+
+def _key(run_id, suffix=""):
+    return CHAIN_PREFIX + run_id + (":" + suffix if suffix else "")
+
+
+def _decode(value):
+    return value.decode() if isinstance(value, bytes) else value
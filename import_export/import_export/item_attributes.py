@@ -0,0 +1,95 @@
+"""
+Item master attributes for export documents
+
+Export documents need a handful of Item fields per line (HS code, origin,
+weights, dimensions). `get_item_attributes` loads them for all item codes
+of a document in one query, memoized for the rest of the request, with a
+shared Redis tier in front of the database that is invalidated when an Item
+changes. Fields missing from the Item doctype on a site are left out of the
+returned dicts, so `attrs.get(field, default)` behaves like getattr on the
+Item document.
+"""
+
+import pickle
+from functools import partial
+
+import frappe
+
+ITEM_ATTRIBUTE_FIELDS = [
+    "item_name", "gst_hsn_code", "country_of_origin", "weight_per_unit", "volume_per_unit",
+    "length", "width", "height", "area", "fragile", "orientation_constraint"
+]
+CACHE_PREFIX = "import_export:item_attributes:"
+# Bounds staleness after bulk updates that skip document hooks (data import with hooks off, SQL)
+CACHE_TTL = 6 * 60 * 60
+
+
+def get_item_attributes(item_codes, shared=True):
+    """{item_code: frappe._dict of ITEM_ATTRIBUTE_FIELDS} for the given codes; unknown items are left out"""
+    if not hasattr(frappe.local, "item_attributes"):
+        frappe.local.item_attributes = {}
+    memo = frappe.local.item_attributes
+    wanted = {code for code in item_codes if code} - set(memo)
+
+    if wanted and shared:
+        memo.update(_get_shared(wanted))
+        wanted -= set(memo)
+
+    if wanted:
+        fields = get_attribute_fields()
+        loaded = {
+            row.name: frappe._dict({field: row.get(field) for field in fields})
+            for row in frappe.get_all(
+                "Item", filters={"name": ["in", list(wanted)]}, fields=["name", *fields]
+            )
+        }
+        memo.update(loaded)
+        if shared and loaded:
+            _set_shared(loaded)
+
+    return {code: memo[code] for code in item_codes if code in memo}
+
+
+def get_attribute_fields():
+    meta = frappe.get_meta("Item")
+    return [field for field in ITEM_ATTRIBUTE_FIELDS if meta.has_field(field)]
+
+
+def invalidate_item_attributes(doc, method=None, *args):
+    """Item on_update / on_trash / after_rename (called with old name, new name, merge)"""
+    names = [doc.name]
+    if method == "after_rename" and args:
+        names.append(args[0])
+
+    memo = getattr(frappe.local, "item_attributes", None) or {}
+    for name in names:
+        memo.pop(name, None)
+    _delete_shared(names)
+    # Deleting now is not enough: until the commit, other requests still read the old
+    # row and this transaction may read its own uncommitted one, and either can put
+    # it back in the shared tier. Delete again once the transaction ends.
+    frappe.db.after_commit.add(partial(_delete_shared, names))
+    frappe.db.after_rollback.add(partial(_delete_shared, names))
+
+
+def _delete_shared(names):
+    frappe.cache().delete_value([CACHE_PREFIX + name for name in names])
+
+
+def _get_shared(item_codes):
+    """One MGET for all codes; values use RedisWrapper.set_value's pickled encoding"""
+    cache = frappe.cache()
+    codes = list(item_codes)
+    values = cache.mget([cache.make_key(CACHE_PREFIX + code) for code in codes])
+    return {
+        code: frappe._dict(pickle.loads(value))
+        for code, value in zip(codes, values) if value is not None
+    }
+
+
+def _set_shared(attributes):
+    cache = frappe.cache()
+    pipe = cache.pipeline()
+    for code, values in attributes.items():
+        pipe.set(cache.make_key(CACHE_PREFIX + code), pickle.dumps(dict(values)), ex=CACHE_TTL)
+    pipe.execute()
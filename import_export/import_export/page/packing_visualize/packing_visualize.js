@@ -1,4 +1,4 @@
-// Load Three.js and OrbitControls from app's public folder
+// Three.js and OrbitControls come from the visualizer bundle, loaded on demand
 
 // Global variables for 3D scene management
 window.packing_3d_cleanup = null;
@@ -10,10 +10,10 @@ function loadThreeJS(callback) {
 		return;
 	}
 
-	// Load Three.js from app public folder
-	frappe.require('/assets/import_export/js/libs/three.min.js', function() {
-		// Load OrbitControls from app public folder
-		frappe.require('/assets/import_export/js/libs/OrbitControls.js', callback);
+	// Bundle name resolves to the hashed (versioned, cacheable) build through assets.json
+	frappe.require('packing_visualizer.bundle.js', function() {
+		window.THREE = import_export.visualizer.THREE;
+		callback();
 	});
 }
 
@@ -44,6 +44,8 @@ frappe.pages['packing-visualize'].on_page_load = function(wrapper) {
 	}, 'Refresh', 'octicon octicon-sync');
 	// Create layout
 	createPackingLayout(page, pick_list);
+	// Fetch the 3D engine while the packing data loads
+	loadThreeJS(function() {});
 	// Load initial data
 	loadPackingData();
 };
@@ -139,6 +141,8 @@ function createPackingLayout(page, pick_list) {
 function loadPackingData() {
 	frappe.call({
 		method: 'import_export.packing_system.pick_list_packing.get_pick_list_packing_data',
+		// GET, so the browser revalidates its copy with the ETag instead of downloading it again
+		type: 'GET',
 		args: {
 			pick_list_name: window.packing_pick_list
 		},
@@ -415,35 +419,242 @@ function loadVisualization() {
 	</div>
 	`);
 
-	frappe.call({
-		method: 'import_export.packing_system.pick_list_packing.get_pick_list_3d_data',
-		args: {
-			pick_list_name: window.packing_pick_list,
-			carton_idx: window.packing_current_carton
-		},
-		callback: function(r) {
-			if (r.message) {
-				window.packing_visualization_data = r.message;
-				console.log('3D data received:', r.message);
-
-				// Show pattern info if available
-				if (r.message.pattern_info && r.message.pattern_info.carton_count > 1) {
-					var msg = `Showing 1 carton pattern (repeats ${r.message.pattern_info.carton_count} times)`;
-					frappe.show_alert({
-						message: msg,
-						indicator: 'blue'
-					}, 5);
-				}
+	var carton_idx = window.packing_current_carton;
 
-				renderVisualization();
-			} else {
-				showError('No visualization data available');
+	// Patterns already in the geometry cache render without a server round trip
+	getCachedVisualizationData(carton_idx).then(function(cached) {
+		if (carton_idx !== window.packing_current_carton) return;
+		if (cached) {
+			window.packing_visualization_data = cached;
+			renderVisualization();
+			prefetchNeighbourPatterns(carton_idx);
+			return;
+		}
+
+		frappe.call({
+			method: 'import_export.packing_system.pick_list_packing.get_pick_list_3d_data',
+			// GET, so the browser revalidates its copy with the ETag instead of downloading it again
+			type: 'GET',
+			args: {
+				pick_list_name: window.packing_pick_list,
+				carton_idx: carton_idx
+			},
+			callback: function(r) {
+				if (r.message) {
+					cachePatterns(r.message.patterns, r.message.item_info);
+					if (carton_idx !== window.packing_current_carton) return;
+
+					window.packing_visualization_data = r.message;
+
+					// Show pattern info if available
+					if (r.message.pattern_info && r.message.pattern_info.carton_count > 1) {
+						var msg = `Showing 1 carton pattern (repeats ${r.message.pattern_info.carton_count} times)`;
+						frappe.show_alert({
+							message: msg,
+							indicator: 'blue'
+						}, 5);
+					}
+
+					renderVisualization();
+					prefetchNeighbourPatterns(carton_idx);
+				} else {
+					showError('No visualization data available');
+				}
+			},
+			error: function(err) {
+				console.error('Visualization API error:', err);
+				showError('Error loading visualization data: ' + (err.message || 'Unknown error'));
 			}
-		},
-		error: function(err) {
-			console.error('Visualization API error:', err);
-			showError('Error loading visualization data: ' + (err.message || 'Unknown error'));
+		});
+	});
+}
+
+// Persistent cache of pattern geometry (positions and item info) keyed by pattern signature.
+// A signature identifies one layout of one item in one carton, so entries never go stale and
+// are shared by every Pick List using the pattern. Least recently used entries are evicted
+// past MAX_ENTRIES / MAX_BYTES. Without IndexedDB every lookup misses and the server is used.
+var PatternGeometryCache = {
+	DB_NAME: 'import_export_packing',
+	STORE: 'pattern_geometry',
+	MAX_ENTRIES: 500,
+	MAX_BYTES: 50 * 1024 * 1024,
+	_db: null,
+
+	open: function() {
+		if (!this._db) {
+			this._db = new Promise(function(resolve) {
+				if (!window.indexedDB) return resolve(null);
+				var request = indexedDB.open(PatternGeometryCache.DB_NAME, 1);
+				request.onupgradeneeded = function() {
+					var store = request.result.createObjectStore(PatternGeometryCache.STORE, { keyPath: 'signature' });
+					store.createIndex('last_used', 'last_used');
+				};
+				request.onsuccess = function() { resolve(request.result); };
+				request.onerror = function() { resolve(null); };
+			});
 		}
+		return this._db;
+	},
+
+	get_many: function(signatures) {
+		return this.open().then(function(db) {
+			if (!db || !signatures.length) return {};
+			return new Promise(function(resolve) {
+				var found = {};
+				var tx = db.transaction(PatternGeometryCache.STORE, 'readwrite');
+				var store = tx.objectStore(PatternGeometryCache.STORE);
+				signatures.forEach(function(signature) {
+					var request = store.get(signature);
+					request.onsuccess = function() {
+						var entry = request.result;
+						if (!entry) return;
+						found[signature] = entry.geometry;
+						entry.last_used = Date.now();
+						store.put(entry);
+					};
+				});
+				tx.oncomplete = function() { resolve(found); };
+				tx.onerror = tx.onabort = function() { resolve(found); };
+			});
+		});
+	},
+
+	put_many: function(entries) {
+		var self = this;
+		return this.open().then(function(db) {
+			var signatures = Object.keys(entries);
+			if (!db || !signatures.length) return;
+			return new Promise(function(resolve) {
+				var tx = db.transaction(self.STORE, 'readwrite');
+				var store = tx.objectStore(self.STORE);
+				var now = Date.now();
+				signatures.forEach(function(signature) {
+					store.put({
+						signature: signature,
+						geometry: entries[signature],
+						size: JSON.stringify(entries[signature]).length,
+						last_used: now
+					});
+				});
+				tx.oncomplete = tx.onerror = tx.onabort = function() { resolve(); };
+			}).then(function() { return self.evict(db); });
+		});
+	},
+
+	evict: function(db) {
+		var self = this;
+		return new Promise(function(resolve) {
+			var tx = db.transaction(self.STORE, 'readwrite');
+			var store = tx.objectStore(self.STORE);
+			var entries = [];
+			// Newest first, so everything past the limits is the least recently used
+			store.index('last_used').openCursor(null, 'prev').onsuccess = function(event) {
+				var cursor = event.target.result;
+				if (cursor) {
+					entries.push({ signature: cursor.value.signature, size: cursor.value.size || 0 });
+					cursor.continue();
+					return;
+				}
+				var bytes = 0;
+				entries.forEach(function(entry, idx) {
+					bytes += entry.size;
+					if (idx >= self.MAX_ENTRIES || bytes > self.MAX_BYTES) {
+						store.delete(entry.signature);
+					}
+				});
+			};
+			tx.oncomplete = tx.onerror = tx.onabort = function() { resolve(); };
+		});
+	}
+};
+
+function getPatternAssignments(carton_idx) {
+	// Patterns shown for a carton: every assignment of the same carton type (as get_pick_list_3d_data)
+	var assignments = (window.packing_data && window.packing_data.carton_assignments) || [];
+	var selected = assignments[carton_idx];
+	if (!selected) return [];
+	return assignments.filter(function(a) { return a.carton_id === selected.carton_id; });
+}
+
+function getCachedVisualizationData(carton_idx) {
+	var assignments = getPatternAssignments(carton_idx);
+	var signatures = assignments.map(function(a) { return a.pattern_signature; });
+	if (!assignments.length || signatures.some(function(signature) { return !signature; })) {
+		return Promise.resolve(null);
+	}
+
+	return PatternGeometryCache.get_many(signatures).then(function(found) {
+		if (signatures.some(function(signature) { return !found[signature]; })) return null;
+
+		var item_info = {};
+		var patterns = assignments.map(function(a) {
+			var geometry = found[a.pattern_signature];
+			Object.assign(item_info, geometry.item_info);
+			return {
+				positions_3d: geometry.positions_3d,
+				carton_count: a.carton_count,
+				items_per_carton: geometry.items_per_carton,
+				pattern_signature: a.pattern_signature,
+				efficiency: a.efficiency
+			};
+		});
+
+		return {
+			carton: assignments[0].carton,
+			patterns: patterns,
+			item_info: item_info,
+			total_patterns: patterns.length,
+			show_multiple: patterns.length > 1
+		};
+	});
+}
+
+function cachePatterns(patterns, item_info) {
+	var entries = {};
+	(patterns || []).forEach(function(pattern) {
+		if (!pattern.pattern_signature || !pattern.positions_3d) return;
+		var pattern_item_info = {};
+		Object.keys(pattern.positions_3d).forEach(function(item_code) {
+			if (item_info && item_info[item_code]) pattern_item_info[item_code] = item_info[item_code];
+		});
+		entries[pattern.pattern_signature] = {
+			positions_3d: pattern.positions_3d,
+			items_per_carton: pattern.items_per_carton,
+			efficiency: pattern.efficiency,
+			item_info: pattern_item_info
+		};
+	});
+	return PatternGeometryCache.put_many(entries);
+}
+
+function prefetchNeighbourPatterns(carton_idx) {
+	// Fetch the geometry of the next and previous cartons in the background, in one request
+	var assignments = (window.packing_data && window.packing_data.carton_assignments) || [];
+	var signatures = [];
+	[carton_idx + 1, carton_idx - 1, carton_idx + 2].forEach(function(idx) {
+		getPatternAssignments(idx).forEach(function(a) {
+			if (a.pattern_signature && signatures.indexOf(a.pattern_signature) === -1) {
+				signatures.push(a.pattern_signature);
+			}
+		});
+	});
+	if (!signatures.length || !assignments.length) return;
+
+	var schedule = window.requestIdleCallback || function(fn) { setTimeout(fn, 200); };
+	schedule(function() {
+		PatternGeometryCache.get_many(signatures).then(function(found) {
+			var missing = signatures.filter(function(signature) { return !found[signature]; });
+			if (!missing.length) return;
+
+			frappe.xcall('import_export.packing_system.pick_list_packing.get_pattern_geometry', {
+				pick_list_name: window.packing_pick_list,
+				signatures: missing
+			}).then(function(geometry) {
+				PatternGeometryCache.put_many(geometry || {});
+			}).catch(function() {
+				// Prefetch is best effort; the carton loads normally when selected
+			});
+		});
 	});
 }
 
@@ -0,0 +1,219 @@
+"""
+Export Shipment Status: one row per Commercial Invoice
+
+Holds the name and docstatus of each invoice's Packing List, Certificate of
+Origin, Shipping Bill and Bill of Lading, plus completion and readiness, so
+export readiness for many invoices is a single query on this table instead
+of one query per document type and invoice. Rows are named after the invoice
+and kept current by the doc_events of the invoice and its documents (see
+hooks.py); only the column of the document that changed is recomputed.
+`rebuild_shipment_status` recreates rows from the documents themselves,
+from the `rebuild-shipment-status` bench command or the whitelisted method.
+"""
+
+import frappe
+from frappe import _
+from frappe.utils import now
+
+STATUS_DOCTYPE = "Export Shipment Status"
+
+# Chain document -> column prefix on the status row
+DOCUMENT_FIELDS = {
+    "Packing List Export": "packing_list",
+    "Certificate of Origin": "certificate_of_origin",
+    "Shipping Bill": "shipping_bill",
+    "Bill of Lading": "bill_of_lading",
+}
+INVOICE_FIELDS = ["company", "customer", "invoice_date"]
+REBUILD_CHUNK_SIZE = 1000
+
+
+def update_shipment_status(doc, method=None):
+    """doc_events of the chain documents: on_update (covers insert), on_submit, on_cancel, on_trash"""
+    if frappe.flags.in_install or frappe.flags.in_migrate:
+        return
+
+    invoices = {doc.get("commercial_invoice")}
+    if method == "on_update":
+        if not doc.has_value_changed("commercial_invoice"):
+            return
+        before = doc.get_doc_before_save()
+        if before:
+            invoices.add(before.get("commercial_invoice"))
+
+    exclude = doc.name if method == "on_trash" else None
+    for commercial_invoice in filter(None, invoices):
+        refresh_shipment_status(commercial_invoice, [doc.doctype], exclude=exclude)
+
+
+def update_invoice_status(doc, method=None):
+    """Commercial Invoice Export doc_events: on_update, on_submit, on_cancel, on_trash"""
+    if frappe.flags.in_install or frappe.flags.in_migrate:
+        return
+
+    if method == "on_trash":
+        frappe.db.delete(STATUS_DOCTYPE, {"name": doc.name})
+        return
+
+    values = {field: doc.get(field) for field in INVOICE_FIELDS}
+    values["commercial_invoice_docstatus"] = doc.docstatus
+    save_status_row(doc.name, values)
+
+
+def refresh_shipment_status(commercial_invoice, doctypes=None, exclude=None):
+    """Recompute the document columns (all by default) of one invoice's row from the documents"""
+    values = {}
+    for doctype in doctypes or DOCUMENT_FIELDS:
+        set_document(values, DOCUMENT_FIELDS[doctype], get_document(doctype, commercial_invoice, exclude))
+
+    save_status_row(commercial_invoice, values)
+
+
+def get_document(doctype, commercial_invoice, exclude=None):
+    """Name and docstatus of the invoice's document; a submitted one wins over a draft, a newer over an older"""
+    filters = {"commercial_invoice": commercial_invoice, "docstatus": ["!=", 2]}
+    if exclude:
+        filters["name"] = ["!=", exclude]
+    return frappe.db.get_value(
+        doctype, filters, ["name", "docstatus"], as_dict=True, order_by="docstatus desc, creation desc"
+    )
+
+
+def save_status_row(commercial_invoice, values):
+    row = frappe.db.get_value(STATUS_DOCTYPE, commercial_invoice, "*", as_dict=True)
+    if not row:
+        insert_status_row(commercial_invoice, values)
+        return
+
+    row.update(values)
+    set_readiness(row)
+    changed = {field: row[field] for field in [*values, "completion", "is_ready"]}
+    frappe.db.set_value(STATUS_DOCTYPE, commercial_invoice, changed)
+
+
+def insert_status_row(commercial_invoice, values):
+    invoice = frappe.db.get_value(
+        "Commercial Invoice Export", commercial_invoice, ["name", "docstatus", *INVOICE_FIELDS], as_dict=True
+    )
+    if not invoice:
+        return
+
+    # First event for this invoice: fill every column, then apply the event's own values
+    row = new_status_row(invoice)
+    for doctype, fieldname in DOCUMENT_FIELDS.items():
+        if fieldname not in values:
+            set_document(row, fieldname, get_document(doctype, commercial_invoice))
+    row.update(values)
+    set_readiness(row)
+
+    try:
+        frappe.get_doc({"doctype": STATUS_DOCTYPE, **row}).insert(ignore_permissions=True)
+    except frappe.DuplicateEntryError:
+        # Inserted meanwhile by a concurrent event
+        save_status_row(commercial_invoice, values)
+
+
+def new_status_row(invoice):
+    row = frappe._dict({
+        "name": invoice.name,
+        "commercial_invoice": invoice.name,
+        "commercial_invoice_docstatus": invoice.docstatus,
+        **{field: invoice.get(field) for field in INVOICE_FIELDS}
+    })
+    for fieldname in DOCUMENT_FIELDS.values():
+        set_document(row, fieldname, None)
+    return row
+
+
+def set_document(row, fieldname, document):
+    row[fieldname] = document.name if document else None
+    row[fieldname + "_docstatus"] = document.docstatus if document else 0
+
+
+def set_readiness(row):
+    submitted = int(row.get("commercial_invoice_docstatus") == 1) + sum(
+        1 for fieldname in DOCUMENT_FIELDS.values()
+        if row.get(fieldname) and row.get(fieldname + "_docstatus") == 1
+    )
+    total = len(DOCUMENT_FIELDS) + 1
+    row["completion"] = 100 * submitted / total
+    row["is_ready"] = 1 if submitted == total else 0
+
+
+def get_shipment_status(commercial_invoices):
+    """{commercial invoice: status row} in one query; rows missing for an invoice are built first"""
+    commercial_invoices = list(commercial_invoices)
+    rows = {
+        row.name: row for row in frappe.get_all(
+            STATUS_DOCTYPE, filters={"name": ["in", commercial_invoices]}, fields=["*"]
+        )
+    } if commercial_invoices else {}
+
+    for commercial_invoice in set(commercial_invoices) - set(rows):
+        refresh_shipment_status(commercial_invoice)
+        row = frappe.db.get_value(STATUS_DOCTYPE, commercial_invoice, "*", as_dict=True)
+        if row:
+            rows[commercial_invoice] = row
+
+    return rows
+
+
+def rebuild_shipment_status(commercial_invoices=None):
+    """Recreate the status rows (all, or those of the given invoices) from the documents; returns the row count"""
+    filters = {"name": ["in", commercial_invoices]} if commercial_invoices is not None else {}
+    invoices = frappe.get_all(
+        "Commercial Invoice Export", filters=filters, fields=["name", "docstatus", *INVOICE_FIELDS], order_by="name"
+    )
+
+    fields = None
+    for i in range(0, len(invoices), REBUILD_CHUNK_SIZE):
+        chunk = invoices[i:i + REBUILD_CHUNK_SIZE]
+        names = [invoice.name for invoice in chunk]
+        rows = {invoice.name: new_status_row(invoice) for invoice in chunk}
+
+        for doctype, fieldname in DOCUMENT_FIELDS.items():
+            # Ascending order, so a submitted / newer document overwrites a draft / older one
+            for document in frappe.get_all(
+                doctype,
+                filters={"commercial_invoice": ["in", names], "docstatus": ["!=", 2]},
+                fields=["name", "commercial_invoice", "docstatus"],
+                order_by="docstatus asc, creation asc"
+            ):
+                set_document(rows[document.commercial_invoice], fieldname, document)
+
+        timestamp = now()
+        for row in rows.values():
+            set_readiness(row)
+            row.update({
+                "creation": timestamp, "modified": timestamp,
+                "owner": frappe.session.user, "modified_by": frappe.session.user
+            })
+
+        fields = fields or list(next(iter(rows.values())))
+        frappe.db.delete(STATUS_DOCTYPE, {"name": ["in", names]})
+        frappe.db.bulk_insert(STATUS_DOCTYPE, fields, [[row[field] for field in fields] for row in rows.values()])
+        frappe.db.commit()
+
+    if commercial_invoices is None:
+        # Rows of deleted invoices
+        frappe.db.sql("""
+            delete from `tabExport Shipment Status`
+            where name not in (select name from `tabCommercial Invoice Export`)
+        """)
+        frappe.db.commit()
+
+    return len(invoices)
+
+
+@frappe.whitelist()
+def rebuild_export_shipment_status():
+    """Queue a full rebuild of the Export Shipment Status table (System Manager)"""
+    frappe.only_for("System Manager")
+    frappe.enqueue(
+        "import_export.import_export.shipment_status.rebuild_shipment_status",
+        queue="long",
+        timeout=3600,
+        job_id="rebuild_export_shipment_status",
+        deduplicate=True
+    )
+    frappe.msgprint(_("Export Shipment Status rebuild has been queued"), alert=True)
@@ -0,0 +1,41 @@
+# Copyright (c) 2026, gws and Contributors
+# See license.txt
+
+import frappe
+from frappe.tests.utils import FrappeTestCase
+
+from import_export.import_export.item_attributes import get_item_attributes
+
+
+class TestItemAttributes(FrappeTestCase):
+	def setUp(self):
+		if frappe.db.exists("Item", "_Test Item Attributes"):
+			self.item = frappe.get_doc("Item", "_Test Item Attributes")
+			self.item.db_set("item_name", "_Test Item Attributes")
+		else:
+			self.item = frappe.get_doc({
+				"doctype": "Item",
+				"item_code": "_Test Item Attributes",
+				"item_name": "_Test Item Attributes",
+				"item_group": "All Item Groups",
+				"stock_uom": "Nos",
+				"is_stock_item": 0,
+			}).insert()
+		if hasattr(frappe.local, "item_attributes"):
+			del frappe.local.item_attributes
+
+	def test_memoized_on_frappe_local(self):
+		attributes = get_item_attributes([self.item.name, "_Test Missing Item"], shared=False)
+
+		self.assertEqual(list(attributes), [self.item.name])
+		self.assertEqual(attributes[self.item.name].item_name, "_Test Item Attributes")
+		self.assertIs(frappe.local.item_attributes[self.item.name], attributes[self.item.name])
+
+	def test_item_update_drops_memo(self):
+		get_item_attributes([self.item.name], shared=False)
+
+		self.item.item_name = "_Test Item Attributes Renamed"
+		self.item.save()
+
+		attributes = get_item_attributes([self.item.name], shared=False)
+		self.assertEqual(attributes[self.item.name].item_name, "_Test Item Attributes Renamed")
@@ -0,0 +1,300 @@
+"""
+Carton catalog design from historical shipments
+
+Offline analysis used by `bench recommend-cartons`: mines the packing inputs
+of historical Pick Lists (see replay.py for the corpus format) and searches
+for a carton catalog that lowers total packaging cost and carton count
+across the corpus. The result is a list of cartons to add to and remove from
+the Carton doctype with the projected savings.
+
+Item groups pack independently of each other in suggest_cartons, so the
+corpus is folded into distinct (item geometry, quantity) demands and the cost
+of a demand is cached per subset of cartons the item actually fits in.
+Adding a carton that an item can't use is therefore free to evaluate.
+"""
+
+import math
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, List, Optional, Tuple
+
+from .core.calculator import ORIENTATION_ALL, PackingCalculator
+from .core.carton_mix import prune_dominated, solve_mix
+from .core.optimizer import PackingOptimizer
+from .main_controller import PackingController
+
+# Units per carton tried when generating candidate carton sizes for an item
+CANDIDATE_PACK_SIZES = (4, 6, 8, 12, 16, 24, 36, 48)
+UNPACKED_PENALTY = 1000
+
+_worker_state = {}
+
+
+def build_demands(corpus: Dict) -> List[Dict]:
+    """Fold corpus profiles into distinct item-group demands with occurrence counts"""
+    optimizer = PackingOptimizer()
+    demands = {}
+
+    for profile in corpus["profiles"]:
+        items = [{**entry["item"], "qty": entry["quantity"]} for entry in profile["items_data"]]
+        for group in optimizer.group_similar_items(items):
+            sample = group["sample_item"]
+            mask = sample.get("orientation_mask", ORIENTATION_ALL)
+            dims = (sample["length"], sample["width"], sample["height"])
+            key = (
+                tuple(sorted(dims)) if mask == ORIENTATION_ALL else dims,
+                sample.get("weight", 0), sample.get("volume", 0), sample.get("fragile", False),
+                mask, group["total_qty"]
+            )
+            if key not in demands:
+                demands[key] = {
+                    "item": {k: v for k, v in sample.items() if k != "qty"},
+                    "qty": group["total_qty"],
+                    "occurrences": 0
+                }
+            demands[key]["occurrences"] += 1
+
+    return list(demands.values())
+
+
+def estimate_cost_rate(cartons: List[Dict]) -> float:
+    """Cost per unit of board area, least squares through the origin over the catalog"""
+    num = den = 0
+    for carton in cartons:
+        area = surface_area(carton["length"], carton["width"], carton["height"])
+        num += area * (carton.get("cost_per_unit") or 0)
+        den += area * area
+    return num / den if den else 0
+
+
+def surface_area(length: float, width: float, height: float) -> float:
+    return 2 * (length * width + length * height + width * height)
+
+
+def generate_candidates(demands: List[Dict], cartons: List[Dict], max_candidates: int = 40) -> List[Dict]:
+    """Propose carton sizes that hold common items in tight grid arrangements"""
+    if not cartons:
+        return []
+
+    max_length = max(c["length"] for c in cartons)
+    max_width = max(c["width"] for c in cartons)
+    max_height = max(c["height"] for c in cartons)
+    weight_limit = max((c.get("weight_limit") or 0) for c in cartons)
+    cost_rate = estimate_cost_rate(cartons)
+    existing = {(c["length"], c["width"], c["height"]) for c in cartons}
+
+    # Items that move the most volume first
+    ranked = sorted(
+        demands,
+        key=lambda d: -(d["item"].get("volume") or 0) * d["qty"] * d["occurrences"]
+    )
+
+    candidates = {}
+    for demand in ranked:
+        item = demand["item"]
+        for units in CANDIDATE_PACK_SIZES:
+            dims = best_grid_dimensions(item, units)
+            if not dims:
+                continue
+
+            length, width, height = (math.ceil(d) for d in dims)
+            if length > max_length or width > max_width or height > max_height:
+                continue
+            if (length, width, height) in existing or (length, width, height) in candidates:
+                continue
+
+            carton_id = f"NEW-{length}x{width}x{height}"
+            candidates[(length, width, height)] = {
+                "id": carton_id,
+                "carton_name": carton_id,
+                "disabled": False,
+                "length": length,
+                "width": width,
+                "height": height,
+                "volume": length * width * height,
+                "weight_limit": weight_limit,
+                "cost_per_unit": round(cost_rate * surface_area(length, width, height), 2),
+                "carton_type": "Standard Box",
+                "material": "Cardboard",
+                "fragile_safe": False,
+                "uom": cartons[0].get("uom") or "cm"
+            }
+
+            if len(candidates) >= max_candidates:
+                return list(candidates.values())
+
+    return list(candidates.values())
+
+
+def best_grid_dimensions(item: Dict, units: int) -> Optional[Tuple[float, float, float]]:
+    """Smallest-surface box holding `units` items in an a x b x c grid"""
+    # Rotation-restricted items keep their axes, so the box is only valid as (length, width, height)
+    free = item.get("orientation_mask", ORIENTATION_ALL) == ORIENTATION_ALL
+    dims = [item["length"], item["width"], item["height"]]
+    if free:
+        dims.sort(reverse=True)
+    if not all(dims):
+        return None
+
+    best, best_area = None, None
+    for a in range(1, units + 1):
+        if units % a:
+            continue
+        for b in range(1, units // a + 1):
+            if (units // a) % b:
+                continue
+            c = units // a // b
+            box = [a * dims[0], b * dims[1], c * dims[2]]
+            if free:
+                box.sort(reverse=True)
+            area = surface_area(*box)
+            if best_area is None or area < best_area:
+                best, best_area = tuple(box), area
+
+    return best
+
+
+def _init_worker(demands, cartons_by_id, fit_table, strategy):
+    _worker_state.update({
+        "demands": demands,
+        "cartons_by_id": cartons_by_id,
+        "fit_table": fit_table,
+        "viable": [frozenset(fits) for fits in fit_table],
+        "strategy": strategy,
+        "cache": {},
+        "controller": PackingController()
+    })
+
+
+def _evaluate_set(carton_ids) -> Dict:
+    """Total cost, cartons and unpacked units of the corpus packed with the given catalog"""
+    state = _worker_state
+    carton_ids = frozenset(carton_ids)
+    totals = {"total_cost": 0.0, "total_cartons": 0, "unpacked_units": 0}
+
+    for idx, demand in enumerate(state["demands"]):
+        usable = state["viable"][idx] & carton_ids
+
+        if state["strategy"] == "minimize_cost":
+            # Capacity-only: the group cost is the exact carton mix over (capacity, cost)
+            options = tuple(sorted(state["fit_table"][idx][c] for c in usable))
+            options = tuple(options[i] for i in prune_dominated(options))
+            key = (options, demand["qty"])
+        else:
+            key = (idx, usable)
+
+        if key not in state["cache"]:
+            if usable and state["strategy"] == "minimize_cost":
+                counts = solve_mix(options, demand["qty"])
+                state["cache"][key] = (
+                    sum(count * cost for count, (_, cost) in zip(counts, options)),
+                    sum(counts),
+                    0
+                )
+            elif usable:
+                result = state["controller"].suggest_cartons(
+                    items_data=[{"item": demand["item"], "quantity": demand["qty"]}],
+                    cartons_data=[state["cartons_by_id"][c] for c in sorted(usable)],
+                    strategy=state["strategy"],
+                    enable_3d=False
+                )
+                state["cache"][key] = (
+                    result["total_cost"],
+                    result["total_cartons"],
+                    sum(u["quantity"] for u in result["unpacked_items"])
+                )
+            else:
+                state["cache"][key] = (0.0, 0, demand["qty"])
+
+        cost, count, unpacked = state["cache"][key]
+        totals["total_cost"] += cost * demand["occurrences"]
+        totals["total_cartons"] += count * demand["occurrences"]
+        totals["unpacked_units"] += unpacked * demand["occurrences"]
+
+    return totals
+
+
+class CatalogDesigner:
+    """Local search over carton catalogs (add one / remove one per step)"""
+
+    def __init__(self, corpus: Dict, strategy: str = "minimize_cost", carton_weight: float = 0.0,
+                 workers: int = 1, max_candidates: int = 40, max_iterations: int = 10):
+        self.corpus = corpus
+        self.strategy = strategy
+        self.carton_weight = carton_weight
+        self.workers = workers
+        self.max_candidates = max_candidates
+        self.max_iterations = max_iterations
+
+    def objective(self, totals: Dict) -> float:
+        return (
+            totals["total_cost"]
+            + self.carton_weight * totals["total_cartons"]
+            + UNPACKED_PENALTY * totals["unpacked_units"]
+        )
+
+    def _evaluate(self, executor, carton_sets) -> List[Dict]:
+        if executor:
+            chunksize = max(1, len(carton_sets) // (self.workers * 4))
+            return list(executor.map(_evaluate_set, carton_sets, chunksize=chunksize))
+        return [_evaluate_set(carton_set) for carton_set in carton_sets]
+
+    def recommend(self) -> Dict:
+        catalog = self.corpus["cartons"]
+        demands = build_demands(self.corpus)
+        candidates = generate_candidates(demands, catalog, self.max_candidates)
+        cartons_by_id = {c["id"]: c for c in catalog + candidates}
+
+        # demand -> {carton id: (units per carton, cost per carton)} for cartons it fits in
+        calculator = PackingCalculator()
+        fit_table = []
+        for demand in demands:
+            fits = {}
+            for carton_id, carton in cartons_by_id.items():
+                if demand["item"].get("fragile") and not carton.get("fragile_safe"):
+                    continue
+                capacity = calculator.max_units_fit(demand["item"], carton)
+                if capacity > 0:
+                    fits[carton_id] = (capacity, float(carton.get("cost_per_unit") or 0))
+            fit_table.append(fits)
+
+        init_args = (demands, cartons_by_id, fit_table, self.strategy)
+        executor = None
+        if self.workers > 1:
+            executor = ProcessPoolExecutor(max_workers=self.workers, initializer=_init_worker, initargs=init_args)
+        else:
+            _init_worker(*init_args)
+
+        try:
+            baseline_ids = frozenset(c["id"] for c in catalog)
+            current_ids = baseline_ids
+            baseline = current = self._evaluate(executor, [current_ids])[0]
+
+            for _ in range(self.max_iterations):
+                moves = [current_ids - {c} for c in current_ids if len(current_ids) > 1]
+                moves += [current_ids | {c} for c in cartons_by_id if c not in current_ids]
+                if not moves:
+                    break
+
+                evaluated = self._evaluate(executor, moves)
+                best_move, best_totals = min(zip(moves, evaluated), key=lambda m: self.objective(m[1]))
+                if self.objective(best_totals) >= self.objective(current) - 1e-9:
+                    break
+
+                current_ids, current = best_move, best_totals
+        finally:
+            if executor:
+                executor.shutdown()
+
+        return {
+            "profiles": len(self.corpus["profiles"]),
+            "demands": len(demands),
+            "candidates_evaluated": len(candidates),
+            "baseline": baseline,
+            "recommended": current,
+            "additions": [cartons_by_id[c] for c in sorted(current_ids - baseline_ids)],
+            "removals": sorted(baseline_ids - current_ids),
+            "projected_savings": {
+                "total_cost": baseline["total_cost"] - current["total_cost"],
+                "total_cartons": baseline["total_cartons"] - current["total_cartons"]
+            }
+        }
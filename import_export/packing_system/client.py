@@ -0,0 +1,100 @@
+"""
+Thin client for the standalone packing service (see service.py)
+"""
+
+import http.client
+import json
+import socket
+from typing import Dict, List
+from urllib.parse import urlparse
+
+from .core.calculator import PackingCalculator
+
+
+class PackingServiceUnavailable(Exception):
+    """Raised when the packing service can't be reached or answers garbage"""
+
+
+class UnixHTTPConnection(http.client.HTTPConnection):
+    def __init__(self, socket_path: str, timeout: float):
+        super().__init__("localhost", timeout=timeout)
+        self.socket_path = socket_path
+
+    def connect(self):
+        self.sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        self.sock.settimeout(self.timeout)
+        self.sock.connect(self.socket_path)
+
+
+class PackingServiceClient:
+    """Calls `suggest_cartons` on a running packing service"""
+
+    # Catalog versions this process has already shipped to the service
+    known_catalogs = set()
+
+    def __init__(self, url: str, timeout: float = 30):
+        self.url = url
+        self.timeout = timeout
+        self.target = urlparse(url)
+
+    def suggest_cartons(self, items_data: List[Dict], cartons_data: List[Dict],
+                        strategy: str = "minimize_cartons", enable_3d: bool = True) -> Dict:
+        catalog_version = PackingCalculator.create_catalog_signature(cartons_data)
+        payload = {
+            "items_data": items_data,
+            "catalog_version": catalog_version,
+            "strategy": strategy,
+            "enable_3d": bool(enable_3d)
+        }
+
+        # Only send the catalog when the service hasn't seen it yet
+        if catalog_version not in self.known_catalogs:
+            payload["cartons_data"] = cartons_data
+
+        status, body = self._post("/pack", payload)
+
+        if status == 409 and body.get("catalog_unknown"):
+            payload["cartons_data"] = cartons_data
+            status, body = self._post("/pack", payload)
+
+        if status == 400 and body.get("type") == "ValueError":
+            raise ValueError(body.get("error"))
+
+        if status != 200 or "result" not in body:
+            raise PackingServiceUnavailable(f"Packing service error {status}: {body.get('error')}")
+
+        self.known_catalogs.add(catalog_version)
+        return body["result"]
+
+    def is_healthy(self) -> bool:
+        try:
+            status, body = self._request("GET", "/health")
+        except PackingServiceUnavailable:
+            return False
+        return status == 200 and body.get("status") == "ok"
+
+    def _post(self, path: str, payload: Dict):
+        return self._request("POST", path, json.dumps(payload, default=str))
+
+    def _request(self, method: str, path: str, body: str = None):
+        conn = self._connect()
+        try:
+            headers = {"Content-Type": "application/json"} if body is not None else {}
+            conn.request(method, path, body=body, headers=headers)
+            response = conn.getresponse()
+            return response.status, json.loads(response.read() or b"{}")
+        except (OSError, http.client.HTTPException, ValueError) as e:
+            raise PackingServiceUnavailable(str(e)) from e
+        finally:
+            conn.close()
+
+    def _connect(self):
+        if self.target.scheme == "unix":
+            return UnixHTTPConnection(self.target.path, self.timeout)
+
+        if self.target.scheme == "http":
+            return http.client.HTTPConnection(
+                self.target.hostname or "127.0.0.1", self.target.port or 8790, timeout=self.timeout
+            )
+
+        raise PackingServiceUnavailable(f"Unsupported packing service url: {self.url}")
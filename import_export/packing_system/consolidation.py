@@ -0,0 +1,165 @@
+"""
+LCL consolidation packing
+
+Packs several export Sales Orders (or the Pick Lists made for them) for one
+consignee as a single shipment, then splits the cartons back per order with
+ConsolidationAllocator. The plan is kept in the cache under a plan id so the
+per-order allocations can be pulled into Packing List Export with
+`create_from_consolidation`, by the user who made the plan only.
+"""
+
+import frappe
+from frappe import _
+from frappe.utils import sbool
+
+from .core.consolidation import ConsolidationAllocator
+from .pick_list_packing import get_available_cartons, get_packing_items, run_packing
+
+PLAN_CACHE_PREFIX = "import_export:consolidation_plan:"
+PLAN_TTL = 24 * 60 * 60
+
+
+def get_order_lines(sales_orders=None, pick_lists=None):
+    """(order, item_code, qty) lines in the given order sequence, read in one query per doctype"""
+    if pick_lists:
+        docstatus = dict(frappe.get_all(
+            "Pick List", filters={"name": ["in", pick_lists]}, fields=["name", "docstatus"], as_list=True
+        ))
+        for name in pick_lists:
+            if name not in docstatus:
+                frappe.throw(_("Pick List {0} not found").format(name))
+            if docstatus[name] == 2:
+                frappe.throw(_("Pick List {0} is cancelled").format(name))
+
+        rows = frappe.get_all(
+            "Pick List Item",
+            filters={"parent": ["in", pick_lists], "parenttype": "Pick List"},
+            fields=["parent", "sales_order", "item_code", "qty"],
+            order_by="idx asc"
+        )
+        sequence = {name: idx for idx, name in enumerate(pick_lists)}
+        rows.sort(key=lambda r: sequence[r.parent])
+        lines = [frappe._dict(order=r.sales_order, item_code=r.item_code, qty=int(r.qty or 0)) for r in rows]
+    else:
+        rows = frappe.get_all(
+            "Sales Order Item",
+            filters={"parent": ["in", sales_orders], "parenttype": "Sales Order"},
+            fields=["parent", "item_code", "qty", "delivered_qty"],
+            order_by="idx asc"
+        )
+        sequence = {name: idx for idx, name in enumerate(sales_orders)}
+        rows.sort(key=lambda r: sequence[r.parent])
+        lines = [
+            frappe._dict(order=r.parent, item_code=r.item_code, qty=int((r.qty or 0) - (r.delivered_qty or 0)))
+            for r in rows
+        ]
+
+    for line in lines:
+        if not line.order:
+            frappe.throw(_("Pick List row for {0} is not linked to a Sales Order").format(line.item_code))
+
+    return [line for line in lines if line.qty > 0]
+
+
+def validate_orders(sales_orders):
+    """Consolidated orders must be submitted export orders of one customer"""
+    orders = frappe.get_all(
+        "Sales Order",
+        filters={"name": ["in", sales_orders]},
+        fields=["name", "docstatus", "customer", "gst_category"]
+    )
+    found = {order.name for order in orders}
+    missing = [name for name in sales_orders if name not in found]
+    if missing:
+        frappe.throw(_("Sales Order not found: {0}").format(", ".join(missing)))
+
+    for order in orders:
+        if order.docstatus != 1:
+            frappe.throw(_("Sales Order {0} must be submitted").format(order.name))
+        if order.gst_category != "Overseas":
+            frappe.throw(_("Sales Order {0} is not an export order").format(order.name))
+        if not frappe.has_permission("Sales Order", "read", order.name):
+            frappe.throw(_("Not permitted to access Sales Order {0}").format(order.name))
+
+    customers = {order.customer for order in orders}
+    if len(customers) > 1:
+        frappe.throw(_("Only orders of one customer can be consolidated, found: {0}").format(", ".join(sorted(customers))))
+
+    return customers.pop()
+
+
+@frappe.whitelist()
+def plan_consolidation(sales_orders=None, pick_lists=None, strategy="minimize_cartons", enable_3d=False):
+    """
+    Pack export Sales Orders (or their Pick Lists) jointly and allocate cartons per order
+    3D positions are off by default; a plan for hundreds of orders stays small that way
+    """
+    sales_orders = frappe.parse_json(sales_orders) or []
+    pick_lists = frappe.parse_json(pick_lists) or []
+    enable_3d = sbool(enable_3d)
+
+    if not sales_orders and not pick_lists:
+        frappe.throw(_("Select Sales Orders or Pick Lists to consolidate"))
+
+    lines = get_order_lines(sales_orders=sales_orders, pick_lists=pick_lists)
+    if not lines:
+        frappe.throw(_("Nothing left to pack in the selected documents"))
+
+    order_names = list(dict.fromkeys(line.order for line in lines))
+    customer = validate_orders(order_names)
+
+    # One engine entry per item across all orders
+    totals = {}
+    for line in lines:
+        totals[line.item_code] = totals.get(line.item_code, 0) + line.qty
+    items_data = get_packing_items([
+        frappe._dict(item_code=item_code, qty=qty) for item_code, qty in totals.items()
+    ])
+    items_by_code = {entry["item"]["id"]: entry["item"] for entry in items_data}
+
+    cartons_data = get_available_cartons()
+    if not cartons_data:
+        frappe.throw(_("No cartons available for packing"))
+
+    result = run_packing(items_data, cartons_data, strategy=strategy, enable_3d=enable_3d)
+
+    allocations = ConsolidationAllocator().allocate(
+        result,
+        [(line.order, items_by_code[line.item_code], line.qty) for line in lines]
+    )
+
+    plan_id = frappe.generate_hash(length=12)
+    plan = {
+        "plan_id": plan_id,
+        "user": frappe.session.user,
+        "customer": customer,
+        "strategy": result["strategy_used"],
+        "total_cartons": result["total_cartons"],
+        "total_cost": result["total_cost"],
+        "orders": []
+    }
+
+    for order in order_names:
+        allocation = allocations[order]
+        plan["orders"].append({
+            "sales_order": order,
+            "total_cartons": sum(row["carton_count"] for row in allocation["cartons"]),
+            "shared_cartons": sum(1 for row in allocation["cartons"] if row["shared_carton"]),
+            "total_cost": sum(row["total_cost"] for row in allocation["cartons"]),
+            "cartons": allocation["cartons"],
+            "unpacked": allocation["unpacked"]
+        })
+
+    frappe.cache().set_value(PLAN_CACHE_PREFIX + plan_id, plan, expires_in_sec=PLAN_TTL)
+
+    return plan
+
+
+def get_consolidation_plan(plan_id):
+    """A cached plan; only the user who made it can use it"""
+    plan = frappe.cache().get_value(PLAN_CACHE_PREFIX + plan_id)
+    if not plan:
+        frappe.throw(_("Consolidation plan {0} has expired, please plan the shipment again").format(plan_id))
+    if plan.get("user") != frappe.session.user:
+        frappe.throw(_("Consolidation plan {0} was made by another user").format(plan_id), frappe.PermissionError)
+    return plan
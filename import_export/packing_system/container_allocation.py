@@ -0,0 +1,175 @@
+"""
+Container allocation for Bill of Lading
+
+Spreads the cartons of a Packing List Export over the shipment's containers
+with ContainerAllocator, so each B/L container row carries the packages and
+gross weight actually loaded into it, and plans the containers to book when
+none are known yet.
+"""
+
+import json
+
+import frappe
+from frappe import _
+from frappe.utils import flt
+
+from .core.container_allocation import CONTAINER_SPECS, ContainerAllocator
+
+# Gross weight over net weight, as assumed for Commercial Invoice items
+TARE_FACTOR = 1.1
+
+
+def get_carton_lots(packing_list):
+    """
+    One lot per carton row: count, volume (m³) and gross weight (kg) per carton
+    Weights come from the items laid out in each carton, or the row's carton weight
+    limit when it has no layout; when the Packing List has a gross weight, lots are
+    scaled to add up to it
+    """
+    unit_counts = {}
+    for row in packing_list.cartons:
+        unit_counts[row.idx] = get_units_per_carton(row)
+
+    item_codes = {item_code for counts in unit_counts.values() for item_code in counts}
+    item_weights = dict(frappe.get_all(
+        "Item", filters={"name": ["in", list(item_codes)]}, fields=["name", "weight_per_unit"], as_list=True
+    )) if item_codes else {}
+
+    lots = []
+    for row in packing_list.cartons:
+        count = int(row.carton_count or 0)
+        if count <= 0:
+            continue
+        net_weight = sum(flt(item_weights.get(item_code)) * qty for item_code, qty in unit_counts[row.idx].items())
+        lots.append({
+            "id": str(row.idx),
+            "count": count,
+            "volume": flt(row.length) * flt(row.width) * flt(row.height) / 1000000,
+            # No layout (or no item weights): the carton's rated gross weight
+            "weight": net_weight * TARE_FACTOR or flt(row.weight_limit)
+        })
+
+    declared = flt(packing_list.total_gross_weight)
+    if declared and lots:
+        computed = sum(lot["weight"] * lot["count"] for lot in lots)
+        if computed:
+            for lot in lots:
+                lot["weight"] *= declared / computed
+        else:
+            # No item weights: spread the declared weight by volume
+            total_volume = sum(lot["volume"] * lot["count"] for lot in lots) or 1
+            for lot in lots:
+                lot["weight"] = declared * lot["volume"] / total_volume
+
+    return lots
+
+
+def get_units_per_carton(row):
+    """{item_code: units} in one carton of a Packing List Carton row, from its 3D layout"""
+    positions = json.loads(row.positions_3d) if row.get("positions_3d") else {}
+    if row.get("inner_carton_id"):
+        # Nested packing: the master holds inners, each with its own item layout
+        inner_positions = json.loads(row.inner_positions_3d) if row.get("inner_positions_3d") else {}
+        inners = flt(row.inners_per_carton)
+        return {item_code: len(p or []) * inners for item_code, p in inner_positions.items()}
+
+    return {item_code: len(p or []) for item_code, p in positions.items()}
+
+
+def allocate_containers(packing_list, container_sizes):
+    """
+    Packages and gross weight per container, in container order, and the carton rows
+    that did not fit: {"containers": [...], "unallocated": [{idx, carton_id, cartons}]}
+    """
+    validate_container_sizes(container_sizes)
+    lots = get_carton_lots(packing_list)
+    result = ContainerAllocator().allocate(lots, container_sizes)
+
+    rows = {str(row.idx): row for row in packing_list.cartons}
+    unallocated = [
+        {"idx": int(lot_id), "carton_id": rows[lot_id].carton_id, "cartons": cartons}
+        for lot_id, cartons in sorted(result["unallocated"].items(), key=lambda lot: int(lot[0]))
+    ]
+    if unallocated:
+        frappe.msgprint(
+            _("{0} cartons do not fit in the containers and are not allocated: {1}. "
+              "Please add containers or check the container sizes.").format(
+                sum(row["cartons"] for row in unallocated),
+                ", ".join(_("row {0} ({1} × {2})").format(row["idx"], row["cartons"], row["carton_id"])
+                          for row in unallocated)
+            ),
+            title=_("Containers Over Capacity"),
+            indicator="orange",
+        )
+
+    return {
+        "containers": [
+            {
+                "container_size": container["container_size"],
+                "no_of_packages": container["packages"],
+                "gross_weight": flt(container["weight"], 3),
+                "volume_utilization": flt(container["volume_utilization"], 1),
+                "weight_utilization": flt(container["weight_utilization"], 1),
+            }
+            for container in result["containers"]
+        ],
+        "unallocated": unallocated,
+    }
+
+
+def get_container_sizes(packing_list, count, sizes=None):
+    """
+    Size of each of `count` containers: the given size where known (B/L container
+    rows), else the size planned for the Packing List's cartons in the same position,
+    else the Packing List's container size
+    """
+    sizes = list(sizes or [])[:count]
+    sizes += [None] * (count - len(sizes))
+    if all(sizes):
+        return sizes
+
+    planned = [
+        container["container_size"]
+        for container in ContainerAllocator().plan(get_carton_lots(packing_list))["containers"]
+    ]
+    default = packing_list.get("container_size") or "40ft"
+    return [
+        size or (planned[idx] if idx < len(planned) else default)
+        for idx, size in enumerate(sizes)
+    ]
+
+
+def validate_container_sizes(sizes):
+    unknown = [size for size in sizes if size not in CONTAINER_SPECS]
+    if unknown:
+        frappe.throw(_("Unknown container size: {0}").format(", ".join(map(str, dict.fromkeys(unknown)))))
+
+
+@frappe.whitelist()
+def plan_containers(packing_list_name, sizes=None):
+    """Containers to book for a Packing List: count, sizes and load of each"""
+    packing_list = frappe.get_doc("Packing List Export", packing_list_name)
+    packing_list.check_permission("read")
+
+    if isinstance(sizes, str):
+        sizes = json.loads(sizes)
+    sizes = [size for size in (sizes or ["20ft", "40ft", "40ft HC"]) if size in CONTAINER_SPECS]
+    if not sizes:
+        frappe.throw(_("Select at least one container size"))
+
+    result = ContainerAllocator().plan(get_carton_lots(packing_list), sizes)
+
+    return {
+        "containers": [
+            {
+                "container_size": container["container_size"],
+                "no_of_packages": container["packages"],
+                "gross_weight": flt(container["weight"], 3),
+                "volume_cbm": flt(container["volume"], 3),
+                "volume_utilization": flt(container["volume_utilization"], 1),
+                "weight_utilization": flt(container["weight_utilization"], 1),
+            }
+            for container in result["containers"]
+        ],
+        "unallocated_cartons": sum(result["unallocated"].values()),
+    }
@@ -1,6 +1,25 @@
 import math
+from functools import lru_cache
 from typing import List, Dict, Tuple, Optional
 import hashlib
+import json
+
+# Orientation bits, in the order orientations are tried: (l,w,h), (l,h,w), (w,l,h), (w,h,l), (h,l,w), (h,w,l)
+ORIENTATION_ALL = 0b111111
+ORIENTATION_UPRIGHT = 0b000101  # item height stays vertical, may turn on the floor
+ORIENTATION_FIXED = 0b000001  # as entered on the Item
+
+ORIENTATION_MASKS = {
+    "Any": ORIENTATION_ALL,
+    "Upright Only": ORIENTATION_UPRIGHT,
+    "No Rotation": ORIENTATION_FIXED,
+}
+
+
+def get_orientation_mask(constraint: Optional[str]) -> int:
+    """Bitmask for an Item orientation_constraint value"""
+    return ORIENTATION_MASKS.get(constraint or "Any", ORIENTATION_ALL)
+
 
 class PackingCalculator:
     """Core calculation logic for carton packing with 3D positions"""
@@ -10,37 +29,64 @@ class PackingCalculator:
         """Calculate volume of an item"""
         return float(length) * float(width) * float(height)
 
+    @staticmethod
+    def get_orientations(length: float, width: float, height: float,
+                         mask: int = ORIENTATION_ALL) -> List[Tuple[float, float, float]]:
+        """Allowed orientations for the mask, without duplicates (e.g. square faces)"""
+        orientations = [
+            (length, width, height),
+            (length, height, width),
+            (width, length, height),
+            (width, height, length),
+            (height, length, width),
+            (height, width, length),
+        ]
+        allowed = []
+        for bit, orientation in enumerate(orientations):
+            if mask & (1 << bit) and orientation not in allowed:
+                allowed.append(orientation)
+        return allowed
+
     @staticmethod
     def max_units_fit(item: Dict, carton: Dict) -> int:
-        """Calculate max units that can fit in a carton considering all orientations"""
+        """Calculate max units that can fit in a carton considering the allowed orientations"""
         if not all([item.get("length"), item.get("width"), item.get("height")]):
             return 0
         if not all([carton.get("length"), carton.get("width"), carton.get("height")]):
             return 0
 
-        orientations = [
-            (item["length"], item["width"], item["height"]),
-            (item["length"], item["height"], item["width"]),
-            (item["width"], item["length"], item["height"]),
-            (item["width"], item["height"], item["length"]),
-            (item["height"], item["length"], item["width"]),
-            (item["height"], item["width"], item["length"]),
-        ]
+        return PackingCalculator._cached_units_fit(
+            item["length"], item["width"], item["height"],
+            item.get("volume", 0), item.get("weight", 0),
+            carton["length"], carton["width"], carton["height"],
+            carton["volume"], carton.get("weight_limit") or 0,
+            item.get("orientation_mask", ORIENTATION_ALL)
+        )
+
+    @staticmethod
+    @lru_cache(maxsize=65536)
+    def _cached_units_fit(length, width, height, volume, weight,
+                          carton_length, carton_width, carton_height,
+                          carton_volume, weight_limit, orientation_mask=ORIENTATION_ALL) -> int:
+        """
+        Fit table lookup keyed by item and carton geometry.
+        Kept process-wide so long-lived workers answer repeat lookups from memory.
+        """
         best_fit = 0
 
-        for l, w, h in orientations:
-            fit_x = int(carton["length"] // l) if l > 0 else 0
-            fit_y = int(carton["width"] // w) if w > 0 else 0
-            fit_z = int(carton["height"] // h) if h > 0 else 0
+        for l, w, h in PackingCalculator.get_orientations(length, width, height, orientation_mask):
+            fit_x = int(carton_length // l) if l > 0 else 0
+            fit_y = int(carton_width // w) if w > 0 else 0
+            fit_z = int(carton_height // h) if h > 0 else 0
 
             if fit_x == 0 or fit_y == 0 or fit_z == 0:
                 continue
 
             fit_by_dim = fit_x * fit_y * fit_z
-            fit_by_vol = int(carton["volume"] // item["volume"]) if item.get("volume", 0) > 0 else float('inf')
+            fit_by_vol = int(carton_volume // volume) if (volume or 0) > 0 else float('inf')
             fit_by_wt = (
-                int(carton["weight_limit"] // item["weight"])
-                if carton.get("weight_limit") and item.get("weight", 0) > 0
+                int(weight_limit // weight)
+                if weight_limit and (weight or 0) > 0
                 else float('inf')
             )
 
@@ -52,14 +98,10 @@ class PackingCalculator:
     @staticmethod
     def max_units_fit_with_3d_positions(item: Dict, carton: Dict) -> Tuple[int, List[Dict]]:
         """Enhanced version that returns 3D positions for visualization"""
-        orientations = [
-            (item["length"], item["width"], item["height"]),
-            (item["length"], item["height"], item["width"]),
-            (item["width"], item["length"], item["height"]),
-            (item["width"], item["height"], item["length"]),
-            (item["height"], item["length"], item["width"]),
-            (item["height"], item["width"], item["length"]),
-        ]
+        orientations = PackingCalculator.get_orientations(
+            item["length"], item["width"], item["height"],
+            item.get("orientation_mask", ORIENTATION_ALL)
+        )
 
         best_fit = 0
         best_positions = []
@@ -137,3 +179,14 @@ class PackingCalculator:
 
         signature_string = "|".join(signature_parts)
         return hashlib.md5(signature_string.encode()).hexdigest()[:12]
+
+    @staticmethod
+    def create_catalog_signature(cartons: List[Dict]) -> str:
+        """
+        Create a signature for a carton catalog
+        Any change to an enabled carton (dimensions, limits, cost) changes the signature
+        """
+        canonical = sorted(
+            (json.dumps(carton, sort_keys=True, default=str) for carton in cartons)
+        )
+        return hashlib.md5("|".join(canonical).encode()).hexdigest()[:12]
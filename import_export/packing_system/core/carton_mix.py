@@ -0,0 +1,183 @@
+import heapq
+import math
+from fractions import Fraction
+from functools import lru_cache
+from typing import Dict, List, Tuple
+
+# Costs are currency floats; the solver works on integers scaled by this factor
+COST_SCALE = 10 ** 6
+
+
+class CartonMixSolver:
+    """
+    Exact minimum-cost carton mix for a single item group
+
+    Given the viable cartons for an item (units per carton and cost per carton),
+    finds how many of each carton cover a quantity at minimum total cost, with
+    fewer cartons as the tie-breaker.
+
+    Large quantities are reduced with the best cost-per-unit carton: an optimal
+    mix never needs as many "other" cartons as the best carton holds units, so
+    only the residue modulo that capacity has to be searched (shortest path over
+    residues). The plain bounded DP over quantity is the fallback for small
+    quantities where the shortcut can't prove optimality.
+    """
+
+    def solve(self, options: List[Dict], qty: int) -> List[Tuple[Dict, int]]:
+        """
+        options: entries with "fit_capacity" and "carton" (as built by PackingOptimizer)
+        Returns [(option, carton_count)] for the options used
+        """
+        qty = int(qty)
+        viable = [o for o in options if o["fit_capacity"] > 0]
+        if qty <= 0 or not viable:
+            return []
+
+        key = tuple((int(o["fit_capacity"]), float(o["carton"].get("cost_per_unit") or 0)) for o in viable)
+        counts = solve_mix(key, qty)
+
+        return [(viable[i], count) for i, count in enumerate(counts) if count > 0]
+
+
+@lru_cache(maxsize=4096)
+def solve_mix(options: Tuple[Tuple[int, float], ...], qty: int) -> Tuple[int, ...]:
+    """Memoized solver on (capacity, cost) tuples; returns a carton count per option"""
+    options = tuple((int(cap), int(round(cost * COST_SCALE))) for cap, cost in options)
+    candidates = prune_dominated(options)
+
+    if len(candidates) == 1:
+        idx = candidates[0]
+        return _counts(len(options), {idx: math.ceil(qty / options[idx][0])})
+
+    solution = _solve_by_residues(options, candidates, qty)
+    if solution is None:
+        solution = _solve_by_dp(options, candidates, qty)
+
+    return _counts(len(options), solution)
+
+
+def prune_dominated(options: Tuple[Tuple[int, float], ...]) -> List[int]:
+    """Drop cartons that hold no more and cost no less than another carton"""
+    keep = []
+    for i, (cap_i, cost_i) in enumerate(options):
+        dominated = False
+        for j, (cap_j, cost_j) in enumerate(options):
+            if i == j:
+                continue
+            if cap_j >= cap_i and cost_j <= cost_i and (cap_j > cap_i or cost_j < cost_i or j < i):
+                dominated = True
+                break
+        if not dominated:
+            keep.append(i)
+    return keep
+
+
+def _solve_by_residues(options, candidates, qty):
+    """
+    Shortest path over residues modulo the best carton's capacity.
+
+    Total cost of a mix = ratio * qty + reduced cost of the other cartons
+    + ratio * rounding slack, which lower-bounds every mix; if the minimizing
+    residue path fits inside qty, the bound is attained and the mix is optimal.
+    """
+    best = _best_ratio(options, candidates)
+
+    # Below one best carton the plain DP is cheaper than scanning every residue
+    if qty <= options[best][0]:
+        return None
+
+    step, best_cost, dist, capacity, previous = _residue_table(options, tuple(candidates), best)
+
+    # Costs here are multiplied by step so the best carton's cost per unit stays integral
+    best_residue, best_value = None, None
+    for residue, (reduced, count) in dist.items():
+        slack = (residue - qty) % step
+        value = (reduced + best_cost * slack, count + (qty - capacity[residue] + slack) // step)
+        if best_value is None or value < best_value:
+            best_residue, best_value = residue, value
+
+    if capacity[best_residue] > qty:
+        return None
+
+    solution = {}
+    residue = best_residue
+    while previous[residue] is not None:
+        residue, i = previous[residue]
+        solution[i] = solution.get(i, 0) + 1
+
+    remaining = qty - capacity[best_residue]
+    solution[best] = math.ceil(remaining / step) if remaining > 0 else 0
+    return solution
+
+
+def _best_ratio(options, candidates):
+    """Carton with the lowest cost per unit (largest on ties)"""
+    return min(candidates, key=lambda i: (Fraction(options[i][1], options[i][0]), -options[i][0]))
+
+
+@lru_cache(maxsize=1024)
+def _residue_table(options, candidates, best):
+    """Quantity-independent part of the residue search, shared by every qty for these cartons"""
+    step, best_cost = options[best]
+    # Reduced cost (x step) of each other carton against the best cost per unit, never negative
+    others = [
+        (i, options[i][0], max(options[i][1] * step - best_cost * options[i][0], 0))
+        for i in candidates if i != best
+    ]
+
+    # dist[residue] = (reduced cost, cartons), plus capacity and predecessor for path rebuild
+    dist = {0: (0, 0)}
+    capacity = {0: 0}
+    previous = {0: None}
+    heap = [(0, 0, 0)]
+
+    while heap:
+        reduced, count, residue = heapq.heappop(heap)
+        if (reduced, count) > dist[residue]:
+            continue
+
+        for i, cap, reduced_cost in others:
+            nxt = (residue + cap) % step
+            candidate = (reduced + reduced_cost, count + 1)
+            current = dist.get(nxt)
+            if current is None or candidate < current:
+                dist[nxt] = candidate
+                capacity[nxt] = capacity[residue] + cap
+                previous[nxt] = (residue, i)
+                heapq.heappush(heap, (candidate[0], candidate[1], nxt))
+
+    return step, best_cost, dist, capacity, previous
+
+
+def _solve_by_dp(options, candidates, qty):
+    """Bounded DP: min (cost, cartons) to cover every quantity up to qty"""
+    inf = (float("inf"), 0)
+    best = [inf] * (qty + 1)
+    choice = [-1] * (qty + 1)
+    best[0] = (0, 0)
+
+    for q in range(1, qty + 1):
+        current, current_choice = inf, -1
+        for i in candidates:
+            cap, cost = options[i]
+            prev_cost, prev_count = best[q - cap if q > cap else 0]
+            value = (prev_cost + cost, prev_count + 1)
+            if value < current:
+                current, current_choice = value, i
+        best[q], choice[q] = current, current_choice
+
+    solution = {}
+    q = qty
+    while q > 0:
+        i = choice[q]
+        solution[i] = solution.get(i, 0) + 1
+        q = q - options[i][0] if q > options[i][0] else 0
+
+    return solution
+
+
+def _counts(size, solution):
+    counts = [0] * size
+    for i, count in solution.items():
+        counts[i] = count
+    return tuple(counts)
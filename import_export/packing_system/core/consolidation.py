@@ -0,0 +1,165 @@
+import json
+from collections import deque
+from typing import Dict, List, Tuple
+
+from .optimizer import PackingOptimizer
+
+
+class ConsolidationAllocator:
+    """
+    Splits a joint packing result back into per-order carton allocations
+
+    The orders of a consolidated shipment are packed together, so an item group
+    fills cartons regardless of which order the units belong to. Cartons are
+    handed out to orders in sequence: each order gets whole cartons for its
+    units, and where one order's units run out mid-carton the carton is shared
+    with the next order and flagged as such. Every carton keeps one serial
+    number across the shipment, so shared cartons can be traced to all of
+    their orders.
+
+    Work is proportional to patterns plus order lines, not to carton count.
+    """
+
+    def allocate(self, result: Dict, order_items: List[Tuple[str, Dict, int]]) -> Dict[str, Dict]:
+        """
+        result: suggest_cartons result for the combined items
+        order_items: (order, item, qty) in allocation order; item as passed to the engine
+        Returns {order: {"cartons": [Packing List Carton rows], "unpacked": [{item_code, qty}]}}
+        """
+        queues = self._build_queues(order_items)
+        allocations = {order: {"cartons": [], "unpacked": []} for order, _, _ in order_items}
+        next_carton_no = 1
+
+        for assignment in result["carton_assignments"]:
+            queue = queues.get(assignment["items"][0]["item_code"]) if assignment.get("items") else None
+            if not queue:
+                continue
+
+            per_carton = int(assignment["items_per_carton"] or 0)
+            cartons_left = int(assignment["carton_count"])
+            units_left = int(assignment["total_items"])
+            if per_carton <= 0:
+                continue
+
+            while cartons_left > 0 and queue:
+                order, item_code, remaining = queue[0]
+
+                # Run of full cartons for one order line (the last carton of a pattern may be partial)
+                if remaining >= units_left:
+                    full = cartons_left
+                else:
+                    full = min(remaining // per_carton, cartons_left - 1)
+                if full > 0:
+                    units = min(full * per_carton, units_left)
+                    allocations[order]["cartons"].append(self._row(
+                        assignment, order, full, units, [(order, item_code, units)],
+                        next_carton_no, shared=False
+                    ))
+                    self._take(queue, units)
+                    next_carton_no += full
+                    cartons_left -= full
+                    units_left -= units
+                    continue
+
+                # One carton filled from several order lines
+                size = per_carton if cartons_left > 1 else units_left
+                contents = []
+                while size > 0 and queue:
+                    order, item_code, remaining = queue[0]
+                    units = min(size, remaining)
+                    contents.append((order, item_code, units))
+                    self._take(queue, units)
+                    size -= units
+
+                units = sum(c[2] for c in contents)
+                orders = list(dict.fromkeys(c[0] for c in contents))
+                shares = {o: sum(c[2] for c in contents if c[0] == o) for o in orders}
+                owner = max(orders, key=lambda o: shares[o])
+
+                for o in orders:
+                    allocations[o]["cartons"].append(self._row(
+                        assignment, o, 1 if o == owner else 0, shares[o], contents,
+                        next_carton_no, shared=len(orders) > 1, carton_units=units
+                    ))
+
+                next_carton_no += 1
+                cartons_left -= 1
+                units_left -= units
+
+        # Whatever is still queued could not be packed
+        for queue in {id(q): q for q in queues.values()}.values():
+            for order, item_code, remaining in queue:
+                allocations[order]["unpacked"].append({"item_code": item_code, "qty": remaining})
+
+        return allocations
+
+    def _build_queues(self, order_items: List[Tuple[str, Dict, int]]) -> Dict[str, deque]:
+        """One queue of [order, item_code, qty] per item group, reachable from every member item code"""
+        optimizer = PackingOptimizer()
+        items = []
+        for order, item, qty in order_items:
+            items.append({**item, "qty": qty, "_order": order})
+
+        queues = {}
+        for group in optimizer.group_similar_items(items):
+            queue = deque(
+                [member["_order"], member["id"], int(member["qty"])]
+                for member in group["items"] if member["qty"] > 0
+            )
+            for member in group["items"]:
+                queues[member["id"]] = queue
+
+        return queues
+
+    @staticmethod
+    def _take(queue: deque, units: int):
+        while units > 0 and queue:
+            taken = min(units, queue[0][2])
+            queue[0][2] -= taken
+            units -= taken
+            if queue[0][2] == 0:
+                queue.popleft()
+
+    @staticmethod
+    def _row(assignment: Dict, order: str, carton_count: int, units: int, contents: List[Tuple],
+             carton_no: int, shared: bool, carton_units: int = None) -> Dict:
+        carton = assignment["carton"]
+        cost_per_unit = carton.get("cost_per_unit") or 0
+
+        if shared:
+            # Shared cartons: cost split by units, summary names every order in the carton
+            total_cost = cost_per_unit * units / carton_units if carton_units else 0
+            item_summary = "; ".join(f"{o}: {code} (×{qty})" for o, code, qty in contents)
+            carton_no_to = carton_no
+        else:
+            total_cost = cost_per_unit * carton_count
+            if len(contents) > 1:
+                item_summary = "; ".join(f"{code} (×{qty})" for _, code, qty in contents)
+            else:
+                item_summary = f"{contents[0][1]} (×{assignment['items_per_carton']} per carton)"
+            carton_no_to = carton_no + carton_count - 1
+
+        positions = assignment.get("positions_3d")
+
+        return {
+            "sales_order": order,
+            "carton_id": carton["id"],
+            "carton_count": carton_count,
+            "items_per_carton": units if shared else assignment["items_per_carton"],
+            "pattern_signature": assignment.get("pattern_signature") or "",
+            "packing_efficiency": assignment.get("efficiency", 0),
+            "utilization": assignment.get("utilization", 0),
+            "length": carton["length"],
+            "width": carton["width"],
+            "height": carton["height"],
+            "volume": carton.get("volume"),
+            "weight_limit": carton.get("weight_limit"),
+            "cost_per_unit": cost_per_unit,
+            "total_cost": total_cost,
+            "total_items": units,
+            "item_summary": item_summary,
+            "positions_3d": json.dumps(positions) if positions else "",
+            "carton_no_from": carton_no,
+            "carton_no_to": carton_no_to,
+            "shared_carton": 1 if shared else 0
+        }
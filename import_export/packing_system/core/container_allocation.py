@@ -0,0 +1,151 @@
+import heapq
+import math
+from typing import Dict, List, Optional, Sequence
+
+# Inside dimensions (cm), volume (m³) and maximum payload (kg) of ISO dry containers
+CONTAINER_SPECS = {
+    "20ft": {"length": 589, "width": 235, "height": 239, "volume": 33.2, "payload": 28200},
+    "40ft": {"length": 1203, "width": 235, "height": 239, "volume": 67.7, "payload": 26700},
+    "40ft HC": {"length": 1203, "width": 235, "height": 269, "volume": 76.3, "payload": 26500},
+    "45ft HC": {"length": 1355, "width": 235, "height": 269, "volume": 86.0, "payload": 27700},
+}
+
+# Share of a container's volume that cartons can actually use (stowage loss, dunnage)
+DEFAULT_FILL_FACTOR = 0.85
+
+# Load difference (fraction of capacity) tolerated between containers while balancing
+LOAD_QUANTUM = 0.01
+
+
+class ContainerAllocator:
+    """
+    Assigns packed cartons to containers by volume and payload
+
+    Cartons come in lots (one per carton pattern: count, volume and gross
+    weight per carton). Each container is loaded to a fraction of its usable
+    volume or payload, whichever is higher; lots are placed largest first and
+    every placement goes to the least loaded container that still has room,
+    in runs that lift it to the level of the next one. Containers of different
+    sizes therefore end up equally full, and work is proportional to lots
+    times containers, not to carton count.
+    """
+
+    def __init__(self, fill_factor: float = DEFAULT_FILL_FACTOR, specs: Optional[Dict[str, Dict]] = None):
+        self.fill_factor = fill_factor
+        self.specs = specs or CONTAINER_SPECS
+
+    def capacity(self, size: str):
+        spec = self.specs.get(size)
+        if not spec:
+            raise ValueError(f"Unknown container size: {size!r}")
+        return spec["volume"] * self.fill_factor, spec["payload"]
+
+    def allocate(self, lots: List[Dict], sizes: Sequence[str]) -> Dict:
+        """
+        lots: [{"id", "count", "volume" (m³ per carton), "weight" (kg per carton)}]
+        sizes: container size of each container, in container order
+        Returns {"containers": [...], "unallocated": {lot id: count}}
+        """
+        containers = []
+        for idx, size in enumerate(sizes):
+            cap_volume, cap_weight = self.capacity(size)
+            containers.append({
+                "idx": idx,
+                "container_size": size,
+                "cap_volume": cap_volume,
+                "cap_weight": cap_weight,
+                "volume": 0.0,
+                "weight": 0.0,
+                "packages": 0,
+                "lots": {}
+            })
+
+        unallocated = {}
+        for lot in sorted(lots, key=self._lot_size, reverse=True):
+            left = self._place_lot(lot, containers)
+            if left:
+                unallocated[lot["id"]] = left
+
+        for container in containers:
+            container["volume_utilization"] = 100 * container["volume"] / container["cap_volume"]
+            container["weight_utilization"] = 100 * container["weight"] / container["cap_weight"]
+
+        return {"containers": containers, "unallocated": unallocated}
+
+    def plan(self, lots: List[Dict], sizes: Sequence[str] = ("20ft", "40ft", "40ft HC")) -> Dict:
+        """
+        Choose the containers as well: full containers of the largest size, and the
+        smallest size that takes the remainder as the last one
+        """
+        sizes = sorted(sizes, key=lambda size: self.capacity(size)[0])
+        largest = sizes[-1]
+        cap_volume, cap_weight = self.capacity(largest)
+
+        total_volume = sum(lot["volume"] * lot["count"] for lot in lots)
+        total_weight = sum(lot["weight"] * lot["count"] for lot in lots)
+        need = max(total_volume / cap_volume, total_weight / cap_weight)
+        full = int(need)
+
+        # Smallest last container covering the remainder; tried in order, since
+        # whole cartons may not divide evenly
+        candidates = [
+            size for size in sizes
+            if need - full <= min(self.capacity(size)[0] / cap_volume, self.capacity(size)[1] / cap_weight)
+        ] if need > full else []
+
+        result = None
+        for fleet in [[largest] * full + [size] for size in candidates] + [[largest] * max(full, 1)]:
+            result = self.allocate(lots, fleet)
+            if not result["unallocated"]:
+                return result
+
+        # Add containers until everything fits
+        fleet = [largest] * (max(full, 1) + 1)
+        while True:
+            result = self.allocate(lots, fleet)
+            if not result["unallocated"] or len(fleet) > 2 * (full + 1):
+                return result
+            fleet.append(largest)
+
+    def _lot_size(self, lot: Dict) -> float:
+        cap_volume, cap_weight = self.capacity("40ft")
+        return max(lot["volume"] / cap_volume, lot["weight"] / cap_weight)
+
+    @staticmethod
+    def _load(container: Dict) -> float:
+        return max(container["volume"] / container["cap_volume"], container["weight"] / container["cap_weight"])
+
+    def _place_lot(self, lot: Dict, containers: List[Dict]) -> int:
+        left = int(lot["count"])
+        volume, weight = lot["volume"], lot["weight"]
+        heap = [(self._load(c), c["idx"]) for c in containers]
+        heapq.heapify(heap)
+
+        while left > 0 and heap:
+            load, idx = heapq.heappop(heap)
+            container = containers[idx]
+
+            room = [left]
+            if volume > 0:
+                room.append(int((container["cap_volume"] - container["volume"]) // volume))
+            if weight > 0:
+                room.append(int((container["cap_weight"] - container["weight"]) // weight))
+            fits = min(room)
+            if fits <= 0:
+                continue  # Full for this lot; smaller lots may still fit
+
+            # Run of cartons up to the load of the next least loaded container, plus a
+            # small margin so equally loaded containers are not filled one carton at a time
+            step = max(volume / container["cap_volume"], weight / container["cap_weight"])
+            next_load = heap[0][0] if heap else 1.0
+            run = fits if step <= 0 else min(fits, max(1, math.floor((next_load - load + LOAD_QUANTUM) / step)))
+
+            container["volume"] += volume * run
+            container["weight"] += weight * run
+            container["packages"] += run
+            container["lots"][lot["id"]] = container["lots"].get(lot["id"], 0) + run
+            left -= run
+
+            heapq.heappush(heap, (self._load(container), idx))
+
+        return left
@@ -0,0 +1,144 @@
+import math
+import time
+from typing import Dict, List, Optional, Tuple
+
+from .calculator import ORIENTATION_ALL, PackingCalculator
+
+DEFAULT_MAX_DIMENSIONS = (120, 80, 100)
+DEFAULT_WEIGHT_LIMIT = 30
+
+
+class CustomCartonSizer:
+    """
+    Proposes a custom carton size for items no catalog carton can hold
+
+    Searches a x b x c grid arrangements of the item in every allowed
+    orientation, with box sides rounded up to the manufacturer's size step and
+    kept within the maximum dimensions and weight limit. The box that packs the
+    quantity with the least total volume (or cost) wins. Grids that can't beat
+    the best so far are pruned, and the search stops at the time budget with
+    the best box found.
+    """
+
+    def __init__(self, size_step: float = 1, max_dimensions: Tuple[float, float, float] = DEFAULT_MAX_DIMENSIONS,
+                 weight_limit: float = DEFAULT_WEIGHT_LIMIT, cost_rate: float = 0, objective: str = "volume",
+                 time_budget_ms: float = 50):
+        self.size_step = size_step or 1
+        self.max_dimensions = max_dimensions
+        self.weight_limit = weight_limit or 0
+        self.cost_rate = cost_rate
+        self.objective = objective
+        self.time_budget_ms = time_budget_ms
+
+    def round_up(self, value: float) -> float:
+        return math.ceil(round(value / self.size_step, 9)) * self.size_step
+
+    def box_cost(self, length: float, width: float, height: float) -> float:
+        return self.cost_rate * 2 * (length * width + length * height + width * height)
+
+    def bound(self, length: float, width: float, unit_height: float, qty: int, footprint_units: int) -> float:
+        """Lower bound on the objective for a footprint, whatever the number of layers"""
+        if self.objective == "volume":
+            return length * width * unit_height * qty / footprint_units
+        return self.cost_rate * 2 * (length + width) * unit_height * qty / footprint_units
+
+    def propose(self, item: Dict, qty: int) -> Optional[Dict]:
+        """Best box for `qty` units of the item, or None if the item can't fit the maximum size"""
+        qty = int(qty)
+        if qty <= 0 or not all([item.get("length"), item.get("width"), item.get("height")]):
+            return None
+
+        max_length, max_width, max_height = self.max_dimensions
+        unit_weight = item.get("weight") or 0
+        max_by_weight = int(self.weight_limit // unit_weight) if self.weight_limit and unit_weight > 0 else qty
+        if max_by_weight <= 0:
+            return None
+
+        deadline = time.perf_counter() + self.time_budget_ms / 1000
+        best, best_key = None, None
+
+        orientations = PackingCalculator.get_orientations(
+            item["length"], item["width"], item["height"], item.get("orientation_mask", ORIENTATION_ALL)
+        )
+
+        for l, w, h in orientations:
+            max_a, max_b, max_c = int(max_length // l), int(max_width // w), int(max_height // h)
+            if not (max_a and max_b and max_c):
+                continue
+
+            for a in range(1, min(max_a, qty) + 1):
+                if time.perf_counter() > deadline:
+                    return best
+                length = self.round_up(a * l)
+                if length > max_length:
+                    break
+
+                for b in range(1, min(max_b, math.ceil(qty / a)) + 1):
+                    width = self.round_up(b * w)
+                    if width > max_width:
+                        break
+
+                    # Bound over every c for this footprint: cartons >= qty / (a b c) and height >= c h
+                    if best_key is not None and self.bound(length, width, h, qty, a * b) > best_key[0]:
+                        continue
+
+                    for c in range(1, min(max_c, math.ceil(qty / (a * b))) + 1):
+                        height = self.round_up(c * h)
+                        if height > max_height:
+                            break
+
+                        capacity = min(a * b * c, max_by_weight)
+                        cartons = math.ceil(qty / capacity)
+                        volume = length * width * height
+                        total = cartons * (volume if self.objective == "volume" else self.box_cost(length, width, height))
+                        key = (total, cartons, volume)
+
+                        if best_key is None or key < best_key:
+                            best_key = key
+                            best = {
+                                "length": length,
+                                "width": width,
+                                "height": height,
+                                "units_per_carton": capacity,
+                                "cartons_needed": cartons,
+                                "arrangement": (a, b, c),
+                                "orientation": (l, w, h)
+                            }
+
+        return best
+
+    def carton_record(self, proposal: Dict, item: Dict, uom: str = "cm") -> Dict:
+        """Carton document dict for a proposal, ready for frappe.get_doc(...).insert()"""
+        length, width, height = (round(proposal[k], 2) for k in ("length", "width", "height"))
+        return {
+            "doctype": "Carton",
+            "carton_name": f"CUSTOM-{length:g}x{width:g}x{height:g}",
+            "length": length,
+            "width": width,
+            "height": height,
+            "volume": length * width * height,
+            "uom": uom,
+            "weight_limit": self.weight_limit,
+            "cost_per_unit": round(self.box_cost(length, width, height), 2),
+            "carton_type": "Custom",
+            "material": "Cardboard",
+            "fragile_safe": 1 if item.get("fragile") else 0
+        }
+
+    def suggest_for_unpacked(self, unpacked_items: List[Dict], uom: str = "cm") -> List[Dict]:
+        """Custom carton proposals for the unpacked_items of a suggest_cartons result"""
+        suggestions = []
+        for entry in unpacked_items:
+            item, qty = entry["item"], entry["quantity"]
+            proposal = self.propose(item, qty)
+            if not proposal:
+                continue
+            suggestions.append({
+                "item_code": item["id"],
+                "quantity": qty,
+                "units_per_carton": proposal["units_per_carton"],
+                "cartons_needed": proposal["cartons_needed"],
+                "arrangement": "x".join(str(n) for n in proposal["arrangement"]),
+                "carton": self.carton_record(proposal, item, uom)
+            })
+        return suggestions
@@ -1,6 +1,6 @@
 import math
 from typing import List, Dict, Optional, Tuple
-from .calculator import PackingCalculator
+from .calculator import ORIENTATION_ALL, PackingCalculator
 
 class PackingOptimizer:
     """Handles optimization strategies for carton assignment"""
@@ -11,6 +11,25 @@ class PackingOptimizer:
     
     def find_optimal_carton_assignment(self, item: Dict, cartons: List[Dict], remaining_qty: int) -> Optional[Dict]:
         """Find optimal carton assignment considering multiple factors"""
+        options = self.get_carton_options(item, cartons, remaining_qty)
+
+        if not options:
+            return None
+            
+        # Sort based on strategy
+        if self.strategy == "minimize_waste":
+            options.sort(key=lambda x: (x["waste_units"], -x["efficiency"], x["cost_score"]))
+        elif self.strategy == "maximize_efficiency":
+            options.sort(key=lambda x: (-x["efficiency"], x["waste_units"], x["cost_score"]))
+        elif self.strategy == "minimize_cost":
+            options.sort(key=lambda x: (x["cost_score"], x["cartons_needed"], x["waste_units"]))
+        else:  # "minimize_cartons"
+            options.sort(key=lambda x: (x["cartons_needed"], x["waste_units"], x["cost_score"]))
+        
+        return options[0]
+
+    def get_carton_options(self, item: Dict, cartons: List[Dict], remaining_qty: int) -> List[Dict]:
+        """Every carton the item fits in, with fit capacity and scoring for remaining_qty"""
         options = []
         
         for carton in cartons:
@@ -44,27 +63,19 @@ class PackingOptimizer:
                 "cost_score": carton.get('cost_per_unit', 1) * cartons_needed
             })
 
-        if not options:
-            return None
-            
-        # Sort based on strategy
-        if self.strategy == "minimize_waste":
-            options.sort(key=lambda x: (x["waste_units"], -x["efficiency"], x["cost_score"]))
-        elif self.strategy == "maximize_efficiency":
-            options.sort(key=lambda x: (-x["efficiency"], x["waste_units"], x["cost_score"]))
-        else:  # "minimize_cartons"
-            options.sort(key=lambda x: (x["cartons_needed"], x["waste_units"], x["cost_score"]))
-        
-        return options[0]
+        return options
     
     def group_similar_items(self, items: List[Dict]) -> List[Dict]:
         """Group items with identical dimensions to optimize packing"""
         grouped = {}
         
         for item in items:
-            # Create a key based on dimensions (sorted to handle rotations)
-            dims = tuple(sorted([item["length"], item["width"], item["height"]]))
-            key = (dims, item.get("weight", 0), item.get("volume", 0), item.get("fragile", False))
+            # Create a key based on dimensions (sorted to handle rotations, as-is when rotation is restricted)
+            mask = item.get("orientation_mask", ORIENTATION_ALL)
+            dims = (item["length"], item["width"], item["height"])
+            if mask == ORIENTATION_ALL:
+                dims = tuple(sorted(dims))
+            key = (dims, item.get("weight", 0), item.get("volume", 0), item.get("fragile", False), mask)
             
             if key not in grouped:
                 grouped[key] = {
@@ -0,0 +1,72 @@
+# Copyright (c) 2026, gws and Contributors
+# See license.txt
+
+import itertools
+import math
+import random
+import unittest
+
+from import_export.packing_system.core.carton_mix import COST_SCALE, CartonMixSolver, solve_mix
+
+
+def brute_force(options, qty):
+	"""Minimum (cost, cartons) over every carton mix covering qty"""
+	*others, (last_cap, last_cost) = options
+	best = None
+	for counts in itertools.product(*(range(math.ceil(qty / cap) + 1) for cap, _ in others)):
+		covered = sum(cap * count for (cap, _), count in zip(others, counts))
+		# Given the other counts, the fewest cartons of the last option are always best
+		last = max(0, math.ceil((qty - covered) / last_cap))
+		cost = sum(scaled(cost) * count for (_, cost), count in zip(others, counts)) + scaled(last_cost) * last
+		value = (cost, sum(counts) + last)
+		if best is None or value < best:
+			best = value
+	return best
+
+
+def mix_value(options, counts):
+	return (
+		sum(scaled(cost) * count for (_, cost), count in zip(options, counts)),
+		sum(counts)
+	)
+
+
+def scaled(cost):
+	return int(round(cost * COST_SCALE))
+
+
+class TestCartonMix(unittest.TestCase):
+	def assertOptimal(self, options, qty):
+		counts = solve_mix(tuple(options), qty)
+
+		self.assertGreaterEqual(sum(cap * count for (cap, _), count in zip(options, counts)), qty)
+		self.assertEqual(mix_value(options, counts), brute_force(options, qty), (options, qty))
+
+	def test_small_quantities_match_brute_force(self):
+		rng = random.Random(28)
+		for _ in range(150):
+			options = [(rng.randint(1, 12), round(rng.uniform(0.1, 5), 2)) for _ in range(rng.randint(2, 3))]
+			self.assertOptimal(options, rng.randint(1, 60))
+
+	def test_large_quantities_match_brute_force(self):
+		# Above the best carton's capacity the residue search is used instead of the DP
+		rng = random.Random(2028)
+		for _ in range(60):
+			options = [(rng.randint(8, 40), round(rng.uniform(0.5, 9), 2)) for _ in range(rng.randint(2, 3))]
+			self.assertOptimal(options, rng.randint(100, 400))
+
+	def test_fewer_cartons_break_cost_ties(self):
+		# 12 units: 1 x 12 or 2 x 6 cost the same
+		counts = solve_mix(((6, 1.0), (12, 2.0)), 12)
+		self.assertEqual(counts, (0, 1))
+
+	def test_solve_returns_used_options(self):
+		options = [
+			{"fit_capacity": 10, "carton": {"id": "A", "cost_per_unit": 1.0}},
+			{"fit_capacity": 0, "carton": {"id": "B", "cost_per_unit": 0.1}},
+			{"fit_capacity": 4, "carton": {"id": "C", "cost_per_unit": 0.5}},
+		]
+		mix = CartonMixSolver().solve(options, 24)
+
+		self.assertEqual(sorted((option["carton"]["id"], count) for option, count in mix), [("A", 2), ("C", 1)])
+		self.assertEqual(CartonMixSolver().solve(options, 0), [])
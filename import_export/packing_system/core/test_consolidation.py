@@ -0,0 +1,87 @@
+# Copyright (c) 2026, gws and Contributors
+# See license.txt
+
+import unittest
+
+from import_export.packing_system.core.consolidation import ConsolidationAllocator
+from import_export.packing_system.main_controller import PackingController
+
+
+def make_item(item_code, length, width, height, weight):
+	return {
+		"id": item_code, "name": item_code, "length": length, "width": width, "height": height,
+		"weight": weight, "volume": length * width * height, "fragile": False
+	}
+
+
+def make_carton(carton_id, length, width, height, weight_limit, cost):
+	return {
+		"id": carton_id, "carton_name": carton_id, "length": length, "width": width, "height": height,
+		"weight_limit": weight_limit, "cost_per_unit": cost, "volume": length * width * height,
+		"packing_level": "Single", "fragile_safe": False, "max_stack_height": 100
+	}
+
+
+ITEM_A = make_item("_Test Item A", 10, 10, 10, 0.5)
+ITEM_B = make_item("_Test Item B", 20, 15, 10, 1.0)
+ITEM_HUGE = make_item("_Test Item Huge", 90, 90, 90, 5)
+CARTONS = [make_carton("_Test Carton S", 30, 30, 30, 30, 1.0), make_carton("_Test Carton M", 40, 30, 30, 30, 1.5)]
+
+
+class TestConsolidationAllocator(unittest.TestCase):
+	def allocate(self, order_items):
+		totals = {}
+		for _, item, qty in order_items:
+			totals.setdefault(item["id"], [item, 0])[1] += qty
+		result = PackingController().suggest_cartons(
+			[{"item": item, "quantity": qty} for item, qty in totals.values()], CARTONS, enable_3d=False
+		)
+		return result, ConsolidationAllocator().allocate(result, order_items)
+
+	def test_units_and_cartons_are_conserved(self):
+		order_items = [
+			("SO-1", ITEM_A, 40), ("SO-2", ITEM_A, 60), ("SO-3", ITEM_A, 7),
+			("SO-1", ITEM_B, 20), ("SO-2", ITEM_B, 25),
+		]
+		result, allocations = self.allocate(order_items)
+
+		for order in ("SO-1", "SO-2", "SO-3"):
+			ordered = sum(qty for o, _, qty in order_items if o == order)
+			allocated = sum(row["total_items"] for row in allocations[order]["cartons"])
+			self.assertEqual(allocated, ordered, order)
+			self.assertEqual(allocations[order]["unpacked"], [])
+
+		rows = [row for allocation in allocations.values() for row in allocation["cartons"]]
+		self.assertEqual(sum(row["carton_count"] for row in rows), result["total_cartons"])
+
+		# Every carton has one serial number across the shipment
+		numbers = []
+		for row in rows:
+			if row["carton_count"]:
+				numbers.extend(range(row["carton_no_from"], row["carton_no_to"] + 1))
+				self.assertEqual(row["carton_no_to"] - row["carton_no_from"] + 1, row["carton_count"])
+		self.assertEqual(sorted(numbers), list(range(1, result["total_cartons"] + 1)))
+
+	def test_shared_cartons_are_flagged_for_every_order(self):
+		_, allocations = self.allocate([("SO-1", ITEM_A, 40), ("SO-2", ITEM_A, 60)])
+
+		shared = {
+			order: [row for row in allocation["cartons"] if row["shared_carton"]]
+			for order, allocation in allocations.items()
+		}
+		self.assertTrue(shared["SO-1"])
+		self.assertEqual(
+			{row["carton_no_from"] for row in shared["SO-1"]},
+			{row["carton_no_from"] for row in shared["SO-2"]}
+		)
+		# A shared carton is counted once, by the order with the larger share
+		for rows in zip(shared["SO-1"], shared["SO-2"]):
+			self.assertEqual(sum(row["carton_count"] for row in rows), 1)
+
+	def test_unpackable_units_are_reported_per_order(self):
+		_, allocations = self.allocate([("SO-1", ITEM_A, 10), ("SO-1", ITEM_HUGE, 2), ("SO-2", ITEM_HUGE, 3)])
+
+		self.assertEqual(sum(row["total_items"] for row in allocations["SO-1"]["cartons"]), 10)
+		self.assertEqual(allocations["SO-1"]["unpacked"], [{"item_code": "_Test Item Huge", "qty": 2}])
+		self.assertEqual(allocations["SO-2"]["cartons"], [])
+		self.assertEqual(allocations["SO-2"]["unpacked"], [{"item_code": "_Test Item Huge", "qty": 3}])
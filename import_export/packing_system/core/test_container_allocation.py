@@ -0,0 +1,73 @@
+# Copyright (c) 2026, gws and Contributors
+# See license.txt
+
+import unittest
+
+from import_export.packing_system.core.container_allocation import (
+	CONTAINER_SPECS,
+	DEFAULT_FILL_FACTOR,
+	ContainerAllocator,
+)
+
+
+class TestContainerAllocator(unittest.TestCase):
+	def assertWithinCapacity(self, result):
+		for container in result["containers"]:
+			self.assertLessEqual(container["volume"], container["cap_volume"] + 1e-9)
+			self.assertLessEqual(container["weight"], container["cap_weight"] + 1e-9)
+
+	def assertConserved(self, lots, result):
+		for lot in lots:
+			allocated = sum(container["lots"].get(lot["id"], 0) for container in result["containers"])
+			self.assertEqual(allocated + result["unallocated"].get(lot["id"], 0), lot["count"])
+
+	def test_capacity(self):
+		allocator = ContainerAllocator()
+		spec = CONTAINER_SPECS["20ft"]
+
+		self.assertEqual(allocator.capacity("20ft"), (spec["volume"] * DEFAULT_FILL_FACTOR, spec["payload"]))
+		with self.assertRaises(ValueError):
+			allocator.capacity("30ft")
+		with self.assertRaises(ValueError):
+			allocator.allocate([], ["40ft", "40 ft"])
+
+	def test_mixed_sizes_filled_evenly(self):
+		lots = [
+			{"id": "1", "count": 400, "volume": 0.06, "weight": 12},
+			{"id": "2", "count": 150, "volume": 0.12, "weight": 30},
+		]
+		result = ContainerAllocator().allocate(lots, ["40ft HC", "20ft"])
+
+		self.assertEqual(result["unallocated"], {})
+		self.assertConserved(lots, result)
+		self.assertWithinCapacity(result)
+		hc, small = result["containers"]
+		self.assertAlmostEqual(hc["volume_utilization"], small["volume_utilization"], delta=5)
+		self.assertGreater(hc["packages"], small["packages"])
+
+	def test_overflow_is_unallocated(self):
+		lots = [{"id": "1", "count": 600, "volume": 0.1, "weight": 10}]
+		result = ContainerAllocator().allocate(lots, ["20ft"])
+
+		# 33.2 m³ x 0.85 usable holds 282 cartons of 0.1 m³
+		self.assertEqual(result["containers"][0]["packages"], 282)
+		self.assertEqual(result["unallocated"], {"1": 318})
+		self.assertConserved(lots, result)
+		self.assertWithinCapacity(result)
+
+	def test_payload_limits_heavy_cartons(self):
+		lots = [{"id": "1", "count": 100, "volume": 0.05, "weight": 400}]
+		result = ContainerAllocator().allocate(lots, ["40ft"])
+
+		self.assertEqual(result["containers"][0]["packages"], 66)
+		self.assertEqual(result["unallocated"], {"1": 34})
+		self.assertWithinCapacity(result)
+
+	def test_plan_books_smallest_last_container(self):
+		lots = [{"id": "1", "count": 900, "volume": 0.08, "weight": 20}]
+		result = ContainerAllocator().plan(lots)
+
+		self.assertEqual([container["container_size"] for container in result["containers"]], ["40ft HC", "20ft"])
+		self.assertEqual(result["unallocated"], {})
+		self.assertConserved(lots, result)
+		self.assertWithinCapacity(result)
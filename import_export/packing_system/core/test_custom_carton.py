@@ -0,0 +1,72 @@
+# Copyright (c) 2026, gws and Contributors
+# See license.txt
+
+import math
+import unittest
+
+from import_export.packing_system.core.calculator import ORIENTATION_FIXED, ORIENTATION_UPRIGHT
+from import_export.packing_system.core.custom_carton import CustomCartonSizer
+
+ITEM = {"id": "_Test Item", "length": 23, "width": 17, "height": 11, "weight": 0.8}
+
+
+class TestCustomCartonSizer(unittest.TestCase):
+	def assertWithinBounds(self, sizer, item, qty, proposal):
+		max_length, max_width, max_height = sizer.max_dimensions
+		self.assertLessEqual(proposal["length"], max_length)
+		self.assertLessEqual(proposal["width"], max_width)
+		self.assertLessEqual(proposal["height"], max_height)
+
+		# Sides are whole size steps and hold the arrangement
+		a, b, c = proposal["arrangement"]
+		l, w, h = proposal["orientation"]
+		self.assertEqual(sorted((l, w, h)), sorted((item["length"], item["width"], item["height"])))
+		for side, needed in ((proposal["length"], a * l), (proposal["width"], b * w), (proposal["height"], c * h)):
+			self.assertGreaterEqual(side, needed)
+			self.assertLess(side - needed, sizer.size_step)
+			self.assertAlmostEqual(side / sizer.size_step, round(side / sizer.size_step))
+
+		self.assertLessEqual(proposal["units_per_carton"], a * b * c)
+		self.assertLessEqual(proposal["units_per_carton"] * item["weight"], sizer.weight_limit)
+		self.assertEqual(proposal["cartons_needed"], math.ceil(qty / proposal["units_per_carton"]))
+
+	def test_proposal_within_bounds(self):
+		sizer = CustomCartonSizer(size_step=5, max_dimensions=(100, 60, 50), weight_limit=25)
+		for qty in (1, 7, 30, 250):
+			proposal = sizer.propose(ITEM, qty)
+			self.assertIsNotNone(proposal, qty)
+			self.assertWithinBounds(sizer, ITEM, qty, proposal)
+
+	def test_weight_limit_caps_units(self):
+		heavy = {**ITEM, "weight": 6}
+		sizer = CustomCartonSizer(weight_limit=20)
+		proposal = sizer.propose(heavy, 12)
+
+		self.assertEqual(proposal["units_per_carton"], 3)
+		self.assertEqual(proposal["cartons_needed"], 4)
+		self.assertWithinBounds(sizer, heavy, 12, proposal)
+
+	def test_item_too_large_or_heavy(self):
+		sizer = CustomCartonSizer(max_dimensions=(50, 40, 30), weight_limit=10)
+
+		self.assertIsNone(sizer.propose({**ITEM, "length": 60, "width": 45, "height": 35}, 1))
+		self.assertIsNone(sizer.propose({**ITEM, "weight": 12}, 1))
+		self.assertIsNone(sizer.propose({**ITEM, "height": 0}, 1))
+		self.assertIsNone(sizer.propose(ITEM, 0))
+
+	def test_orientation_constraint(self):
+		sizer = CustomCartonSizer(size_step=1)
+
+		fixed = sizer.propose({**ITEM, "orientation_mask": ORIENTATION_FIXED}, 10)
+		self.assertEqual(fixed["orientation"], (23, 17, 11))
+
+		upright = sizer.propose({**ITEM, "orientation_mask": ORIENTATION_UPRIGHT}, 10)
+		self.assertEqual(upright["orientation"][2], 11)
+
+	def test_smallest_box_for_quantity(self):
+		# 8 cubes: a 2 x 2 x 2 cube is the smallest box that holds them in one carton
+		sizer = CustomCartonSizer(size_step=1, weight_limit=0)
+		proposal = sizer.propose({"id": "_Test Cube", "length": 10, "width": 10, "height": 10, "weight": 1}, 8)
+
+		self.assertEqual(proposal["cartons_needed"], 1)
+		self.assertEqual(proposal["length"] * proposal["width"] * proposal["height"], 8000)
@@ -0,0 +1,70 @@
+# Copyright (c) 2026, gws and Contributors
+# See license.txt
+
+import unittest
+
+from import_export.packing_system.core.verifier import LayoutVerifier
+
+CARTON = {"id": "_Test Carton", "length": 40, "width": 30, "height": 20, "weight_limit": 10}
+
+
+class TestLayoutVerifier(unittest.TestCase):
+	def test_touching_boxes_are_valid(self):
+		boxes = [
+			(0, 0, 0, 20, 30, 20, 1),
+			(20, 0, 0, 20, 15, 20, 1),
+			(20, 15, 0, 20, 15, 10, 1),
+			(20, 15, 10, 20, 15, 10, 1),
+		]
+		report = LayoutVerifier().verify_boxes(CARTON, boxes)
+
+		self.assertTrue(report["valid"])
+		self.assertEqual(report["overlaps"], [])
+		self.assertEqual(report["containment"], [])
+
+	def test_overlap_is_reported(self):
+		boxes = [
+			(0, 0, 0, 10, 10, 10, 1),
+			(20, 0, 0, 10, 10, 10, 1),
+			(5, 5, 5, 10, 10, 10, 1),
+		]
+		report = LayoutVerifier().verify_boxes(CARTON, boxes)
+
+		self.assertFalse(report["valid"])
+		self.assertEqual(report["overlaps"], [(0, 2)])
+		self.assertEqual(report["overlap_count"], 1)
+
+	def test_out_of_bounds_is_reported(self):
+		boxes = [
+			(0, 0, 0, 10, 10, 10, 1),
+			(35, 0, 0, 10, 10, 10, 1),
+			(15, 0, -1, 10, 10, 10, 1),
+			(0, 25, 12, 5, 5, 10, 1),
+		]
+		report = LayoutVerifier().verify_boxes(CARTON, boxes)
+
+		self.assertFalse(report["valid"])
+		self.assertEqual(report["containment"], [1, 2, 3])
+		self.assertEqual(report["overlaps"], [])
+
+	def test_weight_limit(self):
+		boxes = [(0, 0, 0, 10, 10, 10, 6), (10, 0, 0, 10, 10, 10, 6)]
+		report = LayoutVerifier().verify_boxes(CARTON, boxes)
+
+		self.assertFalse(report["valid"])
+		self.assertTrue(report["overweight"])
+		self.assertEqual(report["total_weight"], 12)
+
+	def test_verify_result_reports_failing_patterns(self):
+		def position(x):
+			return {"x": x, "y": 0, "z": 0, "length": 10, "width": 10, "height": 10}
+
+		result = {"carton_assignments": [
+			{"carton": CARTON, "pattern_signature": "ok", "positions_3d": {"A": [position(0), position(10)]}},
+			{"carton": CARTON, "pattern_signature": "overlap", "positions_3d": {"A": [position(0), position(5)]}},
+			{"carton": CARTON, "pattern_signature": "no layout", "positions_3d": {}},
+		]}
+		violations = LayoutVerifier().verify_result(result, [{"item": {"id": "A", "weight": 1}, "quantity": 4}])
+
+		self.assertEqual([report["pattern_signature"] for report in violations], ["overlap"])
+		self.assertEqual(violations[0]["carton_id"], "_Test Carton")
@@ -0,0 +1,114 @@
+import math
+from typing import Dict, Iterable, List, Optional, Tuple
+
+# (x, y, z, length, width, height, weight)
+Box = Tuple[float, float, float, float, float, float, float]
+
+
+class LayoutVerifier:
+    """
+    Geometric check of packing layouts
+
+    Verifies that placements stay inside the carton, do not overlap each other
+    and stay within the carton's weight limit. Overlap candidates come from a
+    uniform grid (spatial hash) with cells as large as the largest placement,
+    so every placement touches at most 8 cells and only neighbours sharing a
+    cell are compared; 100k+ placements verify in well under a second.
+    """
+
+    def __init__(self, tolerance: float = 1e-6, max_reported: int = 100):
+        self.tolerance = tolerance
+        self.max_reported = max_reported
+
+    def verify_boxes(self, carton: Dict, boxes: List[Box]) -> Dict:
+        tol = self.tolerance
+        length, width, height = carton["length"], carton["width"], carton["height"]
+
+        containment = []
+        for idx, (x, y, z, l, w, h, _) in enumerate(boxes):
+            if (x < -tol or y < -tol or z < -tol
+                    or x + l > length + tol or y + w > width + tol or z + h > height + tol):
+                containment.append(idx)
+
+        overlaps = self._find_overlaps(boxes)
+
+        total_weight = sum(box[6] for box in boxes)
+        weight_limit = carton.get("weight_limit") or 0
+        overweight = bool(weight_limit) and total_weight > weight_limit + tol
+
+        return {
+            "valid": not containment and not overlaps and not overweight,
+            "placements": len(boxes),
+            "containment": containment[:self.max_reported],
+            "containment_count": len(containment),
+            "overlaps": overlaps[:self.max_reported],
+            "overlap_count": len(overlaps),
+            "total_weight": total_weight,
+            "weight_limit": weight_limit,
+            "overweight": overweight
+        }
+
+    def _find_overlaps(self, boxes: List[Box]) -> List[Tuple[int, int]]:
+        if len(boxes) < 2:
+            return []
+
+        tol = self.tolerance
+        cell_x = max(box[3] for box in boxes) or 1
+        cell_y = max(box[4] for box in boxes) or 1
+        cell_z = max(box[5] for box in boxes) or 1
+
+        grid = {}
+        overlaps = []
+        floor = math.floor
+
+        for idx, (x, y, z, l, w, h, _) in enumerate(boxes):
+            x2, y2, z2 = x + l, y + w, z + h
+            # Shrink by the tolerance so boxes that only touch share no cell
+            cx1, cx2 = floor((x + tol) / cell_x), floor((x2 - tol) / cell_x)
+            cy1, cy2 = floor((y + tol) / cell_y), floor((y2 - tol) / cell_y)
+            cz1, cz2 = floor((z + tol) / cell_z), floor((z2 - tol) / cell_z)
+
+            checked = set()
+            for cx in range(cx1, cx2 + 1):
+                for cy in range(cy1, cy2 + 1):
+                    for cz in range(cz1, cz2 + 1):
+                        cell = grid.setdefault((cx, cy, cz), [])
+                        for other in cell:
+                            if other in checked:
+                                continue
+                            checked.add(other)
+                            ox, oy, oz, ol, ow, oh, _ = boxes[other]
+                            if (min(x2, ox + ol) - max(x, ox) > tol
+                                    and min(y2, oy + ow) - max(y, oy) > tol
+                                    and min(z2, oz + oh) - max(z, oz) > tol):
+                                overlaps.append((other, idx))
+                        cell.append(idx)
+
+        return overlaps
+
+    def verify_assignment(self, assignment: Dict, item_weights: Optional[Dict[str, float]] = None) -> Dict:
+        """Check one pattern of a suggest_cartons result (positions are per item code)"""
+        boxes = list(self._assignment_boxes(assignment, item_weights or {}))
+        report = self.verify_boxes(assignment["carton"], boxes)
+        report["carton_id"] = assignment.get("carton_id") or assignment["carton"].get("id")
+        report["pattern_signature"] = assignment.get("pattern_signature")
+        return report
+
+    def verify_result(self, result: Dict, items_data: List[Dict]) -> List[Dict]:
+        """Reports of the patterns in a suggest_cartons result that fail verification"""
+        item_weights = {entry["item"]["id"]: entry["item"].get("weight") or 0 for entry in items_data}
+        violations = []
+        for assignment in result["carton_assignments"]:
+            if not assignment.get("positions_3d"):
+                continue
+            report = self.verify_assignment(assignment, item_weights)
+            if not report["valid"]:
+                violations.append(report)
+        return violations
+
+    @staticmethod
+    def _assignment_boxes(assignment: Dict, item_weights: Dict[str, float]) -> Iterable[Box]:
+        for item_code, positions in (assignment.get("positions_3d") or {}).items():
+            weight = item_weights.get(item_code, 0)
+            for p in positions or []:
+                yield (p["x"], p["y"], p["z"], p["length"], p["width"], p["height"], weight)
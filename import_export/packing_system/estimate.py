@@ -0,0 +1,116 @@
+"""
+Live packing estimate for order forms
+
+Capacity-only packing (enable_3d=False) of an arbitrary item/qty list for
+the Sales Order form, recalculated on every qty change. Nothing is written:
+the carton catalog is cached in Redis (cleared when a Carton changes), item
+dimensions come from the shared Item attribute cache and fit counts from the
+calculator's in-process fit table.
+"""
+
+import math
+
+import frappe
+from frappe import _
+
+from .core.calculator import get_orientation_mask
+from .main_controller import PackingController
+from .pick_list_packing import get_available_cartons
+from .utils import bump_catalog_version
+from import_export.import_export.item_attributes import get_item_attributes
+
+CATALOG_CACHE_KEY = "import_export:packing_catalog"
+
+def get_cached_cartons():
+    return frappe.cache().get_value(CATALOG_CACHE_KEY, generator=get_available_cartons)
+
+
+def clear_catalog_cache(doc=None, method=None):
+    frappe.cache().delete_value(CATALOG_CACHE_KEY)
+    frappe.db.after_commit.add(bump_catalog_version)
+
+
+def get_estimate_items(items):
+    """Engine item entries for [{item_code, qty}], skipping rows without dimensions"""
+    quantities = {}
+    for row in items:
+        if row.get("item_code") and int(row.get("qty") or 0) > 0:
+            quantities[row["item_code"]] = quantities.get(row["item_code"], 0) + int(row["qty"])
+
+    item_attributes = get_item_attributes(list(quantities))
+    items_data, skipped = [], []
+    for item_code, qty in quantities.items():
+        item = item_attributes.get(item_code)
+        if not item or not (item.get("length") and item.get("width") and item.get("height")):
+            skipped.append(item_code)
+            continue
+
+        items_data.append({
+            "item": {
+                "id": item_code,
+                "name": item.item_name or item_code,
+                "length": item.length,
+                "width": item.width,
+                "height": item.height,
+                "weight": item.get("weight_per_unit") or 0,
+                "volume": item.get("volume_per_unit") or (item.length * item.width * item.height),
+                "fragile": item.get("fragile", False),
+                "orientation_mask": get_orientation_mask(item.get("orientation_constraint"))
+            },
+            "quantity": qty
+        })
+
+    return items_data, skipped
+
+
+@frappe.whitelist()
+def estimate_packing(items, strategy="minimize_cartons"):
+    """
+    Carton count bounds, CBM and packing cost for [{item_code, qty}]
+    Lower bound is by volume and weight against the largest carton; upper bound is a capacity-only packing
+    """
+    if not frappe.has_permission("Item", "read"):
+        frappe.throw(_("Not permitted to read Items"), frappe.PermissionError)
+
+    items_data, skipped = get_estimate_items(frappe.parse_json(items) or [])
+    cartons_data = get_cached_cartons()
+
+    if not items_data or not cartons_data:
+        return {
+            "cartons_min": 0, "cartons_max": 0, "cbm": 0, "item_cbm": 0,
+            "estimated_cost": 0, "unpacked_items": [], "skipped_items": skipped
+        }
+
+    result = PackingController().suggest_cartons(
+        items_data=items_data,
+        cartons_data=cartons_data,
+        strategy=strategy,
+        enable_3d=False
+    )
+
+    item_volume = sum(entry["item"]["volume"] * entry["quantity"] for entry in items_data)
+    item_weight = sum(entry["item"]["weight"] * entry["quantity"] for entry in items_data)
+    max_volume = max(carton["volume"] or 0 for carton in cartons_data)
+    max_weight = max(carton["weight_limit"] or 0 for carton in cartons_data)
+
+    cartons_min = math.ceil(item_volume / max_volume) if max_volume else 0
+    if max_weight:
+        cartons_min = max(cartons_min, math.ceil(item_weight / max_weight))
+
+    carton_volume = sum(
+        (assignment["carton"]["volume"] or 0) * assignment["carton_count"]
+        for assignment in result["carton_assignments"]
+    )
+
+    return {
+        "cartons_min": min(cartons_min, result["total_cartons"]),
+        "cartons_max": result["total_cartons"],
+        # Dimensions are in cm
+        "cbm": carton_volume / 1000000,
+        "item_cbm": item_volume / 1000000,
+        "estimated_cost": result["total_cost"],
+        "unpacked_items": [
+            {"item_code": entry["item"]["id"], "qty": entry["quantity"]} for entry in result["unpacked_items"]
+        ],
+        "skipped_items": skipped
+    }
@@ -1,20 +1,30 @@
+import copy
 import json
 import math
+from collections import OrderedDict
 from typing import Dict, List, Optional, Tuple
 from .core.calculator import PackingCalculator
 from .core.optimizer import PackingOptimizer
 from .core.carton_assignment import CartonAssignment
+from .core.carton_mix import CartonMixSolver
+from .core.verifier import LayoutVerifier
+
+LEVEL_CACHE_SIZE = 256
+_level_cache = OrderedDict()
 
 class PackingController:
     """Main controller for packing operations with pattern optimization"""
 
     def __init__(self):
         self.calculator = PackingCalculator()
+        self.mix_solver = CartonMixSolver()
 
     def suggest_cartons(self, items_data: List[Dict], cartons_data: List[Dict],
-                    strategy: str = "minimize_cartons", enable_3d: bool = True) -> Dict:
+                    strategy: str = "minimize_cartons", enable_3d: bool = True,
+                    verify_layouts: bool = False) -> Dict:
         """
         Enhanced packing calculation with pattern deduplication
+        verify_layouts: debug post-check of every 3D pattern, reported as `layout_violations`
         """
         if not items_data:
             raise ValueError("No valid items found for packing calculation")
@@ -39,6 +49,16 @@ class PackingController:
             remaining_qty = group["total_qty"]
             item = group["sample_item"]
 
+            if strategy == "minimize_cost":
+                # Exact cheapest mix of cartons for the whole group quantity
+                options = optimizer.get_carton_options(item, cartons_data, remaining_qty)
+                for option, carton_count in self.mix_solver.solve(options, remaining_qty):
+                    units = min(remaining_qty, carton_count * option["fit_capacity"])
+                    while units > 0:
+                        packed = self._add_pattern(pattern_registry, item, option, units, enable_3d)
+                        units -= packed
+                        remaining_qty -= packed
+
             while remaining_qty > 0:
                 assignment = optimizer.find_optimal_carton_assignment(item, cartons_data, remaining_qty)
 
@@ -50,71 +70,7 @@ class PackingController:
                         })
                     break
 
-                # Generate pattern based on FULL CAPACITY
-                if enable_3d:
-                    units_fit, full_capacity_positions = self.calculator.max_units_fit_with_3d_positions(
-                        item, assignment["carton"]
-                    )
-                    pattern_sig = self.calculator.create_pattern_signature(
-                        item["id"],
-                        assignment["carton"]["id"],
-                        full_capacity_positions
-                    )
-                    items_per_carton = units_fit
-                else:
-                    full_capacity_positions = None
-                    pattern_sig = None
-                    items_per_carton = assignment["fit_capacity"]
-
-                # CRITICAL FIX: Calculate cartons for THIS BATCH only
-                units_this_batch = min(remaining_qty, items_per_carton * 10000)  # Process in large batches
-                cartons_for_this_batch = math.ceil(units_this_batch / items_per_carton) if items_per_carton > 0 else 0
-
-                if cartons_for_this_batch > 0:
-                    carton_id = assignment["carton"]["id"]
-
-                    # Check if pattern exists
-                    if pattern_sig and pattern_sig in pattern_registry:
-                        # Add to existing pattern
-                        pattern_registry[pattern_sig]["carton_count"] += cartons_for_this_batch
-                        pattern_registry[pattern_sig]["total_cost"] += assignment["carton"].get("cost_per_unit", 0) * cartons_for_this_batch
-                        pattern_registry[pattern_sig]["total_items"] += units_this_batch
-                    else:
-                        # New pattern
-                        pattern_key = pattern_sig if pattern_sig else f"{carton_id}_{item['id']}_{len(pattern_registry)}"
-
-                        pattern_registry[pattern_key] = {
-                            "carton": assignment["carton"],
-                            "carton_id": carton_id,
-                            "carton_name": assignment["carton"].get("carton_name", carton_id),
-                            "carton_count": cartons_for_this_batch,
-                            "efficiency": assignment["efficiency"],
-                            "packing_efficiency": assignment["efficiency"],
-                            "utilization": assignment["efficiency"],
-                            "pattern_signature": pattern_sig,
-                            "total_items": units_this_batch,
-                            "items_per_carton": items_per_carton,
-                            "total_cost": assignment["carton"].get("cost_per_unit", 0) * cartons_for_this_batch,
-                            "item_summary": f"{item['id']} (×{items_per_carton} per carton)",
-                            "items": [{
-                                "item_code": item["id"],
-                                "quantity": items_per_carton,
-                                "positions": full_capacity_positions if enable_3d else []
-                            }],
-                            "positions_3d": {
-                                item["id"]: full_capacity_positions
-                            } if enable_3d else {},
-                            "item_info": {
-                                item["id"]: {
-                                    "name": item.get("name", item["id"]),
-                                    "length": item["length"],
-                                    "width": item["width"],
-                                    "height": item["height"],
-                                    "color": item.get("color", "#3498db")
-                                }
-                            } if enable_3d else {}
-                        }
-
+                units_this_batch = self._add_pattern(pattern_registry, item, assignment, remaining_qty, enable_3d)
                 remaining_qty -= units_this_batch
 
         # Convert to list
@@ -137,8 +93,224 @@ class PackingController:
             "cartons_evaluated": len(cartons_data)
         }
 
+        if verify_layouts and enable_3d:
+            result["layout_violations"] = LayoutVerifier().verify_result(result, items_data)
+
+        return result
+
+    def suggest_nested_cartons(self, items_data: List[Dict], cartons_data: List[Dict],
+                               strategy: str = "minimize_cartons", enable_3d: bool = True) -> Dict:
+        """
+        Two-level packing: items into Inner cartons, filled inners into Master cartons
+        Master assignments carry the inner pattern they hold under "inner"; inners that
+        fit no master are shipped as they are
+        """
+        inner_cartons = [c for c in cartons_data if c.get("packing_level") == "Inner"]
+        master_cartons = [c for c in cartons_data if c.get("packing_level") == "Master"] or [
+            c for c in cartons_data if c.get("packing_level") != "Inner"
+        ]
+
+        if not inner_cartons:
+            raise ValueError("No inner cartons available for nested packing")
+        if not master_cartons:
+            raise ValueError("No master cartons available for nested packing")
+
+        inner_result = self._pack_level(items_data, inner_cartons, strategy, enable_3d)
+        item_weights = {entry["item"]["id"]: entry["item"].get("weight") or 0 for entry in items_data}
+        item_fragile = {entry["item"]["id"]: entry["item"].get("fragile", False) for entry in items_data}
+        item_masks = {entry["item"]["id"]: entry["item"].get("orientation_mask") for entry in items_data}
+
+        carton_assignments = []
+        master_result_totals = {"total_cartons": 0, "total_cost": 0, "unique_patterns": 0}
+
+        for inner in inner_result["carton_assignments"]:
+            item_code = inner["items"][0]["item_code"] if inner.get("items") else None
+            inner_id = f"{inner['carton_id']}:{inner.get('pattern_signature') or item_code}"
+            carton = inner["carton"]
+
+            # A filled inner carton is one unit at the master level. It holds a single item,
+            # packed with the item's vertical axis along the carton's, so the item's
+            # orientation constraint applies to the inner carton as well
+            inner_unit = {
+                "id": inner_id,
+                "name": f"{inner['carton_id']} ({inner['item_summary']})",
+                "length": carton["length"],
+                "width": carton["width"],
+                "height": carton["height"],
+                "volume": carton.get("volume") or carton["length"] * carton["width"] * carton["height"],
+                "weight": item_weights.get(item_code, 0) * inner["items_per_carton"],
+                "fragile": item_fragile.get(item_code, False),
+                "color": "#c8a165"
+            }
+            if item_masks.get(item_code) is not None:
+                inner_unit["orientation_mask"] = item_masks[item_code]
+            master_result = self._pack_level(
+                [{"item": inner_unit, "quantity": inner["carton_count"]}], master_cartons, strategy, enable_3d
+            )
+
+            inner_info = {
+                "carton_id": inner["carton_id"],
+                "carton": carton,
+                "item_code": item_code,
+                "items_per_carton": inner["items_per_carton"],
+                "item_summary": inner["item_summary"],
+                "pattern_signature": inner.get("pattern_signature"),
+                "positions_3d": inner.get("positions_3d") or {},
+                "cost_per_unit": carton.get("cost_per_unit", 0)
+            }
+
+            units_left = inner["total_items"]
+            for master in master_result["carton_assignments"]:
+                units = min(master["total_items"] * inner["items_per_carton"], units_left)
+                units_left -= units
+                carton_assignments.append({
+                    **master,
+                    "inner": inner_info,
+                    "inners_per_carton": master["items_per_carton"],
+                    "inner_cartons": master["total_items"],
+                    "items_per_carton": master["items_per_carton"] * inner["items_per_carton"],
+                    "total_items": units,
+                    # Masters plus the inners inside them
+                    "total_cost": master["total_cost"] + master["total_items"] * inner_info["cost_per_unit"],
+                    "item_summary": f"{master['items_per_carton']} × {inner['carton_id']} ({inner['item_summary']})"
+                })
+
+            master_result_totals["total_cartons"] += master_result["total_cartons"]
+            master_result_totals["total_cost"] += master_result["total_cost"]
+            master_result_totals["unique_patterns"] += master_result["unique_patterns"]
+
+            # Inners no master carton can take ship on their own
+            for unpacked in master_result["unpacked_items"]:
+                units = min(unpacked["quantity"] * inner["items_per_carton"], units_left)
+                units_left -= units
+                carton_assignments.append({
+                    **inner,
+                    "carton_count": unpacked["quantity"],
+                    "total_items": units,
+                    "total_cost": carton.get("cost_per_unit", 0) * unpacked["quantity"]
+                })
+
+        total_cartons = sum(p["carton_count"] for p in carton_assignments)
+        efficiency_scores = [p["efficiency"] for p in carton_assignments]
+
+        return {
+            "carton_assignments": carton_assignments,
+            "total_cartons": total_cartons,
+            "unique_patterns": len(carton_assignments),
+            "total_cost": sum(p["total_cost"] for p in carton_assignments),
+            "average_efficiency": sum(efficiency_scores) / len(efficiency_scores) if efficiency_scores else 0,
+            "unpacked_items": inner_result["unpacked_items"],
+            "levels": {
+                "inner": {
+                    "total_cartons": inner_result["total_cartons"],
+                    "unique_patterns": inner_result["unique_patterns"],
+                    "total_cost": inner_result["total_cost"]
+                },
+                "master": master_result_totals
+            },
+            "strategy_used": f"{strategy}_nested",
+            "items_processed": sum(item_entry["quantity"] for item_entry in items_data),
+            "cartons_evaluated": len(inner_cartons) + len(master_cartons)
+        }
+
+    def _pack_level(self, items_data: List[Dict], cartons_data: List[Dict], strategy: str, enable_3d: bool) -> Dict:
+        """
+        suggest_cartons memoized per input, so identical inner patterns are packed into masters once
+        Callers get a copy, so they may change the result without touching the cache
+        """
+        key = json.dumps(
+            [
+                [[{k: v for k, v in entry["item"].items() if k not in ("name", "color")}, entry["quantity"]]
+                 for entry in items_data],
+                self.calculator.create_catalog_signature(cartons_data),
+                strategy,
+                enable_3d
+            ],
+            sort_keys=True,
+            default=str
+        )
+
+        if key in _level_cache:
+            _level_cache.move_to_end(key)
+            return copy.deepcopy(_level_cache[key])
+
+        result = self.suggest_cartons(items_data, cartons_data, strategy=strategy, enable_3d=enable_3d)
+        _level_cache[key] = copy.deepcopy(result)
+        if len(_level_cache) > LEVEL_CACHE_SIZE:
+            _level_cache.popitem(last=False)
+
         return result
 
+    def _add_pattern(self, pattern_registry: Dict, item: Dict, assignment: Dict,
+                     remaining_qty: int, enable_3d: bool) -> int:
+        """Record cartons of one carton type for the item; returns the units packed"""
+        # Generate pattern based on FULL CAPACITY
+        if enable_3d:
+            units_fit, full_capacity_positions = self.calculator.max_units_fit_with_3d_positions(
+                item, assignment["carton"]
+            )
+            pattern_sig = self.calculator.create_pattern_signature(
+                item["id"],
+                assignment["carton"]["id"],
+                full_capacity_positions
+            )
+            items_per_carton = units_fit
+        else:
+            full_capacity_positions = None
+            pattern_sig = None
+            items_per_carton = assignment["fit_capacity"]
+
+        # CRITICAL FIX: Calculate cartons for THIS BATCH only
+        units_this_batch = min(remaining_qty, items_per_carton * 10000)  # Process in large batches
+        cartons_for_this_batch = math.ceil(units_this_batch / items_per_carton) if items_per_carton > 0 else 0
+
+        if cartons_for_this_batch > 0:
+            carton_id = assignment["carton"]["id"]
+
+            # Check if pattern exists
+            if pattern_sig and pattern_sig in pattern_registry:
+                # Add to existing pattern
+                pattern_registry[pattern_sig]["carton_count"] += cartons_for_this_batch
+                pattern_registry[pattern_sig]["total_cost"] += assignment["carton"].get("cost_per_unit", 0) * cartons_for_this_batch
+                pattern_registry[pattern_sig]["total_items"] += units_this_batch
+            else:
+                # New pattern
+                pattern_key = pattern_sig if pattern_sig else f"{carton_id}_{item['id']}_{len(pattern_registry)}"
+
+                pattern_registry[pattern_key] = {
+                    "carton": assignment["carton"],
+                    "carton_id": carton_id,
+                    "carton_name": assignment["carton"].get("carton_name", carton_id),
+                    "carton_count": cartons_for_this_batch,
+                    "efficiency": assignment["efficiency"],
+                    "packing_efficiency": assignment["efficiency"],
+                    "utilization": assignment["efficiency"],
+                    "pattern_signature": pattern_sig,
+                    "total_items": units_this_batch,
+                    "items_per_carton": items_per_carton,
+                    "total_cost": assignment["carton"].get("cost_per_unit", 0) * cartons_for_this_batch,
+                    "item_summary": f"{item['id']} (×{items_per_carton} per carton)",
+                    "items": [{
+                        "item_code": item["id"],
+                        "quantity": items_per_carton,
+                        "positions": full_capacity_positions if enable_3d else []
+                    }],
+                    "positions_3d": {
+                        item["id"]: full_capacity_positions
+                    } if enable_3d else {},
+                    "item_info": {
+                        item["id"]: {
+                            "name": item.get("name", item["id"]),
+                            "length": item["length"],
+                            "width": item["width"],
+                            "height": item["height"],
+                            "color": item.get("color", "#3498db")
+                        }
+                    } if enable_3d else {}
+                }
+
+        return units_this_batch
+
     def validate_packing_request(self, request_data: Dict) -> Tuple[bool, str]:
         """Validate packing request data"""
 
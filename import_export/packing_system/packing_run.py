@@ -0,0 +1,142 @@
+"""
+Packing Run records
+
+The full output of a packing calculation (including the 3D positions) is
+stored in a Packing Run, which has change tracking off. The Pick List only
+gets the summary fields, a link to its current run and light carton rows,
+written without a save so no Version diff is recorded for them. Old runs are
+pruned daily according to Packing Settings.
+"""
+
+import json
+
+import frappe
+from frappe.utils import add_days, now_datetime
+
+from .core.calculator import PackingCalculator
+
+PRUNE_BATCH_SIZE = 500
+
+
+def create_packing_run(reference_doctype, reference_name, result, strategy, enable_3d, cartons_data, fingerprint):
+    run = frappe.get_doc({
+        "doctype": "Packing Run",
+        "reference_doctype": reference_doctype,
+        "reference_name": reference_name,
+        "strategy": strategy,
+        "enable_3d": 1 if enable_3d else 0,
+        "catalog_version": PackingCalculator.create_catalog_signature(cartons_data),
+        "fingerprint": fingerprint,
+        "from_cache": 1 if result.get("from_cache") else 0,
+        "total_cartons": result["total_cartons"],
+        "unique_patterns": result.get("unique_patterns", len(result["carton_assignments"])),
+        "unpacked_items": len(result["unpacked_items"]),
+        "total_cost": result["total_cost"],
+        "average_efficiency": result["average_efficiency"],
+        "result": json.dumps(result, default=str)
+    })
+    run.insert(ignore_permissions=True)
+    return run.name
+
+
+def get_run_result(packing_run):
+    """Stored engine output of a run, loaded once per request"""
+    if not hasattr(frappe.local, "packing_run_results"):
+        frappe.local.packing_run_results = {}
+    cache = frappe.local.packing_run_results
+    if packing_run not in cache:
+        result = frappe.db.get_value("Packing Run", packing_run, "result")
+        cache[packing_run] = json.loads(result) if result else None
+    return cache[packing_run]
+
+
+def get_assignment_positions(doc, parentfield="carton_assignments"):
+    """
+    3D positions per carton row idx, from the document's Packing Run
+    Rows stored before runs existed keep their positions on the row itself
+    """
+    positions = {}
+    assignments = get_row_assignments(doc, parentfield)
+
+    for row in doc.get(parentfield) or []:
+        if row.get("positions_3d"):
+            data = row.positions_3d
+            positions[row.idx] = json.loads(data) if isinstance(data, str) else data
+        elif row.idx in assignments:
+            positions[row.idx] = assignments[row.idx].get("positions_3d") or {}
+
+    return positions
+
+
+def get_inner_positions(doc, parentfield="carton_assignments"):
+    """3D positions of the items inside each row's inner carton (nested packing), per row idx"""
+    positions = {}
+    assignments = get_row_assignments(doc, parentfield)
+
+    for row in doc.get(parentfield) or []:
+        if not row.get("inner_carton_id"):
+            continue
+        if row.get("inner_positions_3d"):
+            data = row.inner_positions_3d
+            positions[row.idx] = json.loads(data) if isinstance(data, str) else data
+        elif row.idx in assignments:
+            positions[row.idx] = (assignments[row.idx].get("inner") or {}).get("positions_3d") or {}
+
+    return positions
+
+
+def get_row_assignments(doc, parentfield="carton_assignments"):
+    """
+    Packing Run assignment of each carton row, per row idx
+    Rows point at their assignment by `assignment_no` (rows written before it existed:
+    by pattern signature). The assignment must still have the row's carton and pattern,
+    so edited, removed or reordered rows never show another carton's layout.
+    """
+    result = get_run_result(doc.packing_run) if doc.get("packing_run") else None
+    assignments = result["carton_assignments"] if result else []
+    by_signature = {}
+    for assignment in assignments:
+        if assignment.get("pattern_signature"):
+            by_signature.setdefault(assignment["pattern_signature"], assignment)
+
+    matched = {}
+    for row in doc.get(parentfield) or []:
+        assignment_no = row.get("assignment_no")
+        if assignment_no:
+            assignment = assignments[assignment_no - 1] if assignment_no <= len(assignments) else None
+        else:
+            assignment = by_signature.get(row.get("pattern_signature"))
+
+        if assignment and assignment_matches(row, assignment):
+            matched[row.idx] = assignment
+
+    return matched
+
+
+def assignment_matches(row, assignment):
+    signature = assignment.get("pattern_signature") or ""
+    return (
+        (assignment.get("carton") or {}).get("id") == row.get("carton_id")
+        and signature == (row.get("pattern_signature") or "")
+    )
+
+
+def prune_packing_runs():
+    """Daily: delete runs past retention that no Pick List points at any more"""
+    days = frappe.db.get_single_value("Packing Settings", "packing_run_retention_days")
+    if not days:
+        return
+
+    names = frappe.get_all(
+        "Packing Run",
+        filters={"creation": ["<", add_days(now_datetime(), -days)]},
+        pluck="name"
+    )
+
+    for start in range(0, len(names), PRUNE_BATCH_SIZE):
+        batch = names[start:start + PRUNE_BATCH_SIZE]
+        current = set(frappe.get_all("Pick List", filters={"packing_run": ["in", batch]}, pluck="packing_run"))
+        stale = [name for name in batch if name not in current]
+        if stale:
+            frappe.db.delete("Packing Run", {"name": ["in", stale]})
+            frappe.db.commit()
@@ -1,17 +1,35 @@
 import frappe
+import hashlib
 import json
 from frappe import _
-from frappe.utils import flt, ceil
+from frappe.utils import flt, ceil, sbool
 from .main_controller import PackingController
+from .core.calculator import get_orientation_mask
+from .core.custom_carton import CustomCartonSizer, DEFAULT_MAX_DIMENSIONS
+from .client import PackingServiceClient, PackingServiceUnavailable
+from .result_cache import get_result_cache_key, get_cached_result, set_cached_result
+from .single_flight import single_flight
+from .packing_run import create_packing_run, get_assignment_positions
+from .utils import conditional_response, get_catalog_version, replace_child_rows
+from .profiling import run_with_profiler
+from import_export.import_export.item_attributes import get_item_attributes
+
+
+def get_available_cartons(include_inner=False):
+    """
+    Get available cartons from Carton doctype or return demo data
+    Inner cartons only hold items inside a master carton and are left out unless
+    `include_inner` is set (nested packing)
+    """
+    filters = {"disabled": 0}
+    if not include_inner:
+        filters["packing_level"] = ["!=", "Inner"]
 
-
-def get_available_cartons():
-    """Get available cartons from Carton doctype or return demo data"""
     cartons = frappe.get_all("Carton",
-        filters={"disabled": 0},
+        filters=filters,
         fields=["name", "length", "width", "height",
                 "weight_limit", "cost_per_unit", "volume", "carton_type",
-                "material", "fragile_safe", "max_stack_height", "uom"]
+                "material", "fragile_safe", "max_stack_height", "uom", "packing_level"]
     )
 
     cartons_data = []
@@ -30,131 +48,334 @@ def get_available_cartons():
             "carton_type": carton.carton_type or "Standard",
             "max_stack_height": carton.max_stack_height or 100,
             "material": carton.material or "Cardboard",
-            "fragile_safe": carton.fragile_safe or False
+            "fragile_safe": carton.fragile_safe or False,
+            "packing_level": carton.packing_level or "Single"
         })
 
     return cartons_data
 
 
-@frappe.whitelist()
-def calculate_pick_list_packing(pick_list_name, strategy="minimize_cartons", enable_3d=True):
-    """
-    Calculate packing with pattern deduplication
-    """
-    pick_list = frappe.get_doc("Pick List", pick_list_name)
-
-    # Extract items from locations child table
+def get_packing_items(rows):
+    """Build packing engine item entries from rows carrying item_code and qty"""
     items_data = []
-    for location in pick_list.locations:
+    item_attributes = get_item_attributes([location.item_code for location in rows if location.qty > 0])
+    for location in rows:
         if location.qty > 0:
-            item_doc = frappe.get_doc("Item", location.item_code)
+            item_doc = item_attributes.get(location.item_code) or frappe._dict()
             items_data.append({
                 "item": {
                     "id": location.item_code,
-                    "name": item_doc.item_name or location.item_code,
-                    "length": getattr(item_doc, 'length', 10),
-                    "width": getattr(item_doc, 'width', 10),
-                    "height": getattr(item_doc, 'height', 5),
-                    "weight": getattr(item_doc, 'weight_per_unit', 0.5),
-                    "volume": getattr(item_doc, 'volume_per_unit', 0) or (
-                        getattr(item_doc, 'length', 10) *
-                        getattr(item_doc, 'width', 10) *
-                        getattr(item_doc, 'height', 5)
+                    "name": item_doc.get('item_name') or location.item_code,
+                    "length": item_doc.get('length', 10),
+                    "width": item_doc.get('width', 10),
+                    "height": item_doc.get('height', 5),
+                    "weight": item_doc.get('weight_per_unit', 0.5),
+                    "volume": item_doc.get('volume_per_unit', 0) or (
+                        item_doc.get('length', 10) *
+                        item_doc.get('width', 10) *
+                        item_doc.get('height', 5)
                     ),
-                    "area": getattr(item_doc, 'area', 0) or (
-                        getattr(item_doc, 'length', 10) * getattr(item_doc, 'width', 10)
+                    "area": item_doc.get('area', 0) or (
+                        item_doc.get('length', 10) * item_doc.get('width', 10)
                     ),
-                    "fragile": getattr(item_doc, 'fragile', False),
+                    "fragile": item_doc.get('fragile', False),
+                    "orientation_mask": get_orientation_mask(item_doc.get('orientation_constraint')),
                     "color": f"#{hash(location.item_code) % 0xFFFFFF:06x}"
                 },
                 "quantity": int(location.qty)
             })
 
+    return items_data
+
+
+def get_packing_cache_key(items_data, cartons_data, strategy, enable_3d, nested=False):
+    return get_result_cache_key(items_data, cartons_data, f"nested:{strategy}" if nested else strategy, enable_3d)
+
+
+def run_packing(items_data, cartons_data, strategy="minimize_cartons", enable_3d=True, use_cache=True,
+                cache_ttl=None, nested=False):
+    """
+    Run packing, answering repeat requests for the same items, catalog,
+    strategy and enable_3d from the result cache (flagged with `from_cache`)
+    With `nested`, items are packed into inner cartons and those into master cartons
+    """
+    cache_key = get_packing_cache_key(items_data, cartons_data, strategy, enable_3d, nested)
+
+    if use_cache:
+        cached = get_cached_result(cache_key)
+        if cached:
+            return {**cached, "from_cache": True}
+
+    if nested:
+        # The packing service only runs single-level packing
+        result = PackingController().suggest_nested_cartons(
+            items_data=items_data,
+            cartons_data=cartons_data,
+            strategy=strategy,
+            enable_3d=enable_3d
+        )
+    else:
+        result = compute_packing(items_data, cartons_data, strategy, enable_3d)
+    set_cached_result(cache_key, result, ttl=cache_ttl)
+
+    return {**result, "from_cache": False}
+
+
+def get_custom_carton_suggestions(unpacked_items, cartons_data):
+    """Ready-to-create Carton records for unpacked items, sized per Packing Settings"""
+    if not unpacked_items:
+        return []
+
+    from .catalog_design import estimate_cost_rate
+
+    settings = frappe.get_cached_doc("Packing Settings")
+    sizer = CustomCartonSizer(
+        size_step=settings.get("custom_carton_size_step") or 1,
+        max_dimensions=(
+            settings.get("custom_carton_max_length") or DEFAULT_MAX_DIMENSIONS[0],
+            settings.get("custom_carton_max_width") or DEFAULT_MAX_DIMENSIONS[1],
+            settings.get("custom_carton_max_height") or DEFAULT_MAX_DIMENSIONS[2]
+        ),
+        weight_limit=settings.get("custom_carton_weight_limit") or max(
+            (flt(carton.get("weight_limit")) for carton in cartons_data), default=0
+        ),
+        cost_rate=estimate_cost_rate(cartons_data),
+        objective="cost" if settings.get("custom_carton_objective") == "Minimum Cost" else "volume"
+    )
+
+    uom = settings.get("default_dimension_uom") or (cartons_data[0].get("uom") if cartons_data else None) or "cm"
+    return sizer.suggest_for_unpacked(unpacked_items, uom=uom)
+
+
+@frappe.whitelist()
+def create_custom_cartons(cartons):
+    """
+    Create suggested custom Carton records (see get_custom_carton_suggestions)
+    Cartons whose name already exists are reused, not created again
+    """
+    frappe.has_permission("Carton", "create", throw=True)
+
+    created, existing = [], []
+    for carton in frappe.parse_json(cartons) or []:
+        name = carton.get("carton_name")
+        if not name or name in created or name in existing:
+            continue
+        if frappe.db.exists("Carton", name):
+            existing.append(name)
+            continue
+        frappe.get_doc({**carton, "doctype": "Carton"}).insert()
+        created.append(name)
+
+    return {"created": created, "existing": existing}
+
+
+def compute_packing(items_data, cartons_data, strategy="minimize_cartons", enable_3d=True):
+    """
+    Run the packing engine on the warm packing service when one is configured
+    (site config `packing_service_url`), falling back to in-process calculation
+    """
+    service_url = frappe.conf.get("packing_service_url")
+
+    if service_url:
+        client = PackingServiceClient(service_url, timeout=frappe.conf.get("packing_service_timeout") or 30)
+        try:
+            return client.suggest_cartons(
+                items_data=items_data,
+                cartons_data=cartons_data,
+                strategy=strategy,
+                enable_3d=enable_3d
+            )
+        except PackingServiceUnavailable as e:
+            frappe.logger("import_export").warning(f"Packing service unavailable, packing in-process: {e}")
+
+    controller = PackingController()
+    return controller.suggest_cartons(
+        items_data=items_data,
+        cartons_data=cartons_data,
+        strategy=strategy,
+        enable_3d=enable_3d
+    )
+
+
+@frappe.whitelist()
+def calculate_pick_list_packing(pick_list_name, strategy="minimize_cartons", enable_3d=True, modified=None,
+                                packing_mode="single", slim=False):
+    """
+    Calculate packing with pattern deduplication
+    `modified` is the caller's version of the Pick List; stale callers are rejected
+    `packing_mode` "nested" packs items into inner cartons and those into master cartons
+    `slim` returns only the summary fields and the replaced carton row names instead of
+    the whole Pick List, for callers that reload the document anyway
+    """
+    pick_list = frappe.get_doc("Pick List", pick_list_name)
+    pick_list.check_permission("write")
+    enable_3d = sbool(enable_3d)
+    nested = packing_mode == "nested"
+
+    if pick_list.docstatus != 0:
+        frappe.throw(_("Packing can only be calculated for draft Pick Lists"))
+
+    if modified and str(pick_list.modified) != str(modified):
+        frappe.throw(
+            _("Pick List {0} has been modified after you opened it. Please reload and try again.").format(pick_list_name),
+            frappe.TimestampMismatchError
+        )
+
+    response = pack_pick_list(pick_list, strategy, enable_3d, nested)
+    if not sbool(slim):
+        response = {**response, "pick_list": frappe.get_doc("Pick List", pick_list_name).as_dict()}
+
+    return response
+
+
+def pack_pick_list(pick_list, strategy="minimize_cartons", enable_3d=True, nested=False, cartons_data=None):
+    """Pack a draft Pick List and store the result (shared by the form button and catalog repacks)"""
+    packing_mode = "nested" if nested else "single"
+
+    # Extract items from locations child table
+    items_data = get_packing_items(pick_list.locations)
+
     if not items_data:
         frappe.throw(_("No items found in Pick List locations"))
 
-    cartons_data = get_available_cartons()
+    if cartons_data is None:
+        cartons_data = get_available_cartons(include_inner=nested)
     if not cartons_data:
         frappe.throw(_("No cartons available for packing"))
 
+    if nested and not any(carton["packing_level"] == "Inner" for carton in cartons_data):
+        frappe.throw(_("Nested packing needs at least one Carton with Packing Level Inner"))
+
+    # Concurrent requests for the same Pick List and inputs share one calculation
+    fingerprint = hashlib.md5("|".join([
+        str(pick_list.modified),
+        get_packing_cache_key(items_data, cartons_data, strategy, enable_3d, nested)
+    ]).encode()).hexdigest()
+
+    return single_flight(
+        f"Pick List:{pick_list.name}",
+        fingerprint,
+        lambda: run_with_profiler(
+            "Pick List", pick_list.name, fingerprint,
+            lambda: apply_pick_list_packing(pick_list, items_data, cartons_data, strategy, enable_3d, nested),
+            details={
+                "Strategy": strategy,
+                "Mode": packing_mode,
+                "3D": enable_3d,
+                "Items": len(items_data),
+                "Units": sum(entry["quantity"] for entry in items_data),
+                "Cartons in catalog": len(cartons_data)
+            }
+        )
+    )
+
+
+def apply_pick_list_packing(pick_list, items_data, cartons_data, strategy, enable_3d, nested=False):
+    """Run packing and store the carton assignments on the Pick List"""
     # Run packing calculation with pattern deduplication
-    controller = PackingController()
-    result = controller.suggest_cartons(
+    result = run_packing(
         items_data=items_data,
         cartons_data=cartons_data,
         strategy=strategy,
-        enable_3d=enable_3d
+        enable_3d=enable_3d,
+        nested=nested
     )
 
-    # Clear existing carton assignments
-    pick_list.carton_assignments = []
-
-    # Update Pick List with DEDUPLICATED carton assignments
-    for assignment in result["carton_assignments"]:
-        carton_assignment = pick_list.append("carton_assignments", {})
-
-        # Set carton fields
-        carton_assignment.carton = assignment["carton"]["id"]
-        carton_assignment.carton_id = assignment["carton"]["id"]
-        carton_assignment.carton_name = assignment["carton"]["id"]
-        carton_assignment.carton_type = assignment["carton"].get("carton_type", "Standard")
-        carton_assignment.carton_count = assignment["carton_count"]  # Now represents pattern repetitions
-        carton_assignment.total_cost = assignment["total_cost"]
-        carton_assignment.packing_efficiency = assignment["efficiency"]
-        carton_assignment.utilization = float(str(assignment.get("utilization", "0")).replace("%", ""))
-        carton_assignment.item_summary = assignment.get("item_summary", "")
-        carton_assignment.total_items = assignment.get("total_items", 0)
-        carton_assignment.length = assignment["carton"]["length"]
-        carton_assignment.width = assignment["carton"]["width"]
-        carton_assignment.height = assignment["carton"]["height"]
-        carton_assignment.weight_limit = assignment["carton"]["weight_limit"]
-        carton_assignment.cost_per_unit = assignment["carton"]["cost_per_unit"]
-        carton_assignment.items_per_carton = assignment.get("items_per_carton", 0)
-        carton_assignment.pattern_signature = assignment.get("pattern_signature", "")
-
-        # Store COMPRESSED 3D positions (SINGLE PATTERN only, not all cartons)
-        if assignment.get("items") and enable_3d:
-            positions_data = {}
-            for item in assignment["items"]:
-                # Store only the pattern positions (not repeated for each carton)
-                positions_data[item["item_code"]] = item["positions"]
-
-            carton_assignment.positions_3d = json.dumps(positions_data)
-        else:
-            carton_assignment.positions_3d = ""
+    packing_run = create_packing_run(
+        "Pick List", pick_list.name, result, strategy, enable_3d, cartons_data,
+        get_packing_cache_key(items_data, cartons_data, strategy, enable_3d, nested)
+    )
 
-    # Update summary fields
-    pick_list.total_cartons = result["total_cartons"]
-    pick_list.unique_packing_patterns = result.get("unique_patterns", len(result["carton_assignments"]))
-    pick_list.total_packing_cost = result["total_cost"]
-    pick_list.average_efficiency = result["average_efficiency"]
-    pick_list.packing_strategy = result["strategy_used"]
+    # Carton rows and summary are written without save(): the full output lives in the
+    # Packing Run, so none of it goes through the Pick List's version history
+    rows = []
+    for assignment_no, assignment in enumerate(result["carton_assignments"], 1):
+        # DEDUPLICATED carton assignments; 3D positions stay on the run
+        inner = assignment.get("inner") or {}
+        rows.append({
+            "carton_id": assignment["carton"]["id"],
+            "carton_count": assignment["carton_count"],  # Now represents pattern repetitions
+            "total_cost": assignment["total_cost"],
+            "packing_efficiency": assignment["efficiency"],
+            "utilization": float(str(assignment.get("utilization", "0")).replace("%", "")),
+            "item_summary": assignment.get("item_summary", ""),
+            "total_items": assignment.get("total_items", 0),
+            "length": assignment["carton"]["length"],
+            "width": assignment["carton"]["width"],
+            "height": assignment["carton"]["height"],
+            "volume": assignment["carton"].get("volume"),
+            "weight_limit": assignment["carton"]["weight_limit"],
+            "cost_per_unit": assignment["carton"]["cost_per_unit"],
+            "items_per_carton": assignment.get("items_per_carton", 0),
+            "pattern_signature": assignment.get("pattern_signature", ""),
+            "assignment_no": assignment_no,
+            "positions_3d": "",
+            "inner_carton_id": inner.get("carton_id"),
+            "inners_per_carton": assignment.get("inners_per_carton", 0),
+            "items_per_inner": inner.get("items_per_carton", 0),
+            "inner_pattern_signature": inner.get("pattern_signature", ""),
+            "inner_positions_3d": ""
+        })
 
-    pick_list.flags.ignore_validate = True
-    pick_list.flags.ignore_mandatory = True
-    pick_list.save()
+    removed = [row.name for row in pick_list.carton_assignments if row.name]
+    children = replace_child_rows(pick_list, "carton_assignments", rows)
+
+    # Update summary fields
+    pick_list.db_set({
+        "total_cartons": result["total_cartons"],
+        "total_packing_cost": result["total_cost"],
+        "average_efficiency": result["average_efficiency"],
+        "packing_strategy": result["strategy_used"],
+        "packing_run": packing_run
+    }, notify=True)
+    # Commit before the result is shared, so callers waiting on it reload the saved document
+    frappe.db.commit()
 
     return {
         "success": True,
-        "message": _("Packing calculation completed successfully"),
-        "pick_list": pick_list.as_dict(),
+        "message": _("Packing loaded from cache") if result["from_cache"] else _("Packing calculation completed successfully"),
+        # Slim: callers wanting the full document get it in calculate_pick_list_packing
+        "pick_list": {
+            "name": pick_list.name,
+            "modified": pick_list.modified,
+            "total_cartons": pick_list.total_cartons,
+            "total_packing_cost": pick_list.total_packing_cost,
+            "average_efficiency": pick_list.average_efficiency,
+            "packing_strategy": pick_list.packing_strategy,
+            "packing_run": pick_list.packing_run
+        },
+        "carton_assignments": {
+            "added": [child.name for child in children],
+            "removed": removed
+        },
         "summary": {
             "total_cartons": result["total_cartons"],
             "unique_patterns": result.get("unique_patterns", 0),
             "total_cost": result["total_cost"],
             "average_efficiency": f"{result['average_efficiency']:.1f}%",
-            "unpacked_items": len(result["unpacked_items"])
-        }
+            "unpacked_items": len(result["unpacked_items"]),
+            "from_cache": result["from_cache"],
+            "inner_cartons": result.get("levels", {}).get("inner", {}).get("total_cartons", 0)
+        },
+        "custom_cartons": get_custom_carton_suggestions(result["unpacked_items"], cartons_data)
     }
 
 
 
 @frappe.whitelist()
 def get_pick_list_packing_data(pick_list_name):
-    """Get packing summary data with pattern information"""
+    """Get packing summary data with pattern information (answers GET with ETag / 304)"""
     if not frappe.has_permission("Pick List", "read", pick_list_name):
         frappe.throw(_("Not permitted to view this Pick List"))
 
+    return conditional_response(
+        lambda: build_pick_list_packing_data(pick_list_name),
+        "Pick List", pick_list_name, frappe.db.get_value("Pick List", pick_list_name, "modified"),
+        get_catalog_version()
+    )
+
+
+def build_pick_list_packing_data(pick_list_name):
     pick_list = frappe.get_doc("Pick List", pick_list_name)
 
     carton_assignments = []
@@ -203,10 +424,19 @@ def get_pick_list_packing_data(pick_list_name):
 def get_pick_list_3d_data(pick_list_name, carton_idx=0):
     """
     Get ALL patterns for the selected carton type (not just one assignment)
+    Answers GET with ETag / 304 Not Modified
     """
     if not frappe.has_permission("Pick List", "read", pick_list_name):
         frappe.throw(_("Not permitted to view this Pick List"))
 
+    return conditional_response(
+        lambda: build_pick_list_3d_data(pick_list_name, carton_idx),
+        "Pick List 3D", pick_list_name, carton_idx, frappe.db.get_value("Pick List", pick_list_name, "modified"),
+        get_catalog_version()
+    )
+
+
+def build_pick_list_3d_data(pick_list_name, carton_idx=0):
     pick_list = frappe.get_doc("Pick List", pick_list_name)
     carton_idx = int(carton_idx)
 
@@ -219,10 +449,11 @@ def get_pick_list_3d_data(pick_list_name, carton_idx=0):
 
     # Collect ALL patterns for this carton_id
     patterns = []
+    positions = get_assignment_positions(pick_list)
     for assgn in pick_list.carton_assignments:
-        if assgn.carton_id == selected_assignment.carton_id and assgn.positions_3d:
+        if assgn.carton_id == selected_assignment.carton_id and positions.get(assgn.idx):
             try:
-                positions_data = json.loads(assgn.positions_3d) if isinstance(assgn.positions_3d, str) else assgn.positions_3d
+                positions_data = positions[assgn.idx]
 
                 patterns.append({
                     "positions_3d": positions_data,
@@ -236,21 +467,7 @@ def get_pick_list_3d_data(pick_list_name, carton_idx=0):
                 continue
 
     # Get item info from all patterns
-    item_info = {}
-    for pattern in patterns:
-        for item_code in pattern["positions_3d"].keys():
-            if item_code not in item_info:
-                try:
-                    item_doc = frappe.get_doc("Item", item_code)
-                    item_info[item_code] = {
-                        "name": item_doc.item_name,
-                        "length": getattr(item_doc, 'length', 10),
-                        "width": getattr(item_doc, 'width', 10),
-                        "height": getattr(item_doc, 'height', 10),
-                        "color": get_item_color(item_code)
-                    }
-                except:
-                    continue
+    item_info = get_item_info({item_code for pattern in patterns for item_code in pattern["positions_3d"]})
 
     return {
         "carton": carton_info,
@@ -260,6 +477,54 @@ def get_pick_list_3d_data(pick_list_name, carton_idx=0):
         "show_multiple": len(patterns) > 1
     }
 
+
+@frappe.whitelist()
+def get_pattern_geometry(pick_list_name, signatures):
+    """
+    3D positions and item info per pattern signature, for the visualizer's geometry cache
+    A signature identifies one item layout in one carton, so its geometry never changes
+    """
+    if not frappe.has_permission("Pick List", "read", pick_list_name):
+        frappe.throw(_("Not permitted to view this Pick List"))
+
+    if isinstance(signatures, str):
+        signatures = json.loads(signatures)
+    signatures = set(signatures or [])
+
+    pick_list = frappe.get_doc("Pick List", pick_list_name)
+    positions = get_assignment_positions(pick_list)
+
+    geometry = {}
+    for row in pick_list.carton_assignments:
+        signature = row.get("pattern_signature")
+        if signature in signatures and signature not in geometry and positions.get(row.idx):
+            geometry[signature] = {
+                "carton_id": row.carton_id,
+                "positions_3d": positions[row.idx],
+                "items_per_carton": row.items_per_carton,
+                "efficiency": row.packing_efficiency or 0
+            }
+
+    item_info = get_item_info({item_code for entry in geometry.values() for item_code in entry["positions_3d"]})
+    for entry in geometry.values():
+        entry["item_info"] = {item_code: item_info[item_code] for item_code in entry["positions_3d"] if item_code in item_info}
+
+    return geometry
+
+
+def get_item_info(item_codes):
+    """Names, dimensions and colours of the items in 3D layouts"""
+    return {
+        item_code: {
+            "name": item_doc.item_name,
+            "length": item_doc.get('length', 10),
+            "width": item_doc.get('width', 10),
+            "height": item_doc.get('height', 10),
+            "color": get_item_color(item_code)
+        }
+        for item_code, item_doc in get_item_attributes(list(item_codes)).items()
+    }
+
 def get_item_color(item_code):
     """Generate consistent color for item based on item code"""
     colors = [
@@ -0,0 +1,68 @@
+"""
+Speculative packing on export Sales Order submit
+
+When enabled in Packing Settings, submitting an export Sales Order queues a
+low-priority job that packs the order lines and stores the result in the
+packing result cache. A Pick List made later for the same item quantities
+produces the same cache key and loads the result instantly; one with partial
+quantities misses the cache and is calculated as usual.
+"""
+
+import frappe
+
+from .pick_list_packing import get_available_cartons, get_packing_items, run_packing
+
+DEFAULT_STRATEGY = "minimize_cartons"
+# Packing Settings strategy -> engine strategy (same map as pick_list.js)
+STRATEGIES = {
+    "Minimize Cartons": "minimize_cartons",
+    "Minimize Waste": "minimize_waste",
+    "Maximize Efficiency": "maximize_efficiency",
+    "Minimize Cost": "minimize_cost",
+}
+
+
+def enqueue_sales_order_packing(doc):
+    settings = frappe.get_cached_doc("Packing Settings")
+    if not settings.get("precompute_on_sales_order_submit"):
+        return
+
+    frappe.enqueue(
+        "import_export.packing_system.precompute.precompute_sales_order_packing",
+        queue="long",
+        job_id=f"packing_precompute:{doc.name}",
+        deduplicate=True,
+        enqueue_after_commit=True,
+        sales_order=doc.name
+    )
+
+
+def precompute_sales_order_packing(sales_order):
+    """Pack the open quantities of a Sales Order into the result cache (as the Pick List button would)"""
+    doc = frappe.get_doc("Sales Order", sales_order)
+    if doc.docstatus != 1:
+        return
+
+    rows = [
+        frappe._dict(item_code=row.item_code, qty=(row.qty or 0) - (row.delivered_qty or 0))
+        for row in doc.items
+    ]
+    items_data = get_packing_items(rows)
+    cartons_data = get_available_cartons()
+    if not items_data or not cartons_data:
+        return
+
+    settings = frappe.get_cached_doc("Packing Settings")
+    strategy = STRATEGIES.get(settings.get("packing_strategy"), DEFAULT_STRATEGY)
+
+    try:
+        run_packing(
+            items_data,
+            cartons_data,
+            strategy=strategy,
+            enable_3d=True,
+            cache_ttl=(settings.get("precompute_cache_hours") or 72) * 60 * 60
+        )
+    except ValueError:
+        # Nothing packable; the Pick List will report it when packed for real
+        pass
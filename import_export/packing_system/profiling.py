@@ -0,0 +1,73 @@
+"""
+Slow-run profiler capture for packing calculations
+
+Opt-in from Packing Settings: a sampled share of packing runs is executed
+under cProfile, and runs slower than the threshold are kept as an Error Log
+(timings, input fingerprint and the top functions) with the raw .prof file
+attached, readable with pstats or snakeviz.
+"""
+
+import cProfile
+import io
+import marshal
+import pstats
+import random
+import time
+
+import frappe
+
+DEFAULT_THRESHOLD_MS = 5000
+
+
+def run_with_profiler(reference_doctype, reference_name, fingerprint, compute, details=None):
+    """Run `compute()`, profiling it when sampled in Packing Settings"""
+    settings = frappe.get_cached_doc("Packing Settings")
+    if not settings.get("enable_packing_profiler"):
+        return compute()
+
+    if random.random() * 100 >= (settings.get("profiler_sample_rate") or 0):
+        return compute()
+
+    profiler = cProfile.Profile()
+    started = time.perf_counter()
+    profiler.enable()
+    try:
+        result = compute()
+    finally:
+        profiler.disable()
+
+    elapsed_ms = (time.perf_counter() - started) * 1000
+    threshold_ms = settings.get("profiler_threshold_ms") or DEFAULT_THRESHOLD_MS
+    if elapsed_ms >= threshold_ms:
+        save_profile(profiler, reference_doctype, reference_name, fingerprint, elapsed_ms, details)
+
+    return result
+
+
+def save_profile(profiler, reference_doctype, reference_name, fingerprint, elapsed_ms, details=None):
+    stream = io.StringIO()
+    pstats.Stats(profiler, stream=stream).sort_stats("cumulative").print_stats(40)
+
+    lines = [
+        f"Elapsed: {elapsed_ms:.1f} ms",
+        f"Fingerprint: {fingerprint}",
+    ]
+    for key, value in (details or {}).items():
+        lines.append(f"{key}: {value}")
+
+    error_log = frappe.log_error(
+        title=f"Slow packing run: {reference_name} ({elapsed_ms:.0f} ms)",
+        message="\n".join(lines) + "\n\n" + stream.getvalue(),
+        reference_doctype=reference_doctype,
+        reference_name=reference_name
+    )
+
+    profiler.create_stats()
+    frappe.get_doc({
+        "doctype": "File",
+        "file_name": f"packing-{frappe.scrub(reference_name)}-{int(time.time())}.prof",
+        "attached_to_doctype": error_log.doctype,
+        "attached_to_name": error_log.name,
+        "is_private": 1,
+        "content": marshal.dumps(profiler.stats)
+    }).insert(ignore_permissions=True)
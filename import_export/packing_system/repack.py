@@ -0,0 +1,285 @@
+"""
+Repack open Pick Lists after carton catalog changes
+
+Every Packing Run records the catalog version (signature of the enabled
+cartons) it was packed with. After a carton is added, changed or disabled,
+draft Pick Lists whose current run has another version are repacked in
+background jobs: the stale Pick Lists are split into chunks kept in a Redis
+list, and a limited number of jobs (Packing Settings) pop and pack one chunk
+each, enqueueing the next job until the list is empty. Progress and the
+carton-count and cost deltas are kept in the cache for the Carton form.
+Starting a new repack supersedes a running one; a run whose jobs stop making
+progress is reported as stalled.
+"""
+
+import json
+import time
+
+import frappe
+from frappe import _
+from frappe.utils import cint, flt, now_datetime
+
+from .core.calculator import PackingCalculator
+from .pick_list_packing import get_available_cartons, pack_pick_list
+
+REPACK_PREFIX = "import_export:catalog_repack:"
+LATEST_KEY = REPACK_PREFIX + "latest"
+REPACK_TTL = 24 * 60 * 60
+DEFAULT_CHUNK_SIZE = 50
+DEFAULT_PARALLEL_JOBS = 4
+MAX_REPORTED_CHANGES = 200
+# A running repack without a finished chunk for this long is reported as Stalled
+STALL_TIMEOUT = 60 * 60
+
+
+def enqueue_catalog_repack(doc=None, method=None):
+    """Carton on_update / on_trash: start a repack when enabled in Packing Settings"""
+    if not frappe.get_cached_doc("Packing Settings").get("repack_on_carton_change"):
+        return
+
+    # The jobs run as this user and save every stale Pick List
+    if not frappe.has_permission("Pick List", "write"):
+        frappe.msgprint(
+            _("Open Pick Lists were not repacked for this carton change, as you are not permitted to edit "
+              "Pick Lists. A user who can edit them can start the repack from the Carton form."),
+            indicator="orange",
+            alert=True
+        )
+        return
+
+    frappe.enqueue(
+        "import_export.packing_system.repack.start_repack",
+        queue="long",
+        job_id="packing_catalog_repack",
+        deduplicate=True,
+        enqueue_after_commit=True
+    )
+
+
+@frappe.whitelist()
+def start_catalog_repack():
+    """Repack open Pick Lists packed with an older carton catalog (Carton form button)"""
+    frappe.has_permission("Pick List", "write", throw=True)
+    return start_repack()
+
+
+@frappe.whitelist()
+def get_repack_status(repack_id=None):
+    """Progress and deltas of a repack (the latest one by default)"""
+    frappe.has_permission("Pick List", "write", throw=True)
+    return build_repack_status(repack_id)
+
+
+def start_repack():
+    versions = get_catalog_versions()
+    stale = get_stale_pick_lists(versions)
+
+    settings = frappe.get_cached_doc("Packing Settings")
+    chunk_size = cint(settings.get("repack_chunk_size")) or DEFAULT_CHUNK_SIZE
+    parallel_jobs = cint(settings.get("repack_parallel_jobs")) or DEFAULT_PARALLEL_JOBS
+
+    repack_id = frappe.generate_hash(length=10)
+    chunks = [stale[i:i + chunk_size] for i in range(0, len(stale), chunk_size)]
+
+    cache = frappe.cache()
+    supersede_repack(cache.get_value(LATEST_KEY))
+    cache.set_value(_key(repack_id), {
+        "status": "Running" if chunks else "Completed",
+        "started": str(now_datetime()),
+        "total": len(stale),
+        "chunks": len(chunks),
+        "user": frappe.session.user
+    }, expires_in_sec=REPACK_TTL)
+    for chunk in chunks:
+        cache.rpush(_key(repack_id, "queue"), json.dumps(chunk))
+    cache.expire(cache.make_key(_key(repack_id, "queue")), REPACK_TTL)
+    cache.set_value(LATEST_KEY, repack_id, expires_in_sec=REPACK_TTL)
+    cache.set_value(_key(repack_id, "updated"), time.time(), expires_in_sec=REPACK_TTL)
+
+    for lane in range(min(parallel_jobs, len(chunks))):
+        enqueue_chunk(repack_id, lane)
+
+    return build_repack_status(repack_id)
+
+
+def supersede_repack(repack_id):
+    """Mark a still running repack as Superseded; its remaining chunks are dropped by the jobs"""
+    if not repack_id:
+        return
+
+    cache = frappe.cache()
+    meta = cache.get_value(_key(repack_id))
+    if meta and meta.get("status") == "Running":
+        meta.update({"status": "Superseded", "completed": str(now_datetime())})
+        cache.set_value(_key(repack_id), meta, expires_in_sec=REPACK_TTL)
+        cache.delete_value(_key(repack_id, "queue"))
+
+
+def enqueue_chunk(repack_id, lane):
+    frappe.enqueue(
+        "import_export.packing_system.repack.process_repack_chunk",
+        queue="long",
+        job_id=f"packing_catalog_repack:{repack_id}:{lane}:{frappe.generate_hash(length=6)}",
+        enqueue_after_commit=True,
+        repack_id=repack_id,
+        lane=lane
+    )
+
+
+def process_repack_chunk(repack_id, lane=0):
+    """Pack one chunk of stale Pick Lists, then hand the lane on to the next chunk"""
+    cache = frappe.cache()
+    if cache.get_value(LATEST_KEY) != repack_id:
+        return  # Superseded by a newer repack, which covers these Pick Lists
+
+    chunk = cache.lpop(_key(repack_id, "queue"))
+    if chunk is None:
+        return
+    cache.set_value(_key(repack_id, "updated"), time.time(), expires_in_sec=REPACK_TTL)
+
+    versions = get_catalog_versions()
+    cartons = {
+        False: get_available_cartons(),
+        True: get_available_cartons(include_inner=True)
+    }
+    # Re-checked here: Pick Lists repacked or submitted since the repack started are skipped
+    stale = {row.name: row for row in get_stale_pick_lists(versions, names=json.loads(chunk), as_rows=True)}
+
+    stats = {"done": 0, "failed": 0, "skipped": 0, "carton_delta": 0, "cost_delta": 0.0}
+    for name in json.loads(chunk):
+        row = stale.get(name)
+        if not row:
+            stats["skipped"] += 1
+            continue
+
+        try:
+            pick_list = frappe.get_doc("Pick List", name)
+            pack_pick_list(pick_list, row.strategy, row.enable_3d, row.nested, cartons_data=cartons[row.nested])
+        except Exception:
+            frappe.db.rollback()
+            frappe.log_error(title=f"Catalog repack failed: {name}", reference_doctype="Pick List", reference_name=name)
+            stats["failed"] += 1
+            continue
+
+        carton_delta = cint(pick_list.total_cartons) - cint(row.total_cartons)
+        cost_delta = flt(pick_list.total_packing_cost) - flt(row.total_packing_cost)
+        stats["done"] += 1
+        stats["carton_delta"] += carton_delta
+        stats["cost_delta"] += cost_delta
+
+        if carton_delta or cost_delta:
+            cache.rpush(_key(repack_id, "changes"), json.dumps({
+                "pick_list": name,
+                "cartons_before": cint(row.total_cartons),
+                "cartons_after": cint(pick_list.total_cartons),
+                "cost_before": flt(row.total_packing_cost),
+                "cost_after": flt(pick_list.total_packing_cost)
+            }))
+            cache.ltrim(_key(repack_id, "changes"), 0, MAX_REPORTED_CHANGES - 1)
+            cache.expire(cache.make_key(_key(repack_id, "changes")), REPACK_TTL)
+
+    # Counters are shared by the parallel jobs, so they are updated atomically
+    for field, value in stats.items():
+        counter = cache.make_key(_key(repack_id, field))
+        if isinstance(value, float):
+            cache.incrbyfloat(counter, value)
+        else:
+            cache.incrby(counter, value)
+        cache.expire(counter, REPACK_TTL)
+    finished_key = cache.make_key(_key(repack_id, "finished_chunks"))
+    finished = cache.incr(finished_key)
+    cache.expire(finished_key, REPACK_TTL)
+    cache.set_value(_key(repack_id, "updated"), time.time(), expires_in_sec=REPACK_TTL)
+
+    meta = cache.get_value(_key(repack_id)) or {}
+    if meta.get("status") != "Running":
+        return
+    if finished >= cint(meta.get("chunks")):
+        meta.update({"status": "Completed", "completed": str(now_datetime())})
+        cache.set_value(_key(repack_id), meta, expires_in_sec=REPACK_TTL)
+        frappe.publish_realtime("catalog_repack_completed", build_repack_status(repack_id), user=meta.get("user"))
+    elif cache.llen(_key(repack_id, "queue")):
+        enqueue_chunk(repack_id, lane)
+
+
+def build_repack_status(repack_id=None):
+    repack_id = repack_id or frappe.cache().get_value(LATEST_KEY)
+    if not repack_id:
+        return None
+
+    cache = frappe.cache()
+    meta = cache.get_value(_key(repack_id))
+    if not meta:
+        return None
+
+    def counter(field):
+        return _decode(cache.get(cache.make_key(_key(repack_id, field))))
+
+    status = meta.get("status")
+    if status == "Running" and time.time() - flt(cache.get_value(_key(repack_id, "updated"))) > STALL_TIMEOUT:
+        # A chunk job died (worker killed, timeout) and its lane stopped
+        status = "Stalled"
+
+    return {
+        "repack_id": repack_id,
+        "status": status,
+        "started": meta.get("started"),
+        "completed": meta.get("completed"),
+        "total": cint(meta.get("total")),
+        "done": cint(counter("done")),
+        "failed": cint(counter("failed")),
+        "skipped": cint(counter("skipped")),
+        "carton_delta": cint(counter("carton_delta")),
+        "cost_delta": flt(counter("cost_delta"), 2),
+        "changes": [json.loads(_decode(c)) for c in cache.lrange(_key(repack_id, "changes"), 0, -1) or []]
+    }
+
+
+def get_catalog_versions():
+    """Current catalog version for single (False) and nested (True) packing runs"""
+    return {
+        False: PackingCalculator.create_catalog_signature(get_available_cartons()),
+        True: PackingCalculator.create_catalog_signature(get_available_cartons(include_inner=True))
+    }
+
+
+def get_stale_pick_lists(versions, names=None, as_rows=False):
+    """Draft Pick Lists whose current Packing Run was made with another catalog version"""
+    filters = {"docstatus": 0, "packing_run": ["is", "set"]}
+    if names is not None:
+        filters["name"] = ["in", names]
+
+    pick_lists = frappe.get_all(
+        "Pick List",
+        filters=filters,
+        fields=["name", "packing_run", "packing_strategy", "total_cartons", "total_packing_cost"],
+        order_by="modified desc"
+    )
+    runs = {
+        run.name: run for run in frappe.get_all(
+            "Packing Run",
+            filters={"name": ["in", [pl.packing_run for pl in pick_lists]]},
+            fields=["name", "catalog_version", "strategy", "enable_3d"]
+        )
+    } if pick_lists else {}
+
+    stale = []
+    for pick_list in pick_lists:
+        run = runs.get(pick_list.packing_run)
+        if not run:
+            continue
+        nested = (pick_list.packing_strategy or "").endswith("_nested")
+        if run.catalog_version == versions[nested]:
+            continue
+        pick_list.update({"strategy": run.strategy, "enable_3d": run.enable_3d, "nested": nested})
+        stale.append(pick_list)
+
+    return stale if as_rows else [pick_list.name for pick_list in stale]
+
+
+def _key(repack_id, suffix=""):
+    return REPACK_PREFIX + repack_id + (":" + suffix if suffix else "")
+
+
+def _decode(value):
+    return value.decode() if isinstance(value, bytes) else value
@@ -0,0 +1,190 @@
+"""
+Replay stored Pick Lists through the packing engine
+
+Used by `bench replay-packing` to judge optimizer changes on real order
+profiles. A corpus is either loaded from the site or from a fixture file
+written earlier with `--dump-fixture`, so the same profiles can be replayed
+offline without a site.
+"""
+
+import json
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, List, Optional
+
+from .main_controller import PackingController
+
+
+def load_corpus(pick_lists: Optional[List[str]] = None, limit: Optional[int] = None) -> Dict:
+    """Read Pick Lists with their locations and stored carton assignments from the site"""
+    import frappe
+    from .pick_list_packing import get_available_cartons, get_packing_items
+
+    filters = {"docstatus": ["!=", 2]}
+    if pick_lists:
+        filters["name"] = ["in", pick_lists]
+
+    names = frappe.get_all(
+        "Pick List",
+        filters=filters,
+        order_by="creation desc",
+        limit=limit or 0,
+        pluck="name"
+    )
+
+    profiles = []
+    for name in names:
+        pick_list = frappe.get_doc("Pick List", name)
+        items_data = get_packing_items(pick_list.locations)
+        if not items_data:
+            continue
+
+        profiles.append({
+            "name": name,
+            "items_data": items_data,
+            "stored": {
+                "total_cartons": pick_list.get("total_cartons") or 0,
+                "total_cost": pick_list.get("total_packing_cost") or 0,
+                "carton_counts": get_carton_counts(pick_list.get("carton_assignments") or [])
+            }
+        })
+
+    return {"cartons": get_available_cartons(), "profiles": profiles}
+
+
+def get_carton_counts(assignments) -> Dict[str, int]:
+    """Carton id -> number of cartons, from stored rows or engine results"""
+    counts = {}
+    for assignment in assignments:
+        carton_id = assignment.get("carton_id")
+        counts[carton_id] = counts.get(carton_id, 0) + int(assignment.get("carton_count") or 0)
+    return counts
+
+
+def anonymize_corpus(corpus: Dict) -> Dict:
+    """Replace item codes, carton names and document names with stable placeholders"""
+    item_names, carton_names = {}, {}
+
+    def item_alias(code):
+        return item_names.setdefault(code, f"ITEM-{len(item_names) + 1:05d}")
+
+    def carton_alias(code):
+        return carton_names.setdefault(code, f"CARTON-{len(carton_names) + 1:03d}")
+
+    cartons = []
+    for carton in corpus["cartons"]:
+        alias = carton_alias(carton["id"])
+        cartons.append({**carton, "id": alias, "carton_name": alias})
+
+    profiles = []
+    for idx, profile in enumerate(corpus["profiles"], 1):
+        items_data = []
+        for entry in profile["items_data"]:
+            alias = item_alias(entry["item"]["id"])
+            items_data.append({
+                "item": {**entry["item"], "id": alias, "name": alias},
+                "quantity": entry["quantity"]
+            })
+
+        stored = dict(profile["stored"])
+        stored["carton_counts"] = {
+            carton_alias(carton_id): count for carton_id, count in stored["carton_counts"].items()
+        }
+        profiles.append({"name": f"PROFILE-{idx:05d}", "items_data": items_data, "stored": stored})
+
+    return {"cartons": cartons, "profiles": profiles}
+
+
+def dump_fixture(corpus: Dict, path: str, anonymize: bool = True):
+    with open(path, "w") as f:
+        json.dump(anonymize_corpus(corpus) if anonymize else corpus, f, default=str)
+
+
+def load_fixture(path: str) -> Dict:
+    with open(path) as f:
+        return json.load(f)
+
+
+def replay_profile(profile: Dict, cartons: List[Dict], strategy: str, engine_flags: Dict) -> Dict:
+    """Run one profile through PackingController and diff it against the stored result"""
+    controller = PackingController()
+    started = time.perf_counter()
+
+    try:
+        result = controller.suggest_cartons(
+            items_data=profile["items_data"],
+            cartons_data=cartons,
+            strategy=strategy,
+            **engine_flags
+        )
+    except ValueError as e:
+        return {"pick_list": profile["name"], "strategy": strategy, "error": str(e)}
+
+    elapsed_ms = (time.perf_counter() - started) * 1000
+    stored = profile["stored"]
+    carton_counts = get_carton_counts(result["carton_assignments"])
+
+    carton_diff = {}
+    for carton_id in set(carton_counts) | set(stored["carton_counts"]):
+        before, after = stored["carton_counts"].get(carton_id, 0), carton_counts.get(carton_id, 0)
+        if before != after:
+            carton_diff[carton_id] = {"stored": before, "replayed": after}
+
+    return {
+        "pick_list": profile["name"],
+        "strategy": strategy,
+        "elapsed_ms": round(elapsed_ms, 3),
+        "total_cartons": result["total_cartons"],
+        "unique_patterns": result["unique_patterns"],
+        "total_cost": result["total_cost"],
+        "unpacked_items": len(result["unpacked_items"]),
+        "stored_total_cartons": stored["total_cartons"],
+        "stored_total_cost": stored["total_cost"],
+        "carton_delta": result["total_cartons"] - (stored["total_cartons"] or 0),
+        "cost_delta": result["total_cost"] - (stored["total_cost"] or 0),
+        "carton_diff": carton_diff,
+        "layout_violations": len(result.get("layout_violations") or [])
+    }
+
+
+def _replay_task(args):
+    return replay_profile(*args)
+
+
+def replay_corpus(corpus: Dict, strategies: List[str], engine_flags: Optional[Dict] = None,
+                  workers: int = 1) -> List[Dict]:
+    """Replay every profile for every strategy, optionally across worker processes"""
+    tasks = [
+        (profile, corpus["cartons"], strategy, engine_flags or {})
+        for strategy in strategies
+        for profile in corpus["profiles"]
+    ]
+
+    if workers > 1:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            return list(executor.map(_replay_task, tasks, chunksize=max(1, len(tasks) // (workers * 4))))
+
+    return [_replay_task(task) for task in tasks]
+
+
+def summarize(rows: List[Dict]) -> Dict:
+    """Per-strategy totals for a replay run"""
+    summary = {}
+    for row in rows:
+        totals = summary.setdefault(row["strategy"], {
+            "pick_lists": 0, "errors": 0, "elapsed_ms": 0, "total_cartons": 0,
+            "carton_delta": 0, "cost_delta": 0, "changed": 0, "layout_violations": 0
+        })
+        totals["pick_lists"] += 1
+        if row.get("error"):
+            totals["errors"] += 1
+            continue
+
+        totals["elapsed_ms"] += row["elapsed_ms"]
+        totals["total_cartons"] += row["total_cartons"]
+        totals["carton_delta"] += row["carton_delta"]
+        totals["cost_delta"] += row["cost_delta"]
+        totals["changed"] += 1 if row["carton_diff"] else 0
+        totals["layout_violations"] += row.get("layout_violations", 0)
+
+    return summary
@@ -0,0 +1,58 @@
+"""
+Whole-result cache for packing calculations
+
+Results of suggest_cartons are stored in the site's Redis cache, keyed by a
+canonical hash of the item multiset, the carton catalog version, the strategy
+and enable_3d. Entries expire after `packing_result_cache_ttl` seconds (site
+config, default 6 hours); bench's cache Redis runs with allkeys-lru, so cold
+entries are evicted first under memory pressure.
+"""
+
+import hashlib
+import json
+
+import frappe
+
+import import_export
+from .core.calculator import PackingCalculator
+
+DEFAULT_TTL = 6 * 60 * 60
+CACHE_PREFIX = "import_export:packing_result:"
+
+# Item attributes that influence the packing result (name and color are display only)
+ITEM_KEY_FIELDS = ("length", "width", "height", "weight", "volume", "fragile", "orientation_mask")
+
+
+def get_result_cache_key(items_data, cartons_data, strategy, enable_3d):
+    """Canonical key: same items and quantities in any order/split give the same key"""
+    multiset = {}
+    for entry in items_data:
+        item = entry["item"]
+        signature = (item["id"],) + tuple(item.get(field) for field in ITEM_KEY_FIELDS)
+        multiset[signature] = multiset.get(signature, 0) + entry["quantity"]
+
+    canonical = json.dumps(
+        {
+            "items": sorted([list(signature) + [qty] for signature, qty in multiset.items()], key=str),
+            "catalog": PackingCalculator.create_catalog_signature(cartons_data),
+            "strategy": strategy,
+            "enable_3d": bool(enable_3d),
+            "engine": import_export.__version__
+        },
+        sort_keys=True,
+        default=str
+    )
+
+    return CACHE_PREFIX + hashlib.md5(canonical.encode()).hexdigest()
+
+
+def get_cached_result(key):
+    return frappe.cache().get_value(key)
+
+
+def set_cached_result(key, result, ttl=None):
+    frappe.cache().set_value(
+        key,
+        result,
+        expires_in_sec=ttl or frappe.conf.get("packing_result_cache_ttl") or DEFAULT_TTL
+    )
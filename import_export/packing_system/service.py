@@ -0,0 +1,216 @@
+"""
+Standalone packing service
+
+Keeps a single long-lived PackingController (and the calculator's fit table)
+warm between requests instead of paying cold caches in each gunicorn worker.
+Concurrent requests are queued and drained in batches by one worker thread;
+identical requests inside a batch are computed once.
+
+Run it next to the bench, e.g. in the Procfile / supervisor config:
+
+    python -m import_export.packing_system.service --bind unix:///path/to/packing.sock
+    python -m import_export.packing_system.service --bind http://127.0.0.1:8790
+
+and point the site at it with `bench set-config packing_service_url <bind>`.
+"""
+
+import argparse
+import json
+import os
+import queue
+import socketserver
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, List, Optional
+from urllib.parse import urlparse
+
+from .main_controller import PackingController
+
+DEFAULT_BIND = "http://127.0.0.1:8790"
+MAX_BATCH_SIZE = 32
+MAX_CATALOGS = 16
+
+
+class PackingJob:
+    """A single queued packing request waiting for the batch worker"""
+
+    def __init__(self, key: str, payload: Dict):
+        self.key = key
+        self.payload = payload
+        self.done = threading.Event()
+        self.result = None
+        self.error = None
+
+
+class PackingService:
+    """Warm packing engine shared by all connections of the server"""
+
+    def __init__(self, max_batch_size: int = MAX_BATCH_SIZE):
+        self.controller = PackingController()
+        self.max_batch_size = max_batch_size
+        self.catalogs = {}
+        self.catalog_lock = threading.Lock()
+        self.jobs = queue.Queue()
+        self.worker = threading.Thread(target=self._drain, name="packing-batch-worker", daemon=True)
+        self.worker.start()
+
+    def get_catalog(self, catalog_version: str) -> Optional[List[Dict]]:
+        with self.catalog_lock:
+            return self.catalogs.get(catalog_version)
+
+    def remember_catalog(self, catalog_version: str, cartons_data: List[Dict]):
+        with self.catalog_lock:
+            if catalog_version not in self.catalogs and len(self.catalogs) >= MAX_CATALOGS:
+                self.catalogs.pop(next(iter(self.catalogs)))
+            self.catalogs[catalog_version] = cartons_data
+
+    def submit(self, payload: Dict) -> Dict:
+        """Queue a request and block until the batch worker has answered it"""
+        key = json.dumps(
+            [payload["items_data"], payload["catalog_version"], payload["strategy"], payload["enable_3d"]],
+            sort_keys=True, default=str
+        )
+        job = PackingJob(key, payload)
+        self.jobs.put(job)
+        job.done.wait()
+
+        if job.error:
+            raise job.error
+
+        return job.result
+
+    def _drain(self):
+        while True:
+            batch = [self.jobs.get()]
+            while len(batch) < self.max_batch_size:
+                try:
+                    batch.append(self.jobs.get_nowait())
+                except queue.Empty:
+                    break
+
+            by_key = {}
+            for job in batch:
+                by_key.setdefault(job.key, []).append(job)
+
+            for jobs in by_key.values():
+                leader = jobs[0]
+                try:
+                    result = self._compute(leader.payload)
+                    error = None
+                except Exception as e:
+                    result, error = None, e
+
+                for job in jobs:
+                    job.result, job.error = result, error
+                    job.done.set()
+
+    def _compute(self, payload: Dict) -> Dict:
+        return self.controller.suggest_cartons(
+            items_data=payload["items_data"],
+            cartons_data=payload["cartons_data"],
+            strategy=payload["strategy"],
+            enable_3d=payload["enable_3d"]
+        )
+
+
+class PackingRequestHandler(BaseHTTPRequestHandler):
+    """JSON over HTTP: POST /pack, GET /health"""
+
+    service: PackingService = None
+
+    def do_GET(self):
+        if self.path != "/health":
+            return self._reply(404, {"error": "Not found"})
+
+        return self._reply(200, {"status": "ok", "catalogs": len(self.service.catalogs)})
+
+    def do_POST(self):
+        if self.path != "/pack":
+            return self._reply(404, {"error": "Not found"})
+
+        try:
+            length = int(self.headers.get("Content-Length") or 0)
+            payload = json.loads(self.rfile.read(length) or b"{}")
+        except ValueError:
+            return self._reply(400, {"error": "Invalid JSON body", "type": "ValueError"})
+
+        catalog_version = payload.get("catalog_version")
+        if payload.get("cartons_data") is not None:
+            self.service.remember_catalog(catalog_version, payload["cartons_data"])
+        else:
+            payload["cartons_data"] = self.service.get_catalog(catalog_version)
+            if payload["cartons_data"] is None:
+                return self._reply(409, {"error": "Unknown catalog version", "catalog_unknown": True})
+
+        payload.setdefault("strategy", "minimize_cartons")
+        payload.setdefault("enable_3d", True)
+
+        try:
+            result = self.service.submit(payload)
+        except ValueError as e:
+            return self._reply(400, {"error": str(e), "type": "ValueError"})
+        except Exception as e:
+            return self._reply(500, {"error": str(e), "type": type(e).__name__})
+
+        return self._reply(200, {"result": result})
+
+    def _reply(self, status: int, body: Dict):
+        data = json.dumps(body, default=str).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def address_string(self):
+        # Unix socket peers have no host/port
+        return self.client_address[0] if self.client_address else "unix"
+
+    def log_message(self, format, *args):
+        if os.environ.get("PACKING_SERVICE_VERBOSE"):
+            super().log_message(format, *args)
+
+
+class ThreadingUnixHTTPServer(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    daemon_threads = True
+
+    def get_request(self):
+        request, _ = super().get_request()
+        return request, ("unix", 0)
+
+
+def make_server(bind: str, service: Optional[PackingService] = None):
+    """Create (but don't start) a server for `unix:///path` or `http://host:port`"""
+    handler = type("BoundPackingRequestHandler", (PackingRequestHandler,), {
+        "service": service or PackingService()
+    })
+    target = urlparse(bind)
+
+    if target.scheme == "unix":
+        if os.path.exists(target.path):
+            os.unlink(target.path)
+        return ThreadingUnixHTTPServer(target.path, handler)
+
+    if target.scheme == "http":
+        return ThreadingHTTPServer((target.hostname or "127.0.0.1", target.port or 8790), handler)
+
+    raise ValueError(f"Unsupported packing service bind address: {bind}")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Warm packing service for import_export")
+    parser.add_argument("--bind", default=DEFAULT_BIND, help="unix:///path/to.sock or http://host:port")
+    parser.add_argument("--batch-size", type=int, default=MAX_BATCH_SIZE)
+    args = parser.parse_args(argv)
+
+    server = make_server(args.bind, PackingService(max_batch_size=args.batch_size))
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,68 @@
+"""
+Single-flight guard for packing calculations
+
+Only one calculation runs per document at a time, guarded by a Redis lock
+that carries the fingerprint of the inputs. A concurrent caller with the same
+fingerprint waits for the running calculation and returns its result; a
+caller with different inputs is rejected straight away instead of computing
+and racing the running one on save.
+"""
+
+import time
+
+import frappe
+from frappe import _
+
+LOCK_PREFIX = "import_export:packing_lock:"
+LOCK_TIMEOUT = 5 * 60
+RESULT_TTL = 60
+POLL_INTERVAL = 0.2
+
+
+class PackingInProgressError(frappe.ValidationError):
+    pass
+
+
+def single_flight(key, fingerprint, compute, wait_timeout=None):
+    """
+    Run `compute()` once per key; concurrent callers with the same fingerprint share its result
+    `wait_timeout` defaults to site config `packing_single_flight_timeout` (seconds)
+    """
+    cache = frappe.cache()
+    lock_key = cache.make_key(LOCK_PREFIX + key)
+    result_key = f"{LOCK_PREFIX}{key}:{fingerprint}"
+    token = f"{fingerprint}:{frappe.generate_hash(length=10)}"
+    deadline = time.monotonic() + (wait_timeout or frappe.conf.get("packing_single_flight_timeout") or 120)
+
+    while True:
+        if cache.set(lock_key, token, nx=True, ex=LOCK_TIMEOUT):
+            try:
+                result = compute()
+                # Published before the lock is released so waiting callers always find it
+                cache.set_value(result_key, result, expires_in_sec=RESULT_TTL)
+                return result
+            finally:
+                if _decode(cache.get(lock_key)) == token:
+                    cache.delete(lock_key)
+
+        result = cache.get_value(result_key)
+        if result is not None:
+            return result
+
+        holder = _decode(cache.get(lock_key))
+        if holder and holder.split(":", 1)[0] != fingerprint:
+            frappe.throw(
+                _("Packing is already being calculated for this document with different inputs. Please reload and try again."),
+                PackingInProgressError
+            )
+
+        if time.monotonic() > deadline:
+            frappe.throw(_("Timed out waiting for the running packing calculation"), PackingInProgressError)
+
+        # Lock free but no result means the holder failed; the next pass retries as leader
+        if holder:
+            time.sleep(POLL_INTERVAL)
+
+
+def _decode(value):
+    return value.decode() if isinstance(value, bytes) else value
@@ -0,0 +1,106 @@
+# Copyright (c) 2026, gws and Contributors
+# See license.txt
+
+import unittest
+
+from import_export.packing_system.core.calculator import ORIENTATION_UPRIGHT
+from import_export.packing_system.core.verifier import LayoutVerifier
+from import_export.packing_system.main_controller import PackingController, _level_cache
+
+
+def make_item(item_code, length, width, height, weight, **extra):
+	return {
+		"id": item_code, "name": item_code, "length": length, "width": width, "height": height,
+		"weight": weight, "volume": length * width * height, "fragile": False, **extra
+	}
+
+
+def make_carton(carton_id, length, width, height, weight_limit, cost, packing_level="Single"):
+	return {
+		"id": carton_id, "carton_name": carton_id, "length": length, "width": width, "height": height,
+		"weight_limit": weight_limit, "cost_per_unit": cost, "volume": length * width * height,
+		"packing_level": packing_level, "fragile_safe": False, "max_stack_height": 100
+	}
+
+
+ITEM = make_item("_Test Item", 10, 8, 6, 0.4)
+# Taller than long, so upright packing changes the layout
+TALL_ITEM = make_item("_Test Tall Item", 6, 6, 14, 0.3, orientation_mask=ORIENTATION_UPRIGHT)
+NESTED_CARTONS = [
+	make_carton("_Test Inner", 20, 16, 14, 5, 0.2, "Inner"),
+	make_carton("_Test Master", 60, 34, 30, 40, 2.0, "Master"),
+	make_carton("_Test Master Small", 42, 34, 16, 40, 1.2, "Master"),
+]
+
+
+class TestPackingController(unittest.TestCase):
+	def setUp(self):
+		_level_cache.clear()
+
+	def test_layouts_pass_verification(self):
+		cartons = [make_carton("_Test Carton S", 30, 20, 20, 10, 1.0), make_carton("_Test Carton L", 50, 40, 30, 25, 2.5)]
+		items_data = [{"item": ITEM, "quantity": 130}, {"item": TALL_ITEM, "quantity": 45}]
+		result = PackingController().suggest_cartons(items_data, cartons, enable_3d=True, verify_layouts=True)
+
+		self.assertEqual(result["layout_violations"], [])
+		self.assertEqual(sum(a["total_items"] for a in result["carton_assignments"]), 175)
+		for assignment in result["carton_assignments"]:
+			for p in assignment["positions_3d"].get("_Test Tall Item", []):
+				self.assertEqual(p["height"], 14)
+
+	def test_nested_packing_conserves_units(self):
+		items_data = [{"item": ITEM, "quantity": 100}]
+		result = PackingController().suggest_nested_cartons(items_data, NESTED_CARTONS)
+
+		self.assertEqual(result["unpacked_items"], [])
+		self.assertEqual(sum(a["total_items"] for a in result["carton_assignments"]), 100)
+
+		inner_cartons = 0
+		for assignment in result["carton_assignments"]:
+			inner = assignment["inner"]
+			self.assertEqual(inner["carton_id"], "_Test Inner")
+			self.assertEqual(assignment["items_per_carton"], assignment["inners_per_carton"] * inner["items_per_carton"])
+			self.assertLessEqual(assignment["total_items"], assignment["carton_count"] * assignment["items_per_carton"])
+			inner_cartons += assignment["inner_cartons"]
+
+		self.assertEqual(inner_cartons, result["levels"]["inner"]["total_cartons"])
+		self.assertEqual(result["total_cartons"], result["levels"]["master"]["total_cartons"])
+
+	def test_nested_layouts_pass_verification(self):
+		result = PackingController().suggest_nested_cartons([{"item": ITEM, "quantity": 100}], NESTED_CARTONS)
+		verifier = LayoutVerifier()
+
+		for assignment in result["carton_assignments"]:
+			inner = assignment["inner"]
+			inner_report = verifier.verify_assignment(
+				{"carton": inner["carton"], "positions_3d": inner["positions_3d"]}, {"_Test Item": 0.4}
+			)
+			self.assertTrue(inner_report["valid"], inner_report)
+			self.assertTrue(verifier.verify_assignment(assignment)["valid"])
+
+	def test_inner_cartons_keep_item_orientation(self):
+		result = PackingController().suggest_nested_cartons([{"item": TALL_ITEM, "quantity": 120}], NESTED_CARTONS)
+
+		self.assertTrue(result["carton_assignments"])
+		for assignment in result["carton_assignments"]:
+			inner_height = assignment["inner"]["carton"]["height"]
+			for positions in assignment["positions_3d"].values():
+				for p in positions:
+					self.assertEqual(p["height"], inner_height)
+
+	def test_level_cache_returns_copies(self):
+		controller = PackingController()
+		items_data = [{"item": ITEM, "quantity": 50}]
+		first = controller.suggest_nested_cartons(items_data, NESTED_CARTONS)
+		first["carton_assignments"][0]["inner"]["positions_3d"].clear()
+		first["carton_assignments"][0]["carton_count"] = -1
+
+		second = controller.suggest_nested_cartons(items_data, NESTED_CARTONS)
+		self.assertTrue(second["carton_assignments"][0]["inner"]["positions_3d"])
+		self.assertGreater(second["carton_assignments"][0]["carton_count"], 0)
+
+	def test_nested_needs_inner_cartons(self):
+		with self.assertRaises(ValueError):
+			PackingController().suggest_nested_cartons(
+				[{"item": ITEM, "quantity": 10}], [make_carton("_Test Carton", 30, 20, 20, 10, 1.0)]
+			)
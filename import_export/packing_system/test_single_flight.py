@@ -0,0 +1,64 @@
+# Copyright (c) 2026, gws and Contributors
+# See license.txt
+
+import frappe
+from frappe.tests.utils import FrappeTestCase
+
+from import_export.packing_system.single_flight import LOCK_PREFIX, PackingInProgressError, single_flight
+
+KEY = "Pick List:_Test Single Flight"
+
+
+class TestSingleFlight(FrappeTestCase):
+	def setUp(self):
+		self.cache = frappe.cache()
+		self.lock_key = self.cache.make_key(LOCK_PREFIX + KEY)
+		self.clear()
+
+	def tearDown(self):
+		self.clear()
+
+	def clear(self):
+		self.cache.delete(self.lock_key)
+		for fingerprint in ("fp-1", "fp-2"):
+			self.cache.delete_value(f"{LOCK_PREFIX}{KEY}:{fingerprint}")
+
+	def test_leader_computes_and_releases_lock(self):
+		calls = []
+		result = single_flight(KEY, "fp-1", lambda: calls.append(1) or {"total_cartons": 3})
+
+		self.assertEqual(result, {"total_cartons": 3})
+		self.assertEqual(calls, [1])
+		self.assertIsNone(self.cache.get(self.lock_key))
+		self.assertEqual(self.cache.get_value(f"{LOCK_PREFIX}{KEY}:fp-1"), {"total_cartons": 3})
+
+	def test_lock_released_when_compute_fails(self):
+		def compute():
+			raise ValueError("No cartons available for packing")
+
+		with self.assertRaises(ValueError):
+			single_flight(KEY, "fp-1", compute)
+		self.assertIsNone(self.cache.get(self.lock_key))
+
+	def test_same_inputs_share_running_result(self):
+		# Another worker holds the lock and has published its result
+		self.cache.set(self.lock_key, "fp-1:othertoken", ex=60)
+		self.cache.set_value(f"{LOCK_PREFIX}{KEY}:fp-1", {"total_cartons": 5}, expires_in_sec=60)
+
+		calls = []
+		result = single_flight(KEY, "fp-1", lambda: calls.append(1) or {"total_cartons": 0}, wait_timeout=1)
+
+		self.assertEqual(result, {"total_cartons": 5})
+		self.assertEqual(calls, [])
+
+	def test_different_inputs_are_rejected(self):
+		self.cache.set(self.lock_key, "fp-2:othertoken", ex=60)
+
+		with self.assertRaises(PackingInProgressError):
+			single_flight(KEY, "fp-1", lambda: {}, wait_timeout=1)
+
+	def test_waiting_times_out(self):
+		self.cache.set(self.lock_key, "fp-1:othertoken", ex=60)
+
+		with self.assertRaises(PackingInProgressError):
+			single_flight(KEY, "fp-1", lambda: {}, wait_timeout=0.5)
@@ -1,8 +1,127 @@
+import hashlib
+
 import frappe
-from frappe.utils import flt
+from frappe import _
+from frappe.model.naming import set_new_name
+from frappe.utils import flt, now
+from frappe.utils.response import build_response
+from werkzeug.wrappers import Response
+
+CATALOG_VERSION_KEY = "import_export:packing_catalog_version"
 
 def calc_vol(doc, method=""):
     doc.volume_per_unit = flt(doc.length) * flt(doc.width) * flt(doc.height)
 
     if doc.volume_per_unit and not doc.dimension_uom:
         doc.dimension_uom = frappe.db.get_single_value("Packing Settings", "default_dimension_uom")
+
+
+def replace_child_rows(doc, parentfield, rows):
+    """
+    Replace a child table of a saved document with one DELETE and one multi-row INSERT
+
+    Checks write permission on the parent and validates rows the way save() would
+    (mandatory fields, lengths, select options, links), but does not run the parent's
+    controller or record a Version. Runs in the caller's transaction.
+    """
+    doc.check_permission("write")
+
+    df = doc.meta.get_field(parentfield)
+    if doc.docstatus == 2 or (doc.docstatus == 1 and not df.allow_on_submit):
+        frappe.throw(_("Cannot update {0} of {1} {2} after submission").format(
+            _(df.label), _(doc.doctype), doc.name
+        ))
+
+    doc.set(parentfield, [])
+    for row in rows:
+        doc.append(parentfield, row)
+    children = doc.get(parentfield)
+
+    timestamp = now()
+    for child in children:
+        set_new_name(child)
+        child.owner = child.modified_by = frappe.session.user
+        child.creation = child.modified = timestamp
+        child.docstatus = doc.docstatus
+        child._fix_numeric_types()
+
+        missing = child._get_missing_mandatory_fields()
+        if missing:
+            frappe.throw(missing[0][1], frappe.MandatoryError)
+        child._validate_length()
+        child._validate_selects()
+
+    validate_child_links(children)
+
+    frappe.db.delete(df.options, {"parenttype": doc.doctype, "parent": doc.name, "parentfield": parentfield})
+
+    if children:
+        values = [child.get_valid_dict(convert_dates_to_str=True) for child in children]
+        fields = list(values[0])
+        frappe.db.bulk_insert(df.options, fields, [[value.get(f) for f in fields] for value in values])
+
+    return children
+
+
+def validate_child_links(children):
+    """Link check with one query per linked doctype instead of one per row"""
+    if not children:
+        return
+
+    for df in children[0].meta.get_link_fields():
+        names = {child.get(df.fieldname) for child in children if child.get(df.fieldname)}
+        if not names:
+            continue
+
+        existing = set(frappe.get_all(df.options, filters={"name": ["in", list(names)]}, pluck="name"))
+        missing = names - existing
+        if missing:
+            frappe.throw(
+                _("Could not find {0}: {1}").format(_(df.label), ", ".join(sorted(missing))),
+                frappe.LinkValidationError
+            )
+
+
+def conditional_response(compute, *version):
+    """
+    Whitelisted GET responses with an ETag built from `version` (document modified etc.)
+    A request whose If-None-Match still matches gets 304 Not Modified without running
+    `compute`, so the browser reuses its cached body. Called outside a request, the
+    data is returned as is.
+    """
+    request = getattr(frappe.local, "request", None)
+    if not request or request.method != "GET":
+        return compute()
+
+    etag = hashlib.md5("|".join(str(part) for part in version).encode()).hexdigest()
+    headers = {"ETag": f'"{etag}"', "Cache-Control": "private, no-cache"}
+
+    client_tags = {tag.strip().removeprefix("W/").strip('"') for tag in request.headers.get("If-None-Match", "").split(",")}
+    if etag in client_tags:
+        return Response(status=304, headers=headers)
+
+    frappe.local.response["message"] = compute()
+    response = build_response("json")
+    response.headers.update(headers)
+    return response
+
+
+def get_catalog_version():
+    """
+    Version of the Carton catalog, for ETags of responses that include carton details
+    Combines the counter bumped by Carton on_update / on_trash with the row count and
+    last modified, so deletions change it even if the cache was flushed
+    """
+    count, modified = frappe.db.sql("select count(*), max(modified) from `tabCarton`")[0]
+    cache = frappe.cache()
+    return f"{count}:{modified}:{_decode(cache.get(cache.make_key(CATALOG_VERSION_KEY))) or 0}"
+
+
+def bump_catalog_version():
+    """Called after the commit of a Carton change, so readers of the new version see committed data"""
+    cache = frappe.cache()
+    cache.incr(cache.make_key(CATALOG_VERSION_KEY))
+
+
+def _decode(value):
+    return value.decode() if isinstance(value, bytes) else value
@@ -0,0 +1,6 @@
+from import_export.import_export.shipment_status import rebuild_shipment_status
+
+
+def execute():
+	"""Fill Export Shipment Status for the existing Commercial Invoices"""
+	rebuild_shipment_status()
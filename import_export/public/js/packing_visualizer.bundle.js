@@ -0,0 +1,101 @@
+// Loaded on demand with frappe.require("packing_visualizer.bundle.js"), never on desk startup
+import * as THREE_MODULE from 'three';
+import { OrbitControls } from 'three/examples/jsm/controls/OrbitControls.js';
+
+// Namespace in the shape of the old global build (THREE.OrbitControls) for the packing-visualize page
+const THREE = Object.assign({ OrbitControls }, THREE_MODULE);
+
+class PackingVisualizer3D {
+    constructor() {
+        this.scene = null;
+        this.camera = null;
+        this.renderer = null;
+        this.controls = null;
+    }
+
+    init(packingData) {
+        let dialog = new frappe.ui.Dialog({
+            title: '🎯 3D Packing',
+            fields: [{
+                fieldtype: 'HTML',
+                fieldname: 'container',
+                options: '<div id="threejs-viz" style="height: 600px; width: 100%;"></div>'
+            }],
+            size: 'extra-large'
+        });
+
+        dialog.show();
+        dialog.set_primary_action('Reset View', () => this.resetCamera());
+
+        // Wait for DOM to be ready
+        dialog.$wrapper.on('shown.bs.modal', () => {
+            const container = document.getElementById('threejs-viz');
+
+            // Setup Three.js AFTER dialog is rendered
+            this.scene = new THREE.Scene();
+            this.scene.background = new THREE.Color(0xf0f0f0);
+
+            this.camera = new THREE.PerspectiveCamera(45, container.clientWidth / container.clientHeight, 1, 10000);
+            this.camera.position.set(500, 400, 500);
+
+            this.renderer = new THREE.WebGLRenderer({ antialias: true });
+            this.renderer.setSize(container.clientWidth, container.clientHeight);
+            container.appendChild(this.renderer.domElement);
+
+            this.controls = new OrbitControls(this.camera, this.renderer.domElement);
+            this.controls.enableDamping = true;
+
+            this.scene.add(new THREE.AmbientLight(0xffffff, 0.6));
+            const light = new THREE.DirectionalLight(0xffffff, 0.8);
+            light.position.set(200, 500, 300);
+            this.scene.add(light);
+
+            this.renderPackingData(packingData, THREE);
+            this.animate();
+        });
+    }
+
+    renderPackingData(packingData, THREE) {
+        Object.entries(packingData).forEach(([cartonName, cartonData], index) => {
+            const dims = cartonData.carton_dimensions;
+            const offsetX = index * 600;
+            
+            // Carton box
+            const cartonGeometry = new THREE.BoxGeometry(dims.length, dims.height, dims.width);
+            const edges = new THREE.EdgesGeometry(cartonGeometry);
+            const lines = new THREE.LineSegments(edges, new THREE.LineBasicMaterial({ color: 0x000000 }));
+            lines.position.set(offsetX + dims.length/2, dims.height/2, dims.width/2);
+            this.scene.add(lines);
+            
+            // Items
+            cartonData.items.forEach(item => {
+                const itemGeom = new THREE.BoxGeometry(item.dimensions[0], item.dimensions[2], item.dimensions[1]);
+                const itemMat = new THREE.MeshPhongMaterial({ color: item.color, transparent: true, opacity: 0.85 });
+                const itemMesh = new THREE.Mesh(itemGeom, itemMat);
+                itemMesh.position.set(
+                    offsetX + item.position[0] + item.dimensions[0]/2,
+                    item.position[2] + item.dimensions[2]/2,
+                    item.position[1] + item.dimensions[1]/2
+                );
+                this.scene.add(itemMesh);
+            });
+        });
+    }
+
+    animate() {
+        requestAnimationFrame(() => this.animate());
+        this.controls.update();
+        this.renderer.render(this.scene, this.camera);
+    }
+
+    resetCamera() {
+        this.camera.position.set(500, 400, 500);
+        this.controls.target.set(0, 0, 0);
+    }
+}
+
+frappe.provide("import_export.utils");
+frappe.provide("import_export.visualizer");
+window.import_export.utils.visualizer = PackingVisualizer3D;
+window.import_export.visualizer.THREE = THREE;
+window.import_export.visualizer.PackingVisualizer3D = PackingVisualizer3D;